@@ -0,0 +1,58 @@
+"""
+Measures the cost of filtering every play of a season with Gen.filter,
+compared with the filter it replaced, which parsed the filter criteria
+again for every play.
+"""
+import argparse
+import functools
+import time
+
+import nflgame
+import nflgame.seq
+
+
+def interpreted_filter(seq, **kwargs):
+    """The filter that Gen.filter used to be."""
+    preds = []
+    for k, v in kwargs.items():
+        def pred(field, value, item):
+            for suffix, p in nflgame.seq._BUILTIN_PREDS.items():
+                if field.endswith(suffix):
+                    f = field[:field.index(suffix)]
+                    if not hasattr(item, f) or getattr(item, f) is None:
+                        return False
+                    return p(getattr(item, f), value)
+            if not hasattr(item, field) or getattr(item, field) is None:
+                return False
+            if isinstance(value, type(lambda x: x)):
+                return value(getattr(item, field))
+            return getattr(item, field) == value
+        preds.append(functools.partial(pred, k, v))
+    return seq.__class__(filter(lambda item: all([f(item) for f in preds]),
+                                seq))
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares the cost of filtering a season of plays.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to load.')
+    aa('-n', type=int, default=5, help='The number of times to filter.')
+    args = parser.parse_args()
+
+    plays = list(nflgame.combine_plays(nflgame.games(args.year)))
+    criteria = dict(team='NE', down__in=(3, 4), passing_yds__ge=10)
+    print('%d plays' % len(plays))
+    for name, f in (('interpreted', interpreted_filter),
+                    ('compiled', nflgame.seq.GenPlays.filter)):
+        start = time.time()
+        for _ in range(args.n):
+            found = len(list(f(nflgame.seq.GenPlays(plays), **criteria)))
+        secs = (time.time() - start) / args.n
+        print('%-12s %7.2f ms per filter (%d plays found)'
+              % (name, secs * 1000, found))
+
+
+if __name__ == '__main__':
+    run()
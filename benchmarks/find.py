@@ -0,0 +1,97 @@
+"""
+Compares nflgame.find with a scan of every player (the old nflgame.find)
+and with the name index in nflgame.names, and measures the abbreviation
+and prefix searches that only the index supports. Approximate searches
+are compared with computing the edit distance to every player's name. Building the index is
+timed separately, since it happens once.
+"""
+import argparse
+import time
+
+import nflgame
+import nflgame.names
+
+
+def old(name, team=None):
+    hits = []
+    for player in nflgame.players.values():
+        if player.name.lower() == name.lower():
+            if team is None or team.lower() == player.team.lower():
+                hits.append(player)
+    return hits
+
+
+def scan(name, max_edits):
+    """Compares name with every player's, as an index-free fuzzy search."""
+    name = nflgame.names.normalize(name)
+    found = []
+    for i, (playerid, p) in enumerate(nflgame.players.items()):
+        d = nflgame.names._edits(name, nflgame.names.normalize(p.name),
+                                 max_edits)
+        if d <= max_edits:
+            found.append((d, i, p))
+    return [p for _, _, p in sorted(found, key=lambda f: f[:2])]
+
+
+def new(name, team=None, **kwargs):
+    return nflgame.find(name, team, **kwargs)
+
+QUERIES = [
+    ('exact', ('Tom Brady',), {}),
+    ('exact team', ('Adrian Peterson', 'MIN'), {}),
+    ('missing', ('Nobody At All',), {}),
+]
+
+INDEX_ONLY = [
+    ('abbreviation', ('T.Brady',), {}),
+    ('prefix', ('tom br',), {'prefix': True}),
+]
+
+FUZZY = [
+    ('fuzzy k=1', 'Tom Bradey', 1),
+    ('fuzzy k=2', 'Tom Bardy', 2),
+]
+
+
+def _time(f, repeat, *args, **kwargs):
+    start = time.time()
+    for _ in range(repeat):
+        f(*args, **kwargs)
+    return (time.time() - start) / repeat
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares a linear scan of the players with the name '
+                    'index.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--repeat', type=int, default=50,
+       help='The number of times to run each search.')
+    args = parser.parse_args()
+
+    players = nflgame.players
+    start = time.time()
+    nflgame.names.NameIndex(players)
+    print('build index %8.1f ms (%d players)'
+          % ((time.time() - start) * 1000, len(players)))
+    nflgame.names.index()
+
+    for name, qargs, kwargs in QUERIES:
+        assert old(*qargs) == new(*qargs)
+        for f in (old, new):
+            elapsed = _time(f, args.repeat, *qargs)
+            print('%-12s %-4s %8.1f us' % (name, f.__name__, elapsed * 1e6))
+    for name, qargs, kwargs in INDEX_ONLY:
+        elapsed = _time(new, args.repeat, *qargs, **kwargs)
+        print('%-12s %-4s %8.1f us' % (name, 'new', elapsed * 1e6))
+    for name, q, k in FUZZY:
+        assert scan(q, k) == new(q, max_edits=k)
+        elapsed = _time(scan, args.repeat, q, k)
+        print('%-12s %-4s %8.1f us' % (name, 'scan', elapsed * 1e6))
+        elapsed = _time(new, args.repeat, q, max_edits=k)
+        print('%-12s %-4s %8.1f us' % (name, 'new', elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    run()
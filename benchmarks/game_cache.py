@@ -0,0 +1,56 @@
+"""
+Measures how long it takes to load a season of games without the cache of
+parsed games (see nflgame.cache), while filling an empty cache and from a
+cache that already holds every game.
+
+Every game's drives, plays and player statistics are parsed, so the numbers
+reflect a season that is ready to be queried.
+"""
+import argparse
+import shutil
+import tempfile
+import time
+
+import nflgame
+import nflgame.cache
+
+
+def measure(year, kind):
+    start = time.time()
+    games = nflgame.games(year, kind=kind)
+    for g in games:
+        g.drives
+        g.players
+    return len(games), time.time() - start
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares loading a season of games with and without '
+                    'the cache of parsed games.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to load.')
+    aa('--kind', type=str, default='REG', choices=['PRE', 'REG', 'POST'],
+       help='The part of the season to load.')
+    args = parser.parse_args()
+
+    # Load the schedule and players up front, so they aren't timed.
+    nflgame.sched.games, nflgame.players
+
+    dirpath = tempfile.mkdtemp()
+    try:
+        for name in ('no cache', 'cold', 'warm'):
+            if name == 'no cache':
+                nflgame.cache.disable()
+            else:
+                nflgame.cache.enable(dirpath)
+            n, elapsed = measure(args.year, args.kind)
+            print('%-8s %3d games: %5.2fs' % (name, n, elapsed))
+    finally:
+        nflgame.cache.disable()
+        shutil.rmtree(dirpath)
+
+
+if __name__ == '__main__':
+    run()
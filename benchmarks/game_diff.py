@@ -0,0 +1,93 @@
+"""
+Measures the cost of diffing two snapshots of a game late in the fourth
+quarter, which is what the live module does for every game on every poll.
+
+The "before" snapshot is the final game without its last few plays. The
+diff in nflgame.game is compared with the quadratic one it replaced.
+"""
+import argparse
+import gzip
+import json
+import time
+from collections import OrderedDict
+
+import nflgame
+import nflgame.game
+import nflgame.seq
+
+
+def quadratic_diff(before, after):
+    """The diff that nflgame.game.diff used to be."""
+    plays = []
+    after_plays = list(after.drives.plays())
+    before_plays = list(before.drives.plays())
+    for play in after_plays:
+        if play not in before_plays:
+            plays.append(play)
+
+    _players = OrderedDict()
+    after_players = list(after.max_player_stats())
+    before_players = list(before.max_player_stats())
+    for aplayer in after_players:
+        has_before = False
+        for bplayer in before_players:
+            if aplayer.playerid == bplayer.playerid:
+                has_before = True
+                pdiff = aplayer - bplayer
+                if pdiff is not None:
+                    _players[aplayer.playerid] = pdiff
+        if not has_before:
+            _players[aplayer.playerid] = aplayer
+    players = nflgame.seq.GenPlayerStats(_players)
+    return nflgame.game.GameDiff(before=before, after=after, plays=plays,
+                                 players=players)
+
+
+def snapshots(eid, cut):
+    """
+    Returns two games for eid: one without its last cut plays, and the
+    final game.
+    """
+    full = gzip.open(nflgame.game._jsonf % eid).read()
+    data = json.loads(full)
+    drives = data[eid]['drives']
+    for _ in range(cut):
+        nums = sorted(int(k) for k in drives if k != 'crntdrv')
+        plays = drives[str(nums[-1])]['plays']
+        del plays[max(plays, key=int)]
+        if not plays:
+            del drives[str(nums[-1])]
+    data[eid]['qtr'] = '4'
+    before = json.dumps(data).encode('utf-8')
+    return (nflgame.game.Game(eid, fetched=(None, before, None)),
+            nflgame.game.Game(eid))
+
+
+def measure(f, before, after, n):
+    start = time.time()
+    for _ in range(n):
+        d = f(before, after)
+    return (time.time() - start) / n, d
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares the cost of diffing a late fourth quarter game.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--eid', type=str, default='2013090500', help='The game to diff.')
+    aa('--cut', type=int, default=3,
+       help='The number of plays that are new since the last snapshot.')
+    aa('-n', type=int, default=50, help='The number of diffs to time.')
+    args = parser.parse_args()
+
+    before, after = snapshots(args.eid, args.cut)
+    for name, f in (('quadratic', quadratic_diff),
+                    ('current', nflgame.game.diff)):
+        secs, d = measure(f, before, after, args.n)
+        print('%-10s %7.2f ms per diff (%d plays, %d players)'
+              % (name, secs * 1000, len(d.plays), len(list(d.players))))
+
+
+if __name__ == '__main__':
+    run()
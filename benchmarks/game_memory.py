@@ -0,0 +1,51 @@
+"""
+Measures how much memory a full season of games takes when loaded normally
+and when loaded in lean mode (see nflgame.game.Game).
+
+Every game's drives, plays and player statistics are parsed, so the numbers
+reflect a season that is ready to be queried.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import nflgame
+
+
+def measure(year, kind, lean):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    games = nflgame.games(year, kind=kind, lean=lean)
+    for g in games:
+        g.drives.plays()
+        g.players
+    elapsed = time.time() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(games), current, peak, elapsed
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares the memory used by a season of games in normal '
+                    'and lean mode.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to load.')
+    aa('--kind', type=str, default='REG', choices=['PRE', 'REG', 'POST'],
+       help='The part of the season to load.')
+    args = parser.parse_args()
+
+    mb = 1024.0 * 1024.0
+    for lean in (False, True):
+        n, current, peak, elapsed = measure(args.year, args.kind, lean)
+        print('%-6s %3d games: %7.1f MB retained, %7.1f MB peak, %5.1fs'
+              % ('lean' if lean else 'normal', n, current / mb, peak / mb,
+                 elapsed))
+
+
+if __name__ == '__main__':
+    run()
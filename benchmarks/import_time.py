@@ -0,0 +1,55 @@
+"""
+Measures how long `import nflgame` takes in a fresh interpreter, and how
+long it takes to then load nflgame.players and nflgame.sched.games, which
+are loaded the first time they are used rather than on import.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+_SCRIPT = '''
+import time
+start = time.perf_counter()
+import nflgame
+imported = time.perf_counter()
+nflgame.players
+players = time.perf_counter()
+nflgame.sched.games
+sched = time.perf_counter()
+print(imported - start, players - imported, sched - players)
+'''
+
+
+def measure():
+    """
+    Returns the time of the import, of loading the players and of loading
+    the schedule in a new Python process.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    out = subprocess.check_output([sys.executable, '-W', 'ignore', '-c',
+                                   _SCRIPT], env=env)
+    return tuple(map(float, out.split()))
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Measures the time it takes to import nflgame and to '
+                    'load its players and schedule.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--repeat', type=int, default=5,
+       help='The number of fresh processes to time. The best is kept.')
+    args = parser.parse_args()
+
+    best = [min(ts) for ts in zip(*[measure() for _ in range(args.repeat)])]
+    print('import nflgame:       %6.1f ms' % (best[0] * 1000))
+    print('nflgame.players:      %6.1f ms' % (best[1] * 1000))
+    print('nflgame.sched.games:  %6.1f ms' % (best[2] * 1000))
+
+
+if __name__ == '__main__':
+    run()
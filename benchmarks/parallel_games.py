@@ -0,0 +1,84 @@
+"""
+Measures how long it takes to load a season of games in this process and
+in a pool of worker processes (the workers parameter of nflgame.games).
+
+Every game's drives, plays and player statistics are parsed, so the numbers
+reflect a season that is ready to be queried.
+
+The parent process still has to turn what each worker sends back into a
+game, which bounds the speedup however many workers there are. That part
+is also measured on its own, for the compact form that workers send and
+for a pickled game.
+"""
+import argparse
+import marshal
+import os
+import pickle
+import time
+
+import nflgame
+import nflgame.game
+
+
+def measure(year, kind, workers):
+    start = time.time()
+    games = nflgame.games(year, kind=kind, workers=workers)
+    for g in games:
+        g.drives
+        g.players
+    return len(games), time.time() - start
+
+
+def measure_parent(year, kind):
+    """
+    Returns the time it takes to rebuild every game from its compact form
+    and to unpickle every game, as the parent process would.
+    """
+    eids = [info['eid'] for info in
+            nflgame._search_schedule(year, None, None, None, kind, False)]
+    blobs = [nflgame._load_game(eid) for eid in eids]
+    blobs = [b for b in blobs if isinstance(b, bytes)]
+    start = time.time()
+    for b in blobs:
+        nflgame.game.Game._from_compact(marshal.loads(b))
+    compact = time.time() - start
+
+    pickles = []
+    for b in blobs:
+        g = nflgame.game.Game._from_compact(marshal.loads(b))
+        g.lean = True
+        pickles.append(pickle.dumps(g, pickle.HIGHEST_PROTOCOL))
+    start = time.time()
+    for p in pickles:
+        pickle.loads(p)
+    return compact, time.time() - start
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares loading a season of games in one process and '
+                    'in a pool of processes.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to load.')
+    aa('--kind', type=str, default='REG', choices=['PRE', 'REG', 'POST'],
+       help='The part of the season to load.')
+    aa('--workers', type=int, default=max(2, os.cpu_count() or 1),
+       help='The number of worker processes.')
+    args = parser.parse_args()
+
+    # Load the schedule and players up front, so they aren't timed.
+    nflgame.sched.games, nflgame.players
+
+    n, elapsed = measure(args.year, args.kind, None)
+    print('sequential      %3d games: %5.2fs' % (n, elapsed))
+    n, elapsed = measure(args.year, args.kind, args.workers)
+    print('%2d workers      %3d games: %5.2fs' % (args.workers, n, elapsed))
+
+    compact, pickled = measure_parent(args.year, args.kind)
+    print('parent, compact %3d games: %5.2fs' % (n, compact))
+    print('parent, pickled %3d games: %5.2fs' % (n, pickled))
+
+
+if __name__ == '__main__':
+    run()
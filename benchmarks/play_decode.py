@@ -0,0 +1,52 @@
+"""
+Measures how long it takes to decode the plays of a season of games, and
+how much memory the decoded plays (with their player statistics) take.
+
+The JSON data of every game is decoded up front, so only the work of
+building the drives and plays of each game is measured.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import nflgame
+
+
+def measure(year, kind):
+    games = nflgame.games(year, kind=kind)
+    datas = [g.data['drives'] for g in games]  # Decode the JSON up front.
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    nplays = 0
+    for g in games:
+        nplays += len(list(g.drives.plays()))
+    elapsed = time.time() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del datas
+    return len(games), nplays, current, elapsed
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Measures the time and memory it takes to decode the '
+                    'plays of a season of games.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to load.')
+    aa('--kind', type=str, default='REG', choices=['PRE', 'REG', 'POST'],
+       help='The part of the season to load.')
+    args = parser.parse_args()
+
+    ngames, nplays, current, elapsed = measure(args.year, args.kind)
+    print('%d games, %d plays: %.1f MB retained (%d bytes per play), '
+          '%.2fs (%.1f us per play)'
+          % (ngames, nplays, current / 1024.0 / 1024.0, current // nplays,
+             elapsed, elapsed * 1e6 / nplays))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,74 @@
+"""
+Compares loading nflgame.players from `players.json` with opening the
+binary player table (see nflgame.playertable), in both time and memory.
+Looking up the players of a week of games is included, since that's when
+the table builds Player objects.
+"""
+import argparse
+import os.path as path
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import nflgame
+import nflgame.player
+import nflgame.playertable
+
+
+def _load(jsonf, ids):
+    players = nflgame.player._create_players(jsonf)
+    for playerid in ids:
+        players.get(playerid)
+    return players
+
+
+def measure(jsonf, ids):
+    """
+    Returns the type of mapping the players are loaded into, the time it
+    takes to load them and then look up ids, and the memory that uses.
+    Memory is measured separately, since tracing it slows everything down.
+    """
+    start = time.time()
+    players = nflgame.player._create_players(jsonf)
+    loaded = time.time()
+    for playerid in ids:
+        players.get(playerid)
+    elapsed = time.time() - loaded
+
+    tracemalloc.start()
+    players = _load(jsonf, ids)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return type(players).__name__, loaded - start, elapsed, current
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares loading the players from JSON and from the '
+                    'binary player table.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.parse_args()
+
+    ids = set()
+    for g in nflgame.games(2013, week=1):
+        ids.update(p.playerid for p in g.players)
+
+    tmp = tempfile.mkdtemp()
+    try:
+        jsonf = path.join(tmp, 'players.json')
+        shutil.copy(nflgame.player._player_json_file, jsonf)
+        results = [measure(jsonf, ids)]
+        nflgame.playertable.write(jsonf)
+        results.append(measure(jsonf, ids))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    for kind, load, lookups, mem in results:
+        print('%-11s load %7.1f ms, %d lookups %6.1f ms, %6.1f MB'
+              % (kind, load * 1000, len(ids), lookups * 1000,
+                 mem / 1024.0 / 1024.0))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,81 @@
+"""
+Compares searching the schedule with a scan of every game (the old
+nflgame._search_schedule) and with the schedule index in nflgame.sched,
+for the kinds of searches that nflgame.games and nflgame.live.run make.
+"""
+import argparse
+import time
+
+import nflgame
+import nflgame.live
+import nflgame.sched
+
+
+def old(year, week=None, home=None, away=None, kind='REG', started=False):
+    infos = []
+    for info in nflgame.sched.games.values():
+        y, t, w = info['year'], info['season_type'], info['week']
+        h, a = info['home'], info['away']
+        if year is not None:
+            if isinstance(year, list) and y not in year:
+                continue
+            if not isinstance(year, list) and y != year:
+                continue
+        if week is not None:
+            if isinstance(week, list) and w not in week:
+                continue
+            if not isinstance(week, list) and w != week:
+                continue
+        if home is not None and away is not None and home == away:
+            if h != home and a != home:
+                continue
+        else:
+            if home is not None and h != home:
+                continue
+            if away is not None and a != away:
+                continue
+        if t != kind:
+            continue
+        if started:
+            gametime = nflgame.live._game_datetime(info)
+            now = nflgame.live._now()
+            if gametime > now and (gametime - now).total_seconds() > 300:
+                continue
+        infos.append(info)
+    return infos
+
+
+def new(*args, **kwargs):
+    return nflgame._search_schedule(*args, **kwargs)
+
+QUERIES = [
+    ('year and week', (2013, 1), {}),
+    ('whole season', (2013,), {}),
+    ('team', (2013,), {'home': 'NE', 'away': 'NE'}),
+    ('started', (2013, 1), {'started': True}),
+]
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares a linear scan of the schedule with the '
+                    'schedule index.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--repeat', type=int, default=200,
+       help='The number of times to run each search.')
+    args = parser.parse_args()
+
+    nflgame.sched.games  # Load the schedule up front.
+    for name, qargs, kwargs in QUERIES:
+        assert old(*qargs, **kwargs) == new(*qargs, **kwargs)
+        for f in (old, new):
+            start = time.time()
+            for _ in range(args.repeat):
+                f(*qargs, **kwargs)
+            elapsed = (time.time() - start) / args.repeat
+            print('%-14s %-4s %8.1f us' % (name, f.__name__, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    run()
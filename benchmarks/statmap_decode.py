@@ -0,0 +1,86 @@
+"""
+Compares decoding every stat event of a season with nflgame.statmap.values,
+which builds a dict for each event that is then added to a stat vector,
+and with the compiled nflgame.statmap.decoders, which add each event to
+the vector directly.
+"""
+import argparse
+import time
+
+import nflgame
+import nflgame.player
+import nflgame.statmap
+
+
+def _events(year, kind):
+    """Returns a list of (player id, statId, yards) of every stat event."""
+    events = []
+    for g in nflgame.games(year, kind=kind):
+        for drive in g.data['drives'].values():
+            if not isinstance(drive, dict):
+                continue
+            for play in drive['plays'].values():
+                for pid, statcats in play['players'].items():
+                    for info in statcats:
+                        events.append((pid, info['statId'], info['yards']))
+    return events
+
+
+def old(events):
+    idmap = nflgame.statmap.idmap
+    vectors = {}
+    for pid, sid, yards in events:
+        if sid not in idmap:
+            continue
+        v = vectors.get(pid)
+        if v is None:
+            v = vectors[pid] = nflgame.player._StatVector()
+        v._add_stats(nflgame.statmap.values(sid, yards))
+    return vectors
+
+
+def new(events):
+    decoders = nflgame.statmap.decoders
+    decode = nflgame.statmap.decode
+    vectors = {}
+    for pid, sid, yards in events:
+        decoder = decoders.get(sid)
+        if decoder is None:
+            continue
+        v = vectors.get(pid)
+        if v is None:
+            v = vectors[pid] = nflgame.player._StatVector()
+        decode(decoder, yards, v._stats)
+    return vectors
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Compares decoding stat events with statmap.values and '
+                    'with the compiled statmap.decoders.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--year', type=int, default=2013, help='The season to decode.')
+    aa('--kind', type=str, default='REG', choices=['PRE', 'REG', 'POST'],
+       help='The part of the season to decode.')
+    aa('--repeat', type=int, default=3,
+       help='The number of times to time each and keep the best.')
+    args = parser.parse_args()
+
+    events = _events(args.year, args.kind)
+    results = {}
+    for f in (old, new):
+        best = None
+        for _ in range(args.repeat):
+            start = time.time()
+            results[f.__name__] = f(events)
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print('%-4s %d events: %.3fs' % (f.__name__, len(events), best))
+
+    a, b = results['old'], results['new']
+    assert all(a[pid]._stats == b[pid]._stats for pid in a)
+
+
+if __name__ == '__main__':
+    run()
@@ -6,10 +6,13 @@ import nflgame
 import os
 
 
-def find_stat_columns():
+def find_stat_columns(workers=None):
     """
     Find all statistic names for players in nflgame.
 
+    :param workers: number of processes to load games with. By default,
+        games are loaded in this process, while a background thread reads
+        them ahead of time.
     :return: list of set of statistic names
     """
 
@@ -19,14 +22,14 @@ def find_stat_columns():
 
     for season in seasons:
         for phase, num_weeks in phases:
-            for week in range(1, num_weeks + 1):
-                try:
-                    games = nflgame.games(year=season, week=week,
-                                          kind=phase)
-                except TypeError:
-                    continue
-
-                players = nflgame.combine_play_stats(games)
+            weeks = list(range(1, num_weeks + 1))
+            games = nflgame.games_gen(year=season, week=weeks, kind=phase,
+                                      workers=workers, prefetch=4)
+            if games is None:
+                continue
+
+            for game in games:
+                players = nflgame.combine_play_stats([game])
                 for player in players:
                     for stat in player._stats:
                         stat_columns.add(stat)
@@ -35,14 +38,17 @@ def find_stat_columns():
 
 
 class NFLdbBuilder:
-    def __init__(self, db_file_name=None, reset=False):
+    def __init__(self, db_file_name=None, reset=False, workers=None):
         """
         Build a SQLite3 database, for existing NFL data,
         in the file found at db_file_name.
 
         :param db_file_name: name of file to store database in
+        :param workers: number of processes to load games with. By default,
+            games are loaded in this process.
         """
         self._is_new_db = False
+        self._workers = workers
         if db_file_name is None:
             db_file_name = os.path.join(os.path.dirname(__file__), 'nfl.db')
 
@@ -134,50 +140,49 @@ class NFLdbBuilder:
         seasons = [i for i in range(2009, datetime.datetime.now().year)]
 
         # I acknowledge this is terribly ugly.
-        # This can potentially be multi-threaded, but I figured the speedup is
-        # kind of small due to the bottleneck of writing to the db.
+        # Games can be loaded and parsed by a pool of processes, but writing
+        # to the db stays in this one.
         for season in seasons:
             for phase, num_weeks in phases:
-                for week in range(1, num_weeks + 1):
-                    try:
-                        games = nflgame.games(year=season, week=week,
-                                              kind=phase)
-                    except TypeError:
-                        continue
-
-                    for game in games:
-                        if update is True:
-                            res = self.db.cursor.execute("SELECT * FROM "
-                                                         "Team_Game_Statistics "
-                                                         "WHERE eid = ?",
-                                                         (game.eid,)).fetchall()
-                            if len(res) == 2:
-                                continue
-                            elif len(res) == 1:
-                                self.db.cursor.execute("DELETE FROM "
-                                                       "Team_Game_Statistics "
-                                                       "WHERE eid = ?",
-                                                       (game.eid,))
-                                self.db.cursor.execute("DELETE FROM "
-                                                       "Player_Game_Statistics "
-                                                       "WHERE eid = ?",
-                                                       (game.eid,))
-
-                        players = nflgame.combine_play_stats([game])
-                        team_stats = {
-                            game.home: Counter({}),
-                            game.away: Counter({})
-                        }
-
-                        for p in players:
-                            if p.playerid not in nflgame.players:
-                                continue
-
-                            self.db.insert_player_game_statistics(p.playerid,
-                                                                  game.eid,
-                                                                  p._stats)
-                            team_stats[p.team] += Counter(p._stats)
-
-                        for team, stats in team_stats.items():
-                            self.db.insert_team_game_statistics(team, game.eid,
-                                                                stats)
\ No newline at end of file
+                weeks = list(range(1, num_weeks + 1))
+                games = nflgame.games_gen(year=season, week=weeks, kind=phase,
+                                          workers=self._workers, prefetch=4)
+                if games is None:
+                    continue
+
+                for game in games:
+                    if update is True:
+                        res = self.db.cursor.execute("SELECT * FROM "
+                                                     "Team_Game_Statistics "
+                                                     "WHERE eid = ?",
+                                                     (game.eid,)).fetchall()
+                        if len(res) == 2:
+                            continue
+                        elif len(res) == 1:
+                            self.db.cursor.execute("DELETE FROM "
+                                                   "Team_Game_Statistics "
+                                                   "WHERE eid = ?",
+                                                   (game.eid,))
+                            self.db.cursor.execute("DELETE FROM "
+                                                   "Player_Game_Statistics "
+                                                   "WHERE eid = ?",
+                                                   (game.eid,))
+
+                    players = nflgame.combine_play_stats([game])
+                    team_stats = {
+                        game.home: Counter({}),
+                        game.away: Counter({})
+                    }
+
+                    for p in players:
+                        if p.playerid not in nflgame.players:
+                            continue
+
+                        self.db.insert_player_game_statistics(p.playerid,
+                                                              game.eid,
+                                                              p._stats)
+                        team_stats[p.team] += Counter(p._stats)
+
+                    for team, stats in team_stats.items():
+                        self.db.insert_team_game_statistics(team, game.eid,
+                                                            stats)
\ No newline at end of file
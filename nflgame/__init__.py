@@ -81,9 +81,11 @@ We tend to respond fairly quickly!
 """
 
 import itertools
+import marshal
+import queue
+import threading
 
 import sys
-from functools import reduce
 
 if sys.version_info.major != 3:
     print("nflgame-redux requires Python 3 and not longer works with Python 2.7")
@@ -105,11 +107,25 @@ NoPlayers corresponds to the identity element of a Players sequences.
 Namely, adding it to any other Players sequence has no effect.
 """
 
-players = nflgame.player._create_players()
-"""
-A dict of all players and meta information about each player keyed
-by GSIS ID. (The identifiers used by NFL.com GameCenter.)
-"""
+_players_lock = threading.Lock()
+
+
+def __getattr__(name):
+    """
+    Loads nflgame.players the first time it is used, instead of every time
+    nflgame is imported.
+
+    players is a dict of all players and meta information about each
+    player keyed by GSIS ID. (The identifiers used by NFL.com GameCenter.)
+    When a player table is available (see nflgame.playertable), it is a
+    read-only mapping backed by the table instead.
+    """
+    if name == 'players':
+        with _players_lock:
+            if 'players' not in globals():
+                globals()['players'] = nflgame.player._create_players()
+        return globals()['players']
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 teams = [
     ['ARI', 'Arizona', 'Cardinals', 'Arizona Cardinals'],
@@ -154,20 +170,39 @@ The first item in each list is always the standard NFL.com
 team abbreviation (two or three letters).
 """
 
+_team_aliases = {}
+"""
+Every variant of a team name in nflgame.teams, lowercased, mapped to the
+team's standard abbreviation. The first team with a variant wins.
+"""
+for _variants in teams:
+    for _variant in _variants:
+        _team_aliases.setdefault(_variant.lower(), _variants[0])
+del _variants, _variant
 
-def find(name, team=None):
+
+def find(name, team=None, prefix=False, max_edits=0):
     """
     Finds a player (or players) with a name matching (case insensitive)
     name and returns them as a list.
 
+    If no player's full name matches, name is also matched against the
+    GSIS-style abbreviation of each player's name (e.g., "T.Brady").
+
+    If prefix is True, every player whose name starts with name is
+    returned instead. If max_edits is more than 0, every player whose name
+    is at most that many edits (insertions, deletions or substitutions)
+    away from name is returned, closest first.
+
     If team is not None, it is used as an additional search constraint.
+
+    Searches use an index of every player's name (see nflgame.names) that
+    is built the first time a player is searched for.
     """
-    hits = []
-    for player in players.values():
-        if player.name.lower() == name.lower():
-            if team is None or team.lower() == player.team.lower():
-                hits.append(player)
-    return hits
+    import nflgame.names
+
+    return [nflgame.players[playerid] for playerid in
+            nflgame.names.index().search(name, team, prefix, max_edits)]
 
 
 def standard_team(team):
@@ -176,15 +211,11 @@ def standard_team(team):
     nflgame.teams (case insensitive).  All known variants of a team name are
     searched. If no team is found, None is returned.
     """
-    team = team.lower().replace('.', '')
-    for variants in teams:
-        for variant in variants:
-            if team == variant.lower():
-                return variants[0]
-    return None
+    return _team_aliases.get(team.lower().replace('.', ''))
 
 
-def games(year, week=None, home=None, away=None, kind='REG', started=False):
+def games(year, week=None, home=None, away=None, kind='REG', started=False,
+          lean=False, workers=None, prefetch=None):
     """
     games returns a list of all games matching the given criteria. Each
     game can then be queried for player statistics and information about
@@ -220,12 +251,29 @@ def games(year, week=None, home=None, away=None, kind='REG', started=False):
     started parameter requires pytz to be installed. This is useful when
     you only want to collect stats from games that have JSON data available
     (as opposed to waiting for a 404 error from NFL.com).
+
+    If lean is True, games don't hold on to their JSON data once it is
+    cached to disk, which saves a lot of memory when many games are loaded
+    at once. See nflgame.game.Game for details.
+
+    If workers is greater than 1, games are loaded and parsed (including
+    their drives and player statistics) in a pool of that many processes.
+    They are still returned in schedule order. Games that are cached to
+    disk are handed back without their JSON data, which is read back from
+    disk if it is ever used.
+
+    Otherwise, if prefetch is a positive number, a background thread reads
+    and decompresses the data of up to that many games ahead of the one
+    being created, so that I/O overlaps with parsing and with whatever is
+    done with each game. It bounds the number of games held in memory.
     """
-    return list(games_gen(year, week, home, away, kind, started))
+    return list(games_gen(year, week, home, away, kind, started, lean,
+                          workers, prefetch))
 
 
 def games_gen(year, week=None, home=None, away=None,
-              kind='REG', started=False):
+              kind='REG', started=False, lean=False, workers=None,
+              prefetch=None):
     """
     games returns a generator of all games matching the given criteria. Each
     game can then be queried for player statistics and information about
@@ -261,21 +309,124 @@ def games_gen(year, week=None, home=None, away=None,
     started parameter requires pytz to be installed. This is useful when
     you only want to collect stats from games that have JSON data available
     (as opposed to waiting for a 404 error from NFL.com).
+
+    If lean is True, games don't hold on to their JSON data once it is
+    cached to disk, which saves a lot of memory when many games are loaded
+    at once. See nflgame.game.Game for details.
+
+    If workers is greater than 1, games are loaded and parsed (including
+    their drives and player statistics) in a pool of that many processes.
+    They are still returned in schedule order. Games that are cached to
+    disk are handed back without their JSON data, which is read back from
+    disk if it is ever used.
+
+    Otherwise, if prefetch is a positive number, a background thread reads
+    and decompresses the data of up to that many games ahead of the one
+    being created, so that I/O overlaps with parsing and with whatever is
+    done with each game. It bounds the number of games held in memory.
     """
     infos = _search_schedule(year, week, home, away, kind, started)
     if not infos:
         return None
+    if workers is not None and workers > 1:
+        eids = [info['eid'] for info in infos]
+        return _games_parallel(eids, lean, workers)
+    if prefetch is not None and prefetch > 0:
+        eids = [info['eid'] for info in infos]
+        return _games_prefetched(eids, lean, prefetch)
 
     def gen():
         for info in infos:
-            g = nflgame.game.Game(info['eid'])
+            g = nflgame.game.Game(info['eid'], lean=lean)
             if g is None:
                 continue
             yield g
     return gen()
 
 
-def one(year, week, home, away, kind='REG', started=False):
+def _games_parallel(eids, lean, workers):
+    """
+    Generates the games with identifiers in eids, in order, as they are
+    loaded by a pool of workers processes.
+    """
+    import multiprocessing
+    with multiprocessing.Pool(workers) as pool:
+        for g in pool.imap(_load_game, eids):
+            if g is None:
+                continue
+            if isinstance(g, bytes):
+                g = nflgame.game.Game._from_compact(marshal.loads(g))
+            g.lean = lean
+            yield g
+
+
+def _games_prefetched(eids, lean, depth):
+    """
+    Generates the games with identifiers in eids, in order, while a thread
+    reads the data of up to depth games ahead of time.
+    """
+    fetched = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def read():
+        for eid in eids:
+            if stop.is_set():
+                return
+            try:
+                put((eid, nflgame.game._fetch(eid)))
+            except Exception as e:
+                put((eid, e))
+                return
+        put(None)
+
+    reader = threading.Thread(target=read, name='nflgame-prefetch')
+    reader.daemon = True
+    reader.start()
+    try:
+        while True:
+            item = fetched.get()
+            if item is None:
+                break
+            eid, data = item
+            if isinstance(data, Exception):
+                raise data
+            g = nflgame.game.Game(eid, lean=lean, fetched=data)
+            if g is None:
+                continue
+            yield g
+    finally:
+        # The consumer may stop early, in which case the reader must not
+        # stay blocked on a full queue.
+        stop.set()
+
+
+def _load_game(eid):
+    """
+    Loads and fully parses the game with the given eid in a worker process.
+
+    A game that is cached to disk is sent back to the parent process in its
+    compact form (see nflgame.game.Game._compact), written with marshal,
+    which is much cheaper to turn back into a game than a pickled game.
+    Other games are pickled whole, along with their JSON data.
+    """
+    g = nflgame.game.Game(eid)
+    if g is None:
+        return None
+    if not nflgame.game._has_json(g.eid):
+        g.drives, g.players
+        return g
+    return marshal.dumps(g._compact())
+
+
+def one(year, week, home, away, kind='REG', started=False, lean=False):
     """
     one returns a single game matching the given criteria. The
     game can then be queried for player statistics and information about
@@ -311,12 +462,16 @@ def one(year, week, home, away, kind='REG', started=False):
     started parameter requires pytz to be installed. This is useful when
     you only want to collect stats from games that have JSON data available
     (as opposed to waiting for a 404 error from NFL.com).
+
+    If lean is True, games don't hold on to their JSON data once it is
+    cached to disk, which saves a lot of memory when many games are loaded
+    at once. See nflgame.game.Game for details.
     """
     infos = _search_schedule(year, week, home, away, kind, started)
     if not infos:
         return None
     assert len(infos) == 1, 'More than one game matches the given criteria.'
-    return nflgame.game.Game(infos[0]['eid'])
+    return nflgame.game.Game(infos[0]['eid'], lean=lean)
 
 
 def combine(games, plays=False):
@@ -349,9 +504,12 @@ def combine_game_stats(games):
     This can be used, for example, to get GamePlayerStats objects corresponding
     to statistics across an entire week, some number of weeks or an entire
     season.
+
+    games may be any iterable of games, including a generator like the one
+    returned by games_gen, in which case games are combined as they are
+    generated and don't all have to be in memory at once.
     """
-    return reduce(lambda ps1, ps2: ps1 + ps2,
-                  [g.players for g in games if g is not None])
+    return _combine(g.players for g in games if g is not None)
 
 
 def combine_play_stats(games):
@@ -368,12 +526,12 @@ def combine_play_stats(games):
     punt/FG blocks are needed.
 
     N.B. Since this combines *all* play data, this function may take a while
-    to complete depending on the number of games passed in.
+    to complete depending on the number of games passed in. Like with
+    combine_game_stats, games may be a generator.
     """
     if not games:
         return []
-    return reduce(lambda p1, p2: p1 + p2,
-                  [g.drives.players() for g in games if g is not None])
+    return _combine(g.drives.players() for g in games if g is not None)
 
 
 def combine_max_stats(games):
@@ -386,10 +544,20 @@ def combine_max_stats(games):
     season.
 
     This function should be used in lieu of combine_game_stats or
-    combine_play_stats when the best possible accuracy is desired.
+    combine_play_stats when the best possible accuracy is desired. Like with
+    combine_game_stats, games may be a generator.
     """
-    return reduce(lambda a, b: a + b,
-                  [g.max_player_stats() for g in games if g is not None])
+    return _combine(g.max_player_stats() for g in games if g is not None)
+
+
+def _combine(seqs):
+    """
+    Combines the sequences of player statistics in seqs into one.
+    """
+    acc = nflgame.seq.PlayerStatsAccumulator()
+    for players in seqs:
+        acc.add(players)
+    return acc.players()
 
 
 def combine_plays(games):
@@ -430,34 +598,15 @@ def _search_schedule(year, week=None, home=None, away=None, kind='REG',
     you only want to collect stats from games that have JSON data available
     (as opposed to waiting for a 404 error from NFL.com).
     """
-    infos = []
-    for info in nflgame.sched.games.values():
-        y, t, w = info['year'], info['season_type'], info['week']
-        h, a = info['home'], info['away']
-        if year is not None:
-            if isinstance(year, list) and y not in year:
-                continue
-            if not isinstance(year, list) and y != year:
-                continue
-        if week is not None:
-            if isinstance(week, list) and w not in week:
-                continue
-            if not isinstance(week, list) and w != week:
-                continue
-        if home is not None and away is not None and home == away:
-            if h != home and a != home:
-                continue
-        else:
-            if home is not None and h != home:
-                continue
-            if away is not None and a != away:
-                continue
-        if t != kind:
-            continue
-        if started:
-            gametime = nflgame.live._game_datetime(info)
-            now = nflgame.live._now()
+    idx = nflgame.sched._get_index()
+    found = idx.search(year, week, home, away, kind)
+    if started:
+        now = nflgame.live._now()
+        soon = []
+        for i in found:
+            gametime = idx.start_time(i)
             if gametime > now and (gametime - now).total_seconds() > 300:
                 continue
-        infos.append(info)
-    return infos
+            soon.append(i)
+        found = soon
+    return [idx.infos[i] for i in found]
@@ -0,0 +1,217 @@
+"""
+The archive module packs the GameCenter JSON data of many games into a
+single indexed file. Looking up a game in an archive doesn't touch the file
+system at all: the archive is memory-mapped once, and each game is found
+through an index of eid to (offset, length, codec) that is read when the
+archive is opened.
+
+nflgame.game.Game reads from the archive at `nflgame.archive.default_path`
+whenever it exists, before falling back to the loose files in
+`gamecenter-json`. Loose files can be imported into an archive
+incrementally, so only games that aren't already in the archive are added:
+
+    #!python
+    import nflgame.archive
+
+    nflgame.archive.import_loose()
+
+Or from the command line with `nflgame-archive`.
+
+The layout of an archive is a fixed size header, followed by the data of
+each game and then the index. The header stores the position of the index,
+which is written anew at the end of the file every time games are added.
+"""
+import argparse
+import glob
+import mmap
+import os
+import os.path as path
+import struct
+import sys
+import zlib
+
+_MAGIC = b'NFLGARC1'
+
+_header = struct.Struct('<8sQQ')
+"""Magic bytes, followed by the offset and number of entries of the index."""
+
+_entry = struct.Struct('<10sQIB')
+"""An index entry: eid, offset, length and codec of a game's data."""
+
+CODEC_RAW = 0
+"""The data of a game is stored as is."""
+
+CODEC_GZIP = 1
+"""The data of a game is stored gzip compressed, exactly like a loose file."""
+
+default_path = path.join(path.split(__file__)[0], 'gamecenter-json.nga')
+"""
+The archive that nflgame.game.Game reads game data from, if it exists.
+"""
+
+_json_dir = path.join(path.split(__file__)[0], 'gamecenter-json')
+
+
+class Archive (object):
+    """
+    Archive provides read access to the games stored in an archive file.
+    """
+    def __init__(self, fpath):
+        """
+        Opens the archive at fpath and reads its index. The data of each
+        game is read through a memory map of the entire file.
+        """
+        self.fpath = fpath
+        self.index = {}
+        self._fp = open(fpath, 'rb')
+        size = os.fstat(self._fp.fileno()).st_size
+        if size == 0:
+            self._mmap = None
+            return
+        self._mmap = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, offset, count = _header.unpack(self._mmap[0:_header.size])
+        assert magic == _MAGIC, '"%s" is not an nflgame archive.' % fpath
+        self.index = _read_entries(
+            self._mmap[offset:offset + count * _entry.size])
+
+    def __contains__(self, eid):
+        return eid in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def eids(self):
+        """Returns a sorted list of every eid in the archive."""
+        return sorted(self.index)
+
+    def read(self, eid):
+        """
+        Returns the decompressed JSON data of the game with the given eid,
+        or None if the game isn't in the archive.
+        """
+        if eid not in self.index:
+            return None
+        return decompress(*self.read_raw(eid))
+
+    def read_raw(self, eid):
+        """
+        Returns a tuple (blob, codec) of the data of the game with the given
+        eid exactly as it is stored in the archive. The game must be in the
+        archive.
+        """
+        offset, length, codec = self.index[eid]
+        return self._mmap[offset:offset + length], codec
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._fp.close()
+
+
+def decompress(blob, codec):
+    """
+    Returns the JSON data in blob, which is stored with the given codec.
+    """
+    if codec == CODEC_GZIP:
+        return zlib.decompress(blob, 16 + zlib.MAX_WBITS)
+    return blob
+
+
+def _read_entries(data):
+    """
+    Reads the packed index entries in data and returns a dict of eid to
+    (offset, length, codec).
+    """
+    index = {}
+    for eid, off, length, codec in _entry.iter_unpack(data):
+        index[eid.decode('ascii')] = (off, length, codec)
+    return index
+
+
+def import_loose(fpath=None, json_dir=None, eids=None):
+    """
+    Adds the loose gzip compressed JSON files in json_dir to the archive at
+    fpath, creating the archive if it doesn't exist. Games that are already
+    in the archive are skipped, so this can be run repeatedly as new games
+    are cached to disk.
+
+    fpath defaults to `nflgame.archive.default_path` and json_dir defaults
+    to the `gamecenter-json` directory that comes with nflgame. If eids is
+    not None, only games with those identifiers are imported.
+
+    Returns the number of games that were added.
+    """
+    if fpath is None:
+        fpath = default_path
+    if json_dir is None:
+        json_dir = _json_dir
+
+    loose = {}
+    for f in glob.glob(path.join(json_dir, '*.json.gz')):
+        eid = path.basename(f)[:-len('.json.gz')]
+        if eids is None or eid in eids:
+            loose[eid] = f
+
+    mode = 'r+b' if path.isfile(fpath) else 'w+b'
+    with open(fpath, mode) as fp:
+        index = {}
+        head = fp.read(_header.size)
+        if len(head) == _header.size:
+            magic, offset, count = _header.unpack(head)
+            assert magic == _MAGIC, '"%s" is not an nflgame archive.' % fpath
+            fp.seek(offset)
+            index = _read_entries(fp.read(count * _entry.size))
+        else:
+            fp.write(_header.pack(_MAGIC, _header.size, 0))
+
+        # New data is always appended after the current index (leaving a
+        # few bytes of dead space behind) and the header is written last, so
+        # the archive stays readable if we die midway.
+        end = fp.seek(0, os.SEEK_END)
+        added = 0
+        for eid in sorted(loose):
+            if eid in index:
+                continue
+            with open(loose[eid], 'rb') as f:
+                blob = f.read()
+            index[eid] = (end, len(blob), CODEC_GZIP)
+            fp.write(blob)
+            end += len(blob)
+            added += 1
+        if added == 0:
+            return 0
+
+        for eid in sorted(index):
+            off, length, codec = index[eid]
+            fp.write(_entry.pack(eid.encode('ascii'), off, length, codec))
+        fp.flush()
+        os.fsync(fp.fileno())
+        fp.seek(0)
+        fp.write(_header.pack(_MAGIC, end, len(index)))
+    return added
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Imports the loose GameCenter JSON files into a single '
+                    'indexed archive. Games already in the archive are '
+                    'skipped.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('--archive', type=str, default=default_path,
+       help='The archive file to create or add games to.')
+    aa('--json-dir', type=str, default=_json_dir,
+       help='The directory of gzip compressed JSON files to import.')
+    aa('eids', type=str, nargs='*',
+       help='Only import games with these identifiers.')
+    args = parser.parse_args()
+
+    if path.isfile(args.archive) and not os.access(args.archive, os.W_OK):
+        print('I do not have write access to "%s".' % args.archive,
+              file=sys.stderr)
+        sys.exit(1)
+    n = import_loose(args.archive, args.json_dir, args.eids or None)
+    print('Added %d games to %s' % (n, args.archive))
+
+if __name__ == '__main__':
+    run()
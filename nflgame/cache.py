@@ -0,0 +1,198 @@
+"""
+The cache module keeps fully parsed games on disk, so that loading a game
+that has already been loaded once costs a single read and rebuilding the
+game from its compact form (see nflgame.game.Game._compact) instead of
+decompressing, decoding and parsing its JSON data all over again.
+
+The cache is disabled by default. It is turned on with:
+
+    #!python
+    import nflgame.cache
+
+    nflgame.cache.enable()
+
+After that, nflgame.game.Game stores every game it loads from disk (along
+with all of its drives, plays and player statistics) in the cache. Each
+entry is keyed by the game's eid and records a checksum of the compressed
+JSON data it was parsed from. If that data ever changes, the entry is
+ignored and replaced.
+
+The total size of the cache is bounded by `max_bytes`. When it grows past
+that, the least recently used entries are evicted.
+
+Games being played right now are never cached, since their JSON data is
+downloaded from NFL.com rather than read from disk.
+"""
+import hashlib
+import marshal
+import os
+import os.path as path
+import tempfile
+import zlib
+
+import nflgame.game
+
+_MAGIC = b'NFLGCACHE4'
+
+directory = None
+"""
+The directory that parsed games are cached in, or None when the cache is
+disabled.
+"""
+
+max_bytes = 1024 * 1024 * 1024
+"""
+The maximum total size of the cache in bytes. The least recently used
+entries are evicted whenever the cache grows past it.
+"""
+
+_total = None
+"""
+The total size of the entries in the cache directory, or None if it hasn't
+been added up yet. It is kept up to date as entries are stored, so that the
+directory is only scanned when the cache may have grown past max_bytes.
+"""
+
+
+def default_directory():
+    """
+    Returns the directory that is used for the cache when none is given to
+    `enable`. It honors the XDG_CACHE_HOME environment variable.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or path.expanduser('~/.cache')
+    return path.join(base, 'nflgame', 'games')
+
+
+def enable(dirpath=None, size=None):
+    """
+    Enables the cache of parsed games in dirpath, which is created if it
+    doesn't exist. If dirpath is None, `default_directory()` is used.
+
+    If size is not None, it replaces `max_bytes`.
+    """
+    global directory, max_bytes, _total
+    if dirpath is None:
+        dirpath = default_directory()
+    if not path.isdir(dirpath):
+        os.makedirs(dirpath)
+    directory = dirpath
+    _total = None
+    if size is not None:
+        max_bytes = size
+
+
+def disable():
+    """Disables the cache. Entries already on disk are left alone."""
+    global directory
+    directory = None
+
+
+def clear():
+    """Removes every entry from the cache."""
+    global _total
+    for entry in _entries():
+        _remove(entry.path)
+    _total = None
+
+
+def checksum(blob):
+    """
+    Returns the checksum that identifies the source data of a cache entry.
+    """
+    return hashlib.sha1(blob).hexdigest().encode('ascii')
+
+
+def load(eid, digest):
+    """
+    Returns the game cached for eid, or None if there is no entry for eid
+    or if the entry was parsed from data with a checksum other than digest.
+    """
+    fpath = _entry_path(eid)
+    try:
+        with open(fpath, 'rb') as fp:
+            data = fp.read()
+    except IOError:
+        return None
+
+    head = _MAGIC + digest
+    if not data.startswith(head):
+        return None
+    try:
+        state = marshal.loads(zlib.decompress(data[len(head):]))
+        game = nflgame.game.Game._from_compact(state, digest)
+    except Exception:
+        # A corrupt or incompatible entry is treated like a miss and will
+        # simply be replaced.
+        return None
+
+    # Bump the modification time, which is what eviction is based on.
+    try:
+        os.utime(fpath)
+    except OSError:
+        pass
+    return game
+
+
+def store(eid, digest, game):
+    """
+    Caches game, which was parsed from data with checksum digest, and evicts
+    the least recently used entries if the cache is now too big.
+    """
+    global _total
+    payload = zlib.compress(marshal.dumps(game._compact()), 1)
+    fpath = _entry_path(eid)
+    try:
+        old = os.stat(fpath).st_size
+    except OSError:
+        old = 0
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(_MAGIC + digest)
+            fp.write(payload)
+        os.replace(tmp, fpath)
+    except (IOError, OSError):
+        return
+    if _total is None:
+        _total = sum(e.stat().st_size for e in _entries())
+    else:
+        _total += len(_MAGIC) + len(digest) + len(payload) - old
+    if _total > max_bytes:
+        _evict()
+
+
+def _entry_path(eid):
+    return path.join(directory, '%s.game.z' % eid)
+
+
+def _entries():
+    if directory is None or not path.isdir(directory):
+        return []
+    return [e for e in os.scandir(directory) if e.name.endswith('.game.z')]
+
+
+def _evict():
+    """
+    Removes the least recently used entries until the cache fits in
+    max_bytes.
+    """
+    global _total
+    entries = []
+    total = 0
+    for e in _entries():
+        st = e.stat()
+        entries.append((st.st_mtime, st.st_size, e.path))
+        total += st.st_size
+    for _, size, fpath in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(fpath)
+        total -= size
+    _total = total
+
+
+def _remove(fpath):
+    try:
+        os.remove(fpath)
+    except OSError:
+        pass
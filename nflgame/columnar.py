@@ -0,0 +1,587 @@
+"""
+The columnar module turns the GameCenter JSON archive into a column
+oriented store of play-by-play data. Questions that would normally be
+answered with nflgame.combine_plays or nflgame.combine_play_stats can then
+be answered straight from the store, without decompressing or parsing any
+JSON.
+
+A store is built once (this parses every game in the archive):
+
+    #!python
+    import nflgame.columnar
+
+    nflgame.columnar.build('/path/to/store', years=[2012, 2013])
+
+Or from the command line with `nflgame-build-columnar /path/to/store`.
+
+Opening a store is nearly free: every column is a NumPy array stored in
+its own file and memory-mapped, so only the columns a query touches are
+ever read from disk. For example, the top 5 passing plays and the top 5
+rushers of the first week of the 2013 season:
+
+    #!python
+    store = nflgame.columnar.PlayStore('/path/to/store')
+    for p in store.plays(2013, week=1).sort('passing_yds').limit(5):
+        print(p)
+
+    players = store.players(2013, week=1)
+    for p in players.rushing().sort('rushing_yds').limit(5):
+        print(p, p.rushing_yds)
+
+Play level statistics are stored with one array per statistical field,
+along with eid, drive, playid, team, down, yardline and clock columns.
+Player level statistics for every play are stored the same way in a
+second table, which points back at the play table.
+
+Like nflgame.matrix, whose vectorized filter operators it shares, it
+requires the third party library NumPy.
+"""
+import argparse
+import array
+import json
+import os
+import os.path as path
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+import nflgame
+import nflgame.game
+import nflgame.matrix
+import nflgame.player
+import nflgame.sched
+import nflgame.seq
+import nflgame.statmap
+
+_VERSION = 1
+"""The version of the on disk layout. Bumped on incompatible changes."""
+
+_NO_YARDLINE = -128
+"""The yardline offset recorded for plays without a field position."""
+
+_NO_CLOCK = -1
+"""The clock value recorded for plays without a game clock."""
+
+_play_columns = (
+    ('eid', 'int64'), ('drive', 'int16'), ('playid', 'int32'),
+    ('team', 'int16'), ('home', 'bool'), ('down', 'int8'),
+    ('yards_togo', 'int16'), ('yardline', 'int8'), ('yrdln', 'int32'),
+    ('qtr', 'int8'), ('clock', 'int16'), ('desc_start', 'int64'),
+    ('desc_end', 'int64'),
+)
+"""The non-statistical columns of the play table and their types."""
+
+_play_fields = frozenset(name for name, _ in _play_columns
+                         if not name.startswith('desc_'))
+"""The non-statistical columns of the play table that are play fields."""
+
+_player_columns = (
+    ('play', 'int32'), ('playerid', 'int32'), ('name', 'int32'),
+    ('team', 'int16'), ('home', 'bool'),
+)
+"""The non-statistical columns of the player table and their types."""
+
+_field_index = dict((f, i) for i, f in enumerate(nflgame.statmap.fields))
+"""Maps each statistical field to its position in nflgame.statmap.fields."""
+
+
+class _Strings (object):
+    """
+    Interns strings into a list so that string columns can be stored as
+    integer indexes.
+    """
+    def __init__(self):
+        self.strings = []
+        self.index = {}
+
+    def intern(self, s):
+        if s not in self.index:
+            self.index[s] = len(self.strings)
+            self.strings.append(s)
+        return self.index[s]
+
+
+class _TableBuilder (object):
+    """
+    Accumulates rows of a table in compact arrays. Statistics are kept as
+    sparse (row, field, value) triples while building, since each row only
+    has a handful of the possible fields.
+    """
+    def __init__(self, columns):
+        self.columns = OrderedDict((name, []) for name, _ in columns)
+        self.types = dict(columns)
+        self.rows = 0
+        self.stat_rows = array.array('q')
+        self.stat_fields = array.array('h')
+        self.stat_values = array.array('d')
+
+    def add(self, stats, **values):
+        for name, vals in self.columns.items():
+            vals.append(values[name])
+        for field, v in stats.items():
+            self.stat_rows.append(self.rows)
+            self.stat_fields.append(_field_index[field])
+            self.stat_values.append(v)
+        self.rows += 1
+        return self.rows - 1
+
+    def save(self, dirpath, prefix):
+        """
+        Writes every column to its own .npy file and returns the list of
+        statistical fields that have at least one value in the table.
+        """
+        for name, vals in self.columns.items():
+            col = np.array(vals, dtype=self.types[name])
+            np.save(path.join(dirpath, '%s_%s.npy' % (prefix, name)), col)
+
+        rows = np.frombuffer(self.stat_rows, dtype=np.int64)
+        fields = np.frombuffer(self.stat_fields, dtype=np.int16)
+        values = np.frombuffer(self.stat_values, dtype=np.float64)
+        present = []
+        for i in np.unique(fields):
+            field = nflgame.statmap.fields[i]
+            col = np.full(self.rows, np.nan, dtype=np.float32)
+            which = fields == i
+            col[rows[which]] = values[which]
+            np.save(path.join(dirpath, '%s_%s.npy' % (prefix, field)), col)
+            present.append(field)
+        return present
+
+
+def build(dirpath, years=None, kinds=('PRE', 'REG', 'POST'), weeks=None):
+    """
+    Builds a columnar store in the directory dirpath from every game in the
+    GameCenter JSON archive. The directory is created if it doesn't exist,
+    and any store already in it is overwritten.
+
+    years may be a list of seasons to restrict the store to, kinds may
+    be a list of season types (PRE, REG and POST) and weeks may be a list
+    of weeks.
+
+    Only games whose JSON data is already cached to disk are included, so
+    building a store never downloads anything from NFL.com.
+
+    Returns the number of games written to the store.
+    """
+    if not path.isdir(dirpath):
+        os.makedirs(dirpath)
+
+    teams, yrdlns, playerids, names = \
+        _Strings(), _Strings(), _Strings(), _Strings()
+    plays = _TableBuilder(_play_columns)
+    players = _TableBuilder(_player_columns)
+    desc = bytearray()
+    eids = []
+    for eid, info in nflgame.sched.games.items():
+        if years is not None and info['year'] not in years:
+            continue
+        if info['season_type'] not in kinds:
+            continue
+        if weeks is not None and info['week'] not in weeks:
+            continue
+        if not nflgame.game._has_json(eid):
+            continue
+        game = nflgame.game.Game(eid)
+        if game is None:
+            continue
+        eids.append(eid)
+
+        for play in game.drives.plays():
+            start = len(desc)
+            desc.extend(play.desc.encode('utf-8'))
+            if play.time is None:
+                qtr, clock = 0, _NO_CLOCK
+            else:
+                qtr = nflgame.game._tryint(play.time.qtr)
+                clock = play.time._minutes * 60 + play.time._seconds
+            if play.yardline is None:
+                yardline = _NO_YARDLINE
+            else:
+                yardline = play.yardline.offset
+            row = plays.add(play._stats,
+                            eid=int(eid), drive=play.drive.drive_num,
+                            playid=int(play.playid),
+                            team=teams.intern(play.team), home=play.home,
+                            down=play.down, yards_togo=play.yards_togo,
+                            yardline=yardline,
+                            yrdln=yrdlns.intern(play.data['yrdln']),
+                            qtr=qtr, clock=clock,
+                            desc_start=start, desc_end=len(desc))
+            for p in play.players:
+                players.add(p._stats,
+                            play=row, playerid=playerids.intern(p.playerid),
+                            name=names.intern(p.name),
+                            team=teams.intern(p.team), home=p.home)
+
+    np.save(path.join(dirpath, 'desc.npy'),
+            np.frombuffer(bytes(desc), dtype=np.uint8))
+    meta = {
+        'version': _VERSION,
+        'eids': eids,
+        'teams': teams.strings,
+        'yrdlns': yrdlns.strings,
+        'playerids': playerids.strings,
+        'names': names.strings,
+        'play_fields': plays.save(dirpath, 'play'),
+        'player_fields': players.save(dirpath, 'player'),
+    }
+    with open(path.join(dirpath, 'meta.json'), 'w+') as fp:
+        json.dump(meta, fp)
+    return len(eids)
+
+
+class PlayStore (object):
+    """
+    PlayStore provides read access to a columnar store written by
+    nflgame.columnar.build.
+    """
+    def __init__(self, dirpath):
+        """
+        Opens the store in dirpath. Columns are memory-mapped lazily, the
+        first time they are needed.
+        """
+        self.dirpath = dirpath
+        with open(path.join(dirpath, 'meta.json')) as fp:
+            meta = json.load(fp)
+        assert meta['version'] == _VERSION, \
+            'Columnar store version %s is not supported. Please rebuild ' \
+            'it.' % meta['version']
+        self.eids = meta['eids']
+        self.teams = meta['teams']
+        self.yrdlns = meta['yrdlns']
+        self.playerids = meta['playerids']
+        self.names = meta['names']
+        self.play_fields = frozenset(meta['play_fields'])
+        self.player_fields = frozenset(meta['player_fields'])
+        self.__columns = {}
+
+    def column(self, name):
+        """
+        Returns the full column with the given name as a read only
+        NumPy array. Play table columns are prefixed with `play_`
+        (e.g., `play_passing_yds`), player table columns with `player_`
+        and the play descriptions are in `desc`.
+        """
+        if name not in self.__columns:
+            fpath = path.join(self.dirpath, '%s.npy' % name)
+            self.__columns[name] = np.load(fpath, mmap_mode='r')
+        return self.__columns[name]
+
+    def __len__(self):
+        """Returns the number of plays in the store."""
+        return len(self.column('play_eid'))
+
+    def plays(self, year=None, week=None, home=None, away=None, kind='REG'):
+        """
+        Returns a StorePlays sequence of all plays in games matching the
+        given criteria, in the same order that nflgame.combine_plays
+        would return them. The criteria are interpreted in the same way
+        as nflgame.games. If kind is None, every season type matches, and
+        when no criteria are given at all, every play is returned.
+        """
+        return StorePlays(self, self._play_rows(year, week, home, away, kind))
+
+    def players(self, year=None, week=None, home=None, away=None,
+                kind='REG'):
+        """
+        Returns a GenPlayerStats sequence of PlayPlayerStats that is
+        equivalent to nflgame.combine_play_stats over every game matching
+        the given criteria. The criteria are the same as for `plays`.
+        """
+        return self.plays(year, week, home, away, kind).players()
+
+    def _play_rows(self, year, week, home, away, kind):
+        crit = (year, week, home, away, kind)
+        if crit == (None, None, None, None, None):
+            return np.arange(len(self))
+        kinds = ['PRE', 'REG', 'POST'] if kind is None else [kind]
+        eids = []
+        for k in kinds:
+            infos = nflgame._search_schedule(year, week, home, away, k)
+            eids.extend(int(info['eid']) for info in infos)
+        mask = np.isin(self.column('play_eid'), eids)
+        return np.flatnonzero(mask)
+
+    def _player_stats(self, rows):
+        """
+        Sums player statistics over the plays given as row indexes into
+        the play table.
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        mask[rows] = True
+        prows = np.flatnonzero(mask[self.column('player_play')])
+        pids = np.asarray(self.column('player_playerid'))[prows]
+        if len(pids) == 0:
+            return nflgame.seq.GenPlayerStats(OrderedDict())
+
+        uniq, first, inverse = np.unique(pids, return_index=True,
+                                         return_inverse=True)
+        sums, present = {}, {}
+        for field in sorted(self.player_fields):
+            col = np.asarray(self.column('player_%s' % field))[prows]
+            has = ~np.isnan(col)
+            present[field] = np.bincount(inverse, weights=has,
+                                         minlength=len(uniq)) > 0
+            sums[field] = np.bincount(inverse, weights=np.where(has, col, 0),
+                                      minlength=len(uniq))
+
+        names = np.asarray(self.column('player_name'))[prows]
+        teams = np.asarray(self.column('player_team'))[prows]
+        homes = np.asarray(self.column('player_home'))[prows]
+        mixed_home = np.bincount(inverse, weights=homes,
+                                 minlength=len(uniq))
+        counts = np.bincount(inverse, minlength=len(uniq))
+
+        players = OrderedDict()
+        for i in np.argsort(first, kind='stable'):
+            row = first[i]
+            if 0 < mixed_home[i] < counts[i]:
+                home = None
+            else:
+                home = bool(homes[row])
+            playerid = self.playerids[uniq[i]]
+            p = nflgame.player.PlayPlayerStats(playerid,
+                                               self.names[names[row]],
+                                               home, self.teams[teams[row]])
+            stats = OrderedDict()
+            for field in sums:
+                if present[field][i]:
+                    stats[field] = _pyval(sums[field][i])
+            p._add_stats(stats)
+            players[playerid] = p
+        return nflgame.seq.GenPlayerStats(players)
+
+    def _values(self, field, rows):
+        """
+        Returns the values of a play field for the given rows. Statistics
+        that weren't recorded for a play are zero, just like they are for
+        nflgame.game.Play objects. A KeyError is raised for a field that
+        plays don't have.
+        """
+        if field in nflgame.statmap.fields:
+            if field not in self.play_fields:
+                return np.zeros(len(rows))
+            col = np.asarray(self.column('play_%s' % field))[rows]
+            return np.where(np.isnan(col), 0, col)
+        if field == 'team':
+            teams = np.array(self.teams, dtype=object)
+            return teams[np.asarray(self.column('play_team'))[rows]]
+        if field == 'desc':
+            return np.array([_Row(self, r).desc for r in rows], dtype=object)
+        if field not in _play_fields:
+            raise KeyError('Plays in a PlayStore have no field "%s".' % field)
+        return np.asarray(self.column('play_%s' % field))[rows]
+
+
+class StorePlays (object):
+    """
+    StorePlays is a sequence of plays in a PlayStore. It provides the same
+    searching API as nflgame.seq.GenPlays (filter, sort, limit and players),
+    but every operation works on whole columns at once.
+
+    Iterating over the sequence yields a lightweight object for each play
+    with the same attributes as nflgame.game.Play, except for players,
+    events and data.
+    """
+    def __init__(self, store, rows):
+        self.store = store
+        self.rows = rows
+
+    def filter(self, **kwargs):
+        """
+        Filters the plays in the same way as nflgame.seq.Gen.filter.
+        Field values may be given directly, as predicates or with one of
+        the `__lt`, `__le`, `__ne`, `__ge`, `__gt`, `__in`, `__between` or
+        `__contains` suffixes. Predicates are called with a NumPy array of
+        every value of the field at once, so `lambda v: v > 0` works as
+        expected.
+        """
+        keep = np.ones(len(self.rows), dtype=bool)
+        for k, v in kwargs.items():
+            field, pred = k, None
+            for suffix, p in nflgame.matrix._OPS.items():
+                if k.endswith(suffix):
+                    field, pred = k[:-len(suffix)], p
+                    break
+            vals = self.store._values(field, self.rows)
+            if pred is not None:
+                keep &= np.asarray(pred(vals, v), dtype=bool)
+            elif callable(v):
+                res = v(vals)
+                if not isinstance(res, np.ndarray):
+                    res = np.array([bool(v(x)) for x in vals], dtype=bool)
+                keep &= res.astype(bool)
+            else:
+                keep &= np.asarray(vals == v, dtype=bool)
+        return StorePlays(self.store, self.rows[keep])
+
+    def sort(self, field, descending=True):
+        """
+        Sorts the plays by field. Ties keep their original order, just like
+        nflgame.seq.Gen.sort.
+        """
+        vals = self.store._values(field, self.rows)
+        key = nflgame.matrix._sort_key(vals, descending)
+        order = np.argsort(key, kind='stable')
+        return StorePlays(self.store, self.rows[order])
+
+    def limit(self, n):
+        """Limit the sequence to N plays."""
+        return StorePlays(self.store, self.rows[:n])
+
+    def players(self):
+        """
+        Returns the combined player stats for every play in the sequence,
+        as a GenPlayerStats sequence of PlayPlayerStats.
+        """
+        return self.store._player_stats(self.rows)
+
+    def sum(self, field):
+        """Returns the sum of field over every play in the sequence."""
+        return _pyval(self.store._values(field, self.rows).sum())
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for r in self.rows:
+            yield _Row(self.store, r)
+
+    def __str__(self):
+        """Returns a list of items in the sequence."""
+        return '[%s]' % ', '.join([str(item) for item in self])
+
+
+class _Row (object):
+    """
+    A single play in a PlayStore. Statistical fields that weren't recorded
+    for the play are zero.
+    """
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def _col(self, name):
+        return self._store.column('play_%s' % name)[self._row]
+
+    @property
+    def eid(self):
+        return str(self._col('eid'))
+
+    @property
+    def drive_num(self):
+        return int(self._col('drive'))
+
+    @property
+    def playid(self):
+        return str(self._col('playid'))
+
+    @property
+    def team(self):
+        return self._store.teams[self._col('team')]
+
+    @property
+    def home(self):
+        return bool(self._col('home'))
+
+    @property
+    def down(self):
+        return int(self._col('down'))
+
+    @property
+    def yards_togo(self):
+        return int(self._col('yards_togo'))
+
+    @property
+    def desc(self):
+        d = self._store.column('desc')
+        start, end = self._col('desc_start'), self._col('desc_end')
+        return bytes(d[start:end]).decode('utf-8')
+
+    @property
+    def touchdown(self):
+        return 'touchdown' in self.desc.lower()
+
+    @property
+    def time(self):
+        clock = int(self._col('clock'))
+        if clock == _NO_CLOCK:
+            return None
+        return nflgame.game.GameClock(str(self._col('qtr')),
+                                      '%02d:%02d' % divmod(clock, 60))
+
+    @property
+    def yardline(self):
+        offset = int(self._col('yardline'))
+        if offset == _NO_YARDLINE:
+            return None
+        return nflgame.game.FieldPosition(offset=offset)
+
+    @property
+    def stats(self):
+        """Returns a dict of all statistics recorded for the play."""
+        stats = {}
+        for field in sorted(self._store.play_fields):
+            v = self._col(field)
+            if not np.isnan(v):
+                stats[field] = _pyval(v)
+        return stats
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self._store.play_fields:
+            v = self._col(name)
+            return 0 if np.isnan(v) else _pyval(v)
+        return 0
+
+    def __str__(self):
+        yrdln = self._store.yrdlns[self._col('yrdln')]
+        if self.team:
+            if self.down != 0:
+                return '(%s, %s, Q%d, %d and %d) %s' \
+                       % (self.team, yrdln, self._col('qtr'),
+                          self.down, self.yards_togo, self.desc)
+            else:
+                return '(%s, %s, Q%d) %s' \
+                       % (self.team, yrdln, self._col('qtr'), self.desc)
+        return self.desc
+
+
+def _pyval(v):
+    """
+    Converts a NumPy scalar to an int when it is integral, and a float
+    otherwise. (Statistics are stored as floats since sacks can be split.)
+    """
+    v = float(v)
+    if v.is_integer():
+        return int(v)
+    return v
+
+
+def run():
+    parser = argparse.ArgumentParser(
+        description='Builds a columnar store of play-by-play data from '
+                    'nflgame\'s GameCenter JSON archive.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    aa = parser.add_argument
+    aa('store', type=str,
+       help='The directory to write the store to.')
+    aa('--years', type=int, nargs='+', default=None,
+       help='Only include these seasons. All seasons are included by '
+            'default.')
+    aa('--kinds', nargs='+', choices=['PRE', 'REG', 'POST'],
+       default=['PRE', 'REG', 'POST'],
+       help='Only include these season types.')
+    aa('--weeks', type=int, nargs='+', default=None,
+       help='Only include these weeks. All weeks are included by default.')
+    args = parser.parse_args()
+
+    n = build(args.store, args.years, args.kinds, args.weeks)
+    print('Wrote %d games to %s' % (n, args.store))
+
+if __name__ == '__main__':
+    run()
@@ -3,11 +3,14 @@ import os
 import os.path as path
 import gzip
 import json
+import re
 import socket
 import sys
 import urllib.request, urllib.error, urllib.parse
 from collections import OrderedDict
 
+import nflgame.archive
+import nflgame.cache
 import nflgame.player
 import nflgame.sched
 import nflgame.seq
@@ -18,6 +21,19 @@ _MAX_INT = sys.maxsize
 _jsonf = path.join(path.split(__file__)[0], 'gamecenter-json', '%s.json.gz')
 _json_base_url = "http://www.nfl.com/liveupdate/game-center/%s/%s_gtd.json"
 
+_archive = None
+"""
+The nflgame.archive.Archive that game data is read from. It is opened the
+first time it's needed, and is False when there is no archive on disk.
+"""
+
+_feeds = {}
+"""
+A dict of eid to _Feed for every game whose JSON data was downloaded from
+NFL.com, which is used to avoid downloading and parsing it again when it
+hasn't changed.
+"""
+
 GameDiff = namedtuple('GameDiff', ['before', 'after', 'plays', 'players'])
 """
 Represents the difference between two points in time of the same game
@@ -53,6 +69,9 @@ class FieldPosition (object):
             return None
         return object.__new__(cls)
 
+    def __getnewargs__(self):
+        return (None, None, self.offset)
+
     def __init__(self, pos_team=None, yardline=None, offset=None):
         """
         pos_team is the team on offense, and yardline is a string formatted
@@ -248,24 +267,29 @@ class Game (object):
     the winner of the game, the score and a list of all the scoring plays.
     """
 
-    def __new__(cls, eid=None, fpath=None):
+    def __new__(cls, eid=None, fpath=None, lean=False, fetched=None):
+        if fetched is None:
+            fetched = _fetch(eid, fpath)
+        digest, rawData, cached = fetched
+        if isinstance(cached, cls):
+            cached.lean = lean
+            return cached
+
         # If we can't get a valid JSON data, exit out and return None.
-        try:
-            rawData = _get_json_data(eid, fpath)
-        except urllib.error.URLError:
-            return None
         if rawData is None or rawData.strip() == '{}':
             return None
         game = object.__new__(cls)
         game.rawData = rawData
+        game.lean = lean
+        game._digest = digest
 
         try:
             if eid is not None:
                 game.eid = eid
-                game.data = json.loads(game.rawData)[game.eid]
+                game.data = _decode_json(game.rawData)[game.eid]
             else:  # For when we have rawData (fpath) and no eid.
                 game.eid = None
-                game.data = json.loads(game.rawData)
+                game.data = _decode_json(game.rawData)
                 for k, v in game.data.items():
                     if isinstance(v, dict):
                         game.eid = k
@@ -277,7 +301,7 @@ class Game (object):
 
         return game
 
-    def __init__(self, eid=None, fpath=None):
+    def __init__(self, eid=None, fpath=None, lean=False, fetched=None):
         """
         Creates a new Game instance given a game identifier.
 
@@ -290,26 +314,81 @@ class Game (object):
         read it from disk.
 
         When the JSON data is written to disk, it is compressed using gzip.
+
+        Only the game's header (teams, score, clock, scoring summary and team
+        statistics) is decoded up front. The drives are decoded the first
+        time that the drives or plays of the game are used.
+
+        If the cache of parsed games is enabled (see nflgame.cache), games
+        that are cached to disk are also stored there, fully parsed.
+
+        If lean is True, the game doesn't hold on to its JSON data once it is
+        cached to disk. Namely, `rawData` and `data` are released after the
+        game, its drives or its players are parsed, and plays don't keep
+        their raw `data`. They are all read back from disk if they're used
+        again, which makes lean games much smaller at the cost of making
+        access to the raw JSON data slow.
+
+        If fetched is not None, it must be the value returned by
+        `nflgame.game._fetch` for this game, and the game is created from it
+        instead of reading its data again. This lets the data of a game be
+        read ahead of time, possibly in another thread.
+        """
+        # A game that came out of the cache of parsed games is already
+        # initialized.
+        if self.__dict__.get('_initialized', False):
+            return
+
+        self._load_header()
+
+        # Check to see if the game is over, and if so, cache the data.
+        if self.game_over() and not _has_json(eid):
+            self.save()
+            _feeds.pop(self.eid, None)
+
+        # Remember the game that was created from freshly downloaded data,
+        # so it can be handed back while the data doesn't change.
+        feed = _feeds.get(self.eid)
+        if feed is not None and feed.game is None:
+            feed.game = self
+
+        self._initialized = True
+        if self._digest is not None:
+            # Parse everything up front so that the cache is complete.
+            for name in ('drives', 'players'):
+                getattr(self, name)
+            nflgame.cache.store(self.eid, self._digest, self)
+        self._release()
+
+    def _load_header(self, data=None):
+        """
+        Sets the attributes of the game that come from the header of its
+        JSON data, i.e., everything but its drives and player statistics.
+        The header is read from data if it's given, and from the game's
+        JSON data otherwise.
         """
+        if data is None:
+            data = self.data
+
         # Make the schedule info more accessible.
         self.schedule = nflgame.sched.games.get(self.eid, None)
 
         # Home and team cumulative statistics.
-        self.home = self.data['home']['abbr']
-        self.away = self.data['away']['abbr']
-        self.stats_home = _json_team_stats(self.data['home']['stats']['team'])
-        self.stats_away = _json_team_stats(self.data['away']['stats']['team'])
+        self.home = data['home']['abbr']
+        self.away = data['away']['abbr']
+        self.stats_home = _json_team_stats(data['home']['stats']['team'])
+        self.stats_away = _json_team_stats(data['away']['stats']['team'])
 
         # Load up some simple static values.
         self.gamekey = nflgame.sched.games[self.eid]['gamekey']
-        self.time = GameClock(self.data['qtr'], self.data['clock'])
-        self.down = _tryint(self.data['down'])
-        self.togo = _tryint(self.data['togo'])
-        self.score_home = int(self.data['home']['score']['T'])
-        self.score_away = int(self.data['away']['score']['T'])
+        self.time = GameClock(data['qtr'], data['clock'])
+        self.down = _tryint(data['down'])
+        self.togo = _tryint(data['togo'])
+        self.score_home = int(data['home']['score']['T'])
+        self.score_away = int(data['away']['score']['T'])
         for q in (1, 2, 3, 4, 5):
             for team in ('home', 'away'):
-                score = self.data[team]['score'][str(q)]
+                score = data[team]['score'][str(q)]
                 self.__dict__['score_%s_q%d' % (team, q)] = int(score)
 
         if not self.game_over():
@@ -327,15 +406,45 @@ class Game (object):
 
         # Load the scoring summary into a simple list of strings.
         self.scores = []
-        for k in sorted(map(int, self.data['scrsummary'])):
-            play = self.data['scrsummary'][str(k)]
+        for k in sorted(map(int, data['scrsummary'])):
+            play = data['scrsummary'][str(k)]
             s = '%s - Q%d - %s - %s' \
                 % (play['team'], play['qtr'], play['type'], play['desc'])
             self.scores.append(s)
 
-        # Check to see if the game is over, and if so, cache the data.
-        if self.game_over() and not os.access(_jsonf % eid, os.R_OK):
+    def update(self, rawData):
+        """
+        Updates this game in place with rawData, newer JSON data of the same
+        game (e.g., a later snapshot of a game being played).
+
+        This is much cheaper than creating a new game. If the drives of the
+        game were already parsed, only drives that changed are parsed again.
+        Plays with the same id and description as before are reused, even
+        in drives that changed. Player statistics are recomputed the next
+        time they are used.
+
+        Note that since the game is changed in place, it can't be diffed
+        with its older self. Use a new game for that.
+        """
+        old_data = self.__dict__.get('data')
+        old_drives = self.__dict__.get('_Game__drives')
+        self.rawData = rawData
+        self.data = _decode_json(rawData)[self.eid]
+        self._load_header()
+
+        if old_drives is not None:
+            old_json = None
+            if old_data is not None:
+                old_json = old_data['drives']
+            self.__drives = _json_drives(self, self.home, self.data['drives'],
+                                         old_drives, old_json)
+            self.drives = nflgame.seq.GenDrives(self.__drives)
+        for name in ('players', '_Game__players', '_Game__max_players'):
+            self.__dict__.pop(name, None)
+
+        if self.game_over() and not _has_json(self.eid):
             self.save()
+            _feeds.pop(self.eid, None)
 
     def is_home(self, team):
         """Returns true if team (i.e., 'NE') is the home team."""
@@ -394,58 +503,127 @@ class Game (object):
         Taking the max values of each statistic reduces the chance of being
         wrong (particularly for stats that are in both play-by-play data
         and game statistics), but does not eliminate them.
+
+        The result is computed once per game, so the player statistics it
+        contains are shared by every call and shouldn't be modified.
         """
-        game_players = list(self.players)
-        play_players = list(self.drives.plays().players())
+        max_players = self.__dict__.get('_Game__max_players')
+        if max_players is not None:
+            return nflgame.seq.GenPlayerStats(max_players)
+
+        game_players = {}
+        for pgame in self.players:
+            game_players[pgame.playerid] = pgame
         max_players = OrderedDict()
 
         # So this is a little tricky. It's possible for a player to have
         # only statistics at the play level, and therefore not be represented
         # in the game level statistics. Therefore, we initialize our
-        # max_players with play-by-play stats first. Then go back through
-        # and combine them with available game statistics.
-        for pplay in play_players:
+        # max_players with play-by-play stats first. Then combine them with
+        # available game statistics, which are looked up by player id.
+        for pplay in self.drives.plays().players():
             newp = nflgame.player.GamePlayerStats(pplay.playerid,
                                                   pplay.name, pplay.home,
                                                   pplay.team)
-            maxstats = {}
-            for stat, val in pplay._stats.items():
-                maxstats[stat] = val
-
-            newp._overwrite_stats(maxstats)
-            max_players[pplay.playerid] = newp
-
-        for newp in max_players.values():
-            for pgame in game_players:
-                if pgame.playerid != newp.playerid:
-                    continue
+            newp._merge(pplay)
 
+            pgame = game_players.get(pplay.playerid)
+            if pgame is not None:
                 maxstats = {}
-                for stat, val in pgame._stats.items():
-                    maxstats[stat] = max([val,
-                                          newp._stats.get(stat, -_MAX_INT)])
-
+                for stat, val in pgame._items():
+                    maxstats[stat] = max(val, newp._get(stat, -_MAX_INT))
                 newp._overwrite_stats(maxstats)
-                break
+            max_players[pplay.playerid] = newp
+
+        self.__max_players = max_players
         return nflgame.seq.GenPlayerStats(max_players)
 
     def __getattr__(self, name):
+        if name == 'rawData':
+            # Not kept for games that are cached to disk when pickled.
+            self.rawData = _get_json_data(self.eid)
+            return self.rawData
+        if name == 'data':
+            self.data = _decode_json(self.rawData)[self.eid]
+            return self.data
         if name == 'players':
             self.__players = _json_game_player_stats(self, self.data)
             self.players = nflgame.seq.GenPlayerStats(self.__players)
+            self._release()
             return self.players
         if name == 'drives':
             self.__drives = _json_drives(self, self.home, self.data['drives'])
             self.drives = nflgame.seq.GenDrives(self.__drives)
+            self._release()
             return self.drives
         raise AttributeError
 
+    def _release(self):
+        """
+        Drops the JSON data of a lean game if it can be read back from disk.
+        """
+        if self.lean and _has_json(self.eid):
+            self.__dict__.pop('rawData', None)
+            self.__dict__.pop('data', None)
+
     def __sub__(self, other):
         return diff(other, self)
 
     def __str__(self):
         return self.nice_score()
 
+    def __reduce__(self):
+        # The JSON data is left out when it can be read back from disk, since
+        # a parsed game doesn't need it. It's loaded again when accessed.
+        state = dict(self.__dict__)
+        if _has_json(self.eid):
+            state.pop('rawData', None)
+            state.pop('data', None)
+        return (_new_game, (self.__class__,), state)
+
+    def _compact(self):
+        """
+        Returns the compact form of this game, with its drives, plays and
+        player statistics already parsed. It is made of nothing but tuples,
+        lists, dicts, strings and numbers, so it can be written with
+        marshal, and `Game._from_compact` turns it back into the game much
+        faster than its JSON data can be decoded and parsed.
+        """
+        header = dict((k, v) for k, v in self.data.items() if k != 'drives')
+        players = [(p.playerid, p.name, p.home, p.team, p.__dict__)
+                   for p in self.players]
+        return (self.eid, header, players,
+                [d._compact() for d in self.drives])
+
+    @classmethod
+    def _from_compact(cls, state, digest=None):
+        """
+        Returns the game whose compact form (see `_compact`) is state. Its
+        JSON data is read back from disk if it is used.
+        """
+        eid, header, players, drives = state
+        game = object.__new__(cls)
+        game.eid = eid
+        game.lean = False
+        game._digest = digest
+        game._load_header(header)
+
+        game.__players = OrderedDict()
+        for playerid, name, home, team, stats in players:
+            p = nflgame.player.GamePlayerStats(playerid, name, home, team)
+            p.__dict__ = stats
+            game.__players[playerid] = p
+        game.players = nflgame.seq.GenPlayerStats(game.__players)
+        game.__drives = [Drive._from_compact(game, d) for d in drives]
+        game.drives = nflgame.seq.GenDrives(game.__drives)
+        game._initialized = True
+        return game
+
+
+def _new_game(cls):
+    """Creates an empty Game for unpickling."""
+    return object.__new__(cls)
+
 
 def diff(before, after):
     """
@@ -459,12 +637,17 @@ def diff(before, after):
     """
     assert after.eid == before.eid
 
-    plays = []
-    after_plays = list(after.drives.plays())
-    before_plays = list(before.drives.plays())
-    for play in after_plays:
-        if play not in before_plays:
-            plays.append(play)
+    # A game whose data hasn't changed since the last time it was fetched
+    # is the very same object.
+    if after is before:
+        return GameDiff(before=before, after=after, plays=[],
+                        players=nflgame.seq.GenPlayerStats({}))
+
+    # Plays are the same when they have the same id and description (see
+    # Play.__eq__), so they're looked up by that in a set.
+    before_plays = set((p.playid, p.desc) for p in before.drives.plays())
+    plays = [p for p in after.drives.plays()
+             if (p.playid, p.desc) not in before_plays]
 
     # You might think that updated play data is enough. You could scan
     # it for statistics you're looking for (like touchdowns).
@@ -472,18 +655,17 @@ def diff(before, after):
     # updated (late call? play review? etc.)
     # Thus, we do a diff on the play statistics for player data too.
     _players = OrderedDict()
-    after_players = list(after.max_player_stats())
-    before_players = list(before.max_player_stats())
-    for aplayer in after_players:
-        has_before = False
-        for bplayer in before_players:
-            if aplayer.playerid == bplayer.playerid:
-                has_before = True
-                pdiff = aplayer - bplayer
-                if pdiff is not None:
-                    _players[aplayer.playerid] = pdiff
-        if not has_before:
+    before_players = {}
+    for bplayer in before.max_player_stats():
+        before_players[bplayer.playerid] = bplayer
+    for aplayer in after.max_player_stats():
+        bplayer = before_players.get(aplayer.playerid)
+        if bplayer is None:
             _players[aplayer.playerid] = aplayer
+            continue
+        pdiff = aplayer - bplayer
+        if pdiff is not None:
+            _players[aplayer.playerid] = pdiff
     players = nflgame.seq.GenPlayerStats(_players)
 
     return GameDiff(before=before, after=after, plays=plays, players=players)
@@ -498,7 +680,12 @@ class Drive (object):
     of first downs and a short descriptive string of the result of the
     drive.
     """
-    def __init__(self, game, drive_num, home_team, data):
+    def __init__(self, game, drive_num, home_team, data, reuse=None):
+        """
+        Creates a drive from its JSON data. If reuse is not None, it must be
+        a dict of (playid, desc) to the plays of an earlier version of this
+        drive, which are kept instead of being parsed again.
+        """
         if data is None or 'plays' not in data or len(data['plays']) == 0:
             return
         self.game = game
@@ -548,7 +735,7 @@ class Drive (object):
                 and self.time_end.quarter in (1, 3):
             self.time_end.quarter += 1
 
-        self.__plays = _json_plays(self, data['plays'])
+        self.__plays = _json_plays(self, data['plays'], reuse)
         self.plays = nflgame.seq.GenPlays(self.__plays)
 
     def __add__(self, other):
@@ -582,8 +769,36 @@ class Drive (object):
         return '%s (Start: %s, End: %s) %s' \
                % (self.team, self.time_start, self.time_end, self.result)
 
-
-class Play (object):
+    def _compact(self):
+        """Returns the compact form of this drive. See Game._compact."""
+        return (self._key, self.drive_num, self.team, self.home,
+                self.first_downs, self.result, self.penalty_yds,
+                self.total_yds, self.pos_time.clock, self.play_cnt,
+                _offset(self.field_start), self.time_start.qtr,
+                self.time_start.clock, _offset(self.field_end),
+                self.time_end.qtr, self.time_end.clock,
+                [p._compact() for p in self.__plays])
+
+    @classmethod
+    def _from_compact(cls, game, state):
+        """Returns the drive of game whose compact form is state."""
+        drive = object.__new__(cls)
+        (drive._key, drive.drive_num, drive.team, drive.home,
+         drive.first_downs, drive.result, drive.penalty_yds, drive.total_yds,
+         pos_time, drive.play_cnt, field_start, qtr_start, clock_start,
+         field_end, qtr_end, clock_end, plays) = state
+        drive.game = game
+        drive.pos_time = PossessionTime(pos_time)
+        drive.field_start = FieldPosition(offset=field_start)
+        drive.time_start = GameClock(qtr_start, clock_start)
+        drive.field_end = FieldPosition(offset=field_end)
+        drive.time_end = GameClock(qtr_end, clock_end)
+        drive.__plays = [Play._from_compact(drive, p) for p in plays]
+        drive.plays = nflgame.seq.GenPlays(drive.__plays)
+        return drive
+
+
+class Play (nflgame.player._StatVector):
     """
     Play represents a single play. It contains a list of all players
     that participated in the play (including offense, defense and special
@@ -593,18 +808,24 @@ class Play (object):
     Play objects also contain team-level statistics, such as whether the
     play was a first down, a fourth down failure, etc.
     """
+    __slots__ = ('drive', 'playid', 'team', 'home', 'desc', 'note', '_yrdln',
+                 'down', 'yards_togo', 'touchdown', 'time', 'yardline',
+                 '_data', '_players', '_events')
+
     def __init__(self, drive, playid, data):
-        self.data = data
+        super(Play, self).__init__()
+        self._data = None if drive.game.lean else data
+        self._events = None
         self.drive = drive
         self.playid = playid
         self.team = data['posteam']
         self.home = self.drive.home
         self.desc = data['desc']
         self.note = data['note']
+        self._yrdln = data['yrdln']
         self.down = int(data['down'])
         self.yards_togo = int(data['ydstogo'])
         self.touchdown = 'touchdown' in self.desc.lower()
-        self._stats = {}
 
         if not self.team:
             self.time, self.yardline = None, None
@@ -612,50 +833,67 @@ class Play (object):
             self.time = GameClock(data['qtr'], data['time'])
             self.yardline = FieldPosition(self.team, data['yrdln'])
 
-        # Load team statistics directly into the Play instance.
-        # Things like third down attempts, first downs, etc.
-        if '0' in data['players']:
-            for info in data['players']['0']:
-                if info['statId'] not in nflgame.statmap.idmap:
-                    continue
-                statvals = nflgame.statmap.values(info['statId'],
-                                                  info['yards'])
-                for k, v in statvals.items():
-                    v = self.__dict__.get(k, 0) + v
-                    self.__dict__[k] = v
-                    self._stats[k] = v
-
-        # Load the sequence of "events" in a play into a list of dictionaries.
-        self.events = _json_play_events(data['players'])
-
-        # Now load cumulative player data for this play into
-        # a GenPlayerStats generator. We then flatten this data
-        # and add it to the play itself so that plays can be
-        # filter by these statistics.
-        self.__players = _json_play_players(self, data['players'])
-        self.players = nflgame.seq.GenPlayerStats(self.__players)
-        for p in self.players:
-            for k, v in p.stats.items():
-                # Sometimes we may see duplicate statistics (like tackle
-                # assists). Let's just overwrite in this case, since this
-                # data is from the perspective of the play. i.e., there
-                # is one assisted tackle rather than two.
-                self.__dict__[k] = v
-                self._stats[k] = v
+        # Team statistics (things like third down attempts, first downs,
+        # etc.) and the statistics of every player in the play are read in
+        # a single pass, and then flattened into the play itself so that
+        # plays can be filtered by these statistics.
+        self._players = _json_play_stats(self, data['players'])
+        for p in self._players.values():
+            # Sometimes we may see duplicate statistics (like tackle
+            # assists). Let's just overwrite in this case, since this
+            # data is from the perspective of the play. i.e., there
+            # is one assisted tackle rather than two.
+            self._merge(p, overwrite=True)
+
+    @property
+    def data(self):
+        """
+        The JSON data of this play. Plays of lean games don't keep it, so
+        it's read back from disk every time it is used, without keeping the
+        JSON data of the whole game either.
+        """
+        if self._data is not None:
+            return self._data
+        game = self.drive.game
+        data = game.__dict__.get('data')
+        if data is None and game.lean and _has_json(game.eid):
+            data = _decode_json(_get_json_data(game.eid))[game.eid]
+        elif data is None:
+            data = game.data
+        drive = data['drives'][self.drive._key]
+        return drive['plays'][self.playid]
+
+    @property
+    def players(self):
+        """
+        A GenPlayerStats sequence of the PlayPlayerStats of every player
+        that participated in this play.
+        """
+        return nflgame.seq.GenPlayerStats(self._players)
+
+    @property
+    def events(self):
+        """
+        The sequence of "events" in this play as a list of dictionaries.
+        It is read from the play's JSON data the first time it is used.
+        """
+        if self._events is None:
+            self._events = _json_play_events(self.data['players'])
+        return self._events
 
     def has_player(self, playerid):
         """Whether a player with id playerid participated in this play."""
-        return playerid in self.__players
+        return playerid in self._players
 
     def __str__(self):
         if self.team:
             if self.down != 0:
                 return '(%s, %s, Q%d, %d and %d) %s' \
-                       % (self.team, self.data['yrdln'], self.time.qtr,
+                       % (self.team, self._yrdln, self.time.qtr,
                           self.down, self.yards_togo, self.desc)
             else:
                 return '(%s, %s, Q%d) %s' \
-                       % (self.team, self.data['yrdln'], self.time.qtr,
+                       % (self.team, self._yrdln, self.time.qtr,
                           self.desc)
         return self.desc
 
@@ -668,9 +906,190 @@ class Play (object):
 
     def __getattr__(self, name):
         if name.startswith('__'):
-            raise AttributeError
+            raise AttributeError(name)
+        # Only called when name isn't a statistic of this play.
         return 0
 
+    def _compact(self):
+        """
+        Returns the compact form of this play. See Game._compact. Its JSON
+        data is left out, since it can be read back from disk.
+        """
+        if self.team:
+            qtr, clock = self.time.qtr, self.time.clock
+        else:
+            qtr, clock = None, None
+        players = [(p.playerid, p.name, p.home, p.team, p.__dict__)
+                   for p in self._players.values()]
+        return (self.playid, self.team, self.desc, self.note, self._yrdln,
+                self.down, self.yards_togo, self.touchdown, qtr, clock,
+                self.__dict__, players)
+
+    @classmethod
+    def _from_compact(cls, drive, state):
+        """Returns the play of drive whose compact form is state."""
+        play = cls.__new__(cls)
+        (play.playid, play.team, play.desc, play.note, play._yrdln,
+         play.down, play.yards_togo, play.touchdown, qtr, clock,
+         play.__dict__, players) = state
+        play.drive = drive
+        play.home = drive.home
+        play._data = None
+        play._events = None
+        if not play.team:
+            play.time, play.yardline = None, None
+        else:
+            play.time = GameClock(qtr, clock)
+            play.yardline = FieldPosition(play.team, play._yrdln)
+        play._players = OrderedDict()
+        new_player = nflgame.player.PlayPlayerStats
+        for playerid, name, home, team, stats in players:
+            p = new_player(playerid, name, home, team)
+            p.__dict__ = stats
+            play._players[playerid] = p
+        return play
+
+    def __getstate__(self):
+        # Like the JSON data of their game, plays of lean games are pickled
+        # without their JSON data when it can be read back from disk.
+        state = dict((name, getattr(self, name)) for name in Play.__slots__)
+        game = self.drive.game
+        if game.lean and _has_json(game.eid):
+            state['_data'] = state['_events'] = None
+        state['_stats'] = self._stat_state()
+        return state
+
+    def __setstate__(self, state):
+        self._set_stat_state(state.pop('_stats'))
+        self._events = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class _GameData (dict):
+    """
+    _GameData is the decoded JSON data of a single game, except that its
+    "drives" entry is only decoded the first time it is used. Decoding the
+    drives is by far the most expensive part of decoding a game, and many
+    uses of a game (scores, winners, team statistics) never need them.
+
+    The drives are cut out of the document by position, so when they are
+    decoded, the cut is checked to hold exactly the drives. If it doesn't
+    (some other key sat between "drives" and "scrsummary"), the game is
+    decoded again in full. Since such a key would be missing until then,
+    looking up any missing key decodes the drives first.
+    """
+    def __init__(self, data, raw, key, start, end):
+        super(_GameData, self).__init__(data)
+        self._raw, self._key, self._start, self._end = raw, key, start, end
+
+    def _decode_drives(self):
+        if self._raw is None:
+            return
+        raw, self._raw = self._raw, None
+        cut = raw[self._start:self._end].decode('utf-8')
+        try:
+            drives, end = _decoder.raw_decode(cut)
+        except ValueError:
+            end = None
+        if end is None or cut[end:].strip():
+            data = json.loads(raw)[self._key]
+            dict.clear(self)
+            dict.update(self, data)
+        else:
+            dict.__setitem__(self, 'drives', drives)
+
+    def __missing__(self, key):
+        if self._raw is not None:
+            self._decode_drives()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            self._decode_drives()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self._decode_drives()
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        self._decode_drives()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._decode_drives()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._decode_drives()
+        return dict.keys(self)
+
+    def values(self):
+        self._decode_drives()
+        return dict.values(self)
+
+    def items(self):
+        self._decode_drives()
+        return dict.items(self)
+
+    def copy(self):
+        self._decode_drives()
+        return dict.copy(self)
+
+    def __eq__(self, other):
+        self._decode_drives()
+        if isinstance(other, _GameData):
+            other._decode_drives()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+
+_decoder = json.JSONDecoder()
+
+_drives_start = re.compile(br'"drives":\s*')
+_drives_end = re.compile(br',\s*"scrsummary":')
+
+
+def _decode_json(raw):
+    """
+    Decodes the GameCenter JSON document in raw. Every game in the document
+    is returned as a _GameData, so that its drives are only decoded when
+    they're used.
+
+    This relies on "drives" being followed by "scrsummary" in the document,
+    which is how NFL.com writes it. When "scrsummary" doesn't follow the
+    drives at all, the whole document is simply decoded at once, and when
+    it follows them after some other key, the game is decoded in full the
+    first time its drives (or that key) are used.
+    """
+    if isinstance(raw, str):
+        raw = raw.encode('utf-8')
+    start = _drives_start.search(raw)
+    end = start and _drives_end.search(raw, start.end())
+    if start and end:
+        try:
+            doc = json.loads(raw[:start.start()] + raw[end.start() + 1:])
+        except ValueError:
+            doc = None
+        if doc is not None:
+            for k, v in doc.items():
+                if isinstance(v, dict) and 'scrsummary' in v:
+                    doc[k] = _GameData(v, raw, k, start.end(),
+                                      end.start())
+                    return doc
+    return json.loads(raw)
+
+
+def _offset(pos):
+    """Returns the offset of a FieldPosition, or None if pos is None."""
+    return None if pos is None else pos.offset
+
 
 def _json_team_stats(data):
     """
@@ -690,11 +1109,20 @@ def _json_team_stats(data):
         pos_time=PossessionTime(data['top']))
 
 
-def _json_drives(game, home_team, data):
+def _json_drives(game, home_team, data, old_drives=None, old_data=None):
     """
     Takes a home or away JSON entry and converts it to a list of Drive
     objects.
+
+    When a game is updated, old_drives are its drives before the update and
+    old_data is the JSON entry they were parsed from (or None if it isn't
+    around anymore). A drive whose JSON data didn't change is kept as is,
+    and the plays of the other drives are reused when they can be.
     """
+    olds = {}
+    for d in old_drives or []:
+        olds[d._key] = d
+
     drive_nums = []
     for drive_num in data:
         try:
@@ -703,18 +1131,33 @@ def _json_drives(game, home_team, data):
             pass
     drives = []
     for i, drive_num in enumerate(sorted(drive_nums), 1):
-        d = Drive(game, i, home_team, data[str(drive_num)])
+        key = str(drive_num)
+        old = olds.get(key)
+        if old is not None and old_data is not None \
+                and old_data.get(key) == data[key]:
+            old.drive_num = i
+            drives.append(old)
+            continue
+
+        reuse = None
+        if old is not None:
+            reuse = dict(((p.playid, p.desc), p) for p in old.plays)
+        d = Drive(game, i, home_team, data[key], reuse)
         if not hasattr(d, 'game'):  # not a valid drive
             continue
+        d._key = key
         drives.append(d)
     return drives
 
 
-def _json_plays(drive, data):
+def _json_plays(drive, data, reuse=None):
     """
     Takes a single JSON drive entry (data) and converts it to a list
     of Play objects. This includes trying to resolve duplicate play
     conflicts by only taking the first instance of a play.
+
+    If reuse is not None, plays in it with the same id and description as
+    a play in data are moved to drive instead of being parsed again.
     """
     plays = []
     seen_ids = set()
@@ -726,37 +1169,43 @@ def _json_plays(drive, data):
             continue
         seen_ids.add(playid)
         seen_desc.add(desc)
-        plays.append(Play(drive, playid, data[playid]))
+        old = reuse.get((playid, p['desc'])) if reuse else None
+        if old is not None:
+            old.drive = drive
+            plays.append(old)
+        else:
+            plays.append(Play(drive, playid, data[playid]))
     return plays
 
 
-def _json_play_players(play, data):
+def _json_play_stats(play, data):
     """
-    Takes a single JSON play entry (data) and converts it to an OrderedDict
-    of player statistics.
-
-    play is the instance of Play that this data is part of. It is used
-    to determine whether the player belong to the home team or not.
+    Takes the players of a single JSON play entry (data) and returns an
+    OrderedDict mapping player id to PlayPlayerStats. The team statistics
+    in data are added to play as they are seen, so the players of a play
+    are only walked once.
     """
     players = OrderedDict()
+    decoders = nflgame.statmap.decoders
+    decode = nflgame.statmap.decode
     for playerid, statcats in data.items():
-        if playerid == '0':
-            continue
+        team = playerid == '0'
         for info in statcats:
-            if info['statId'] not in nflgame.statmap.idmap:
+            decoder = decoders.get(info['statId'])
+            if decoder is None:
                 continue
-            if playerid not in players:
-                home = play.drive.game.is_home(info['clubcode'])
-                if home:
-                    team_name = play.drive.game.home
-                else:
-                    team_name = play.drive.game.away
-                stats = nflgame.player.PlayPlayerStats(playerid,
-                                                       info['playerName'],
-                                                       home, team_name)
-                players[playerid] = stats
-            statvals = nflgame.statmap.values(info['statId'], info['yards'])
-            players[playerid]._add_stats(statvals)
+            if team:
+                stats = play
+            else:
+                stats = players.get(playerid)
+                if stats is None:
+                    game = play.drive.game
+                    home = game.is_home(info['clubcode'])
+                    stats = nflgame.player.PlayPlayerStats(
+                        playerid, info['playerName'], home,
+                        game.home if home else game.away)
+                    players[playerid] = stats
+            decode(decoder, info['yards'], stats.__dict__)
     return players
 
 
@@ -808,11 +1257,54 @@ def _json_game_player_stats(game, data):
     return players
 
 
+def _get_archive():
+    """
+    Returns the archive at nflgame.archive.default_path, or False if there
+    isn't one.
+    """
+    global _archive
+    if _archive is None:
+        if path.isfile(nflgame.archive.default_path):
+            _archive = nflgame.archive.Archive(nflgame.archive.default_path)
+        else:
+            _archive = False
+    return _archive
+
+
+def _has_json(eid):
+    """
+    Returns true if the JSON data for the game represented by eid is cached
+    to disk, either in the archive or as a loose file.
+    """
+    archive = _get_archive()
+    if archive and eid in archive:
+        return True
+    return os.access(_jsonf % eid, os.R_OK)
+
+
+def _get_json_source(eid):
+    """
+    Returns a tuple (blob, codec) of the still-compressed JSON data of the
+    game represented by eid if it is cached to disk, or None otherwise.
+    The codec is one of the codecs in nflgame.archive.
+    """
+    archive = _get_archive()
+    if archive and eid in archive:
+        return archive.read_raw(eid)
+
+    fpath = _jsonf % eid
+    if os.access(fpath, os.R_OK):
+        with open(fpath, 'rb') as fp:
+            return fp.read(), nflgame.archive.CODEC_GZIP
+    return None
+
+
 def _get_json_data(eid=None, fpath=None):
     """
     Returns the JSON data corresponding to the game represented by eid.
 
     If the JSON data is already on disk, it is read, decompressed and returned.
+    The archive is checked first, then the loose files in gamecenter-json.
 
     Otherwise, the JSON data is downloaded from the NFL web site. If the data
     doesn't exist yet or there was an error, _get_json_data returns None.
@@ -824,9 +1316,9 @@ def _get_json_data(eid=None, fpath=None):
     if fpath is not None:
         return gzip.open(fpath).read()
 
-    fpath = _jsonf % eid
-    if os.access(fpath, os.R_OK):
-        return gzip.open(fpath).read()
+    source = _get_json_source(eid)
+    if source is not None:
+        return nflgame.archive.decompress(*source)
     try:
         return urllib.request.urlopen(_json_base_url % (eid, eid), timeout=5).read()
     except urllib.error.HTTPError:
@@ -836,6 +1328,117 @@ def _get_json_data(eid=None, fpath=None):
     return None
 
 
+def _fetch(eid=None, fpath=None):
+    """
+    Does all of the I/O needed to create the game represented by eid (or
+    stored in the file at fpath), which is safe to do from any thread.
+
+    Returns a tuple (digest, rawData, cached). If the game is in the cache
+    of parsed games, or its data was downloaded before and hasn't changed,
+    cached is that game. Otherwise, rawData is its JSON data, or None if
+    there isn't any. When the cache is enabled and the game is on disk,
+    digest is the checksum that the game is cached under.
+    """
+    digest, source = None, None
+    if eid is not None and fpath is None:
+        source = _get_json_source(eid)
+        if source is None:
+            try:
+                return _download(eid)
+            except urllib.error.URLError:
+                return None, None, None
+
+        # Games that are cached to disk may also be in the cache of parsed
+        # games, keyed by a checksum of their still-compressed data.
+        if nflgame.cache.directory is not None:
+            digest = nflgame.cache.checksum(source[0])
+            cached = nflgame.cache.load(eid, digest)
+            if isinstance(cached, Game):
+                return digest, None, cached
+
+    try:
+        if source is not None:
+            rawData = nflgame.archive.decompress(*source)
+        else:
+            rawData = _get_json_data(eid, fpath)
+    except urllib.error.URLError:
+        rawData = None
+    return digest, rawData, None
+
+
+class _Feed (object):
+    """
+    The validators (ETag and Last-Modified headers) and checksum of the
+    JSON data of a game that was last downloaded from NFL.com, along with
+    the game that was created from it.
+    """
+    def __init__(self, etag, modified, digest):
+        self.etag = etag
+        self.modified = modified
+        self.digest = digest
+        self.game = None
+
+
+def _download(eid, session=None, timeout=5):
+    """
+    Downloads the JSON data of the game represented by eid from NFL.com and
+    returns it like `_fetch` does.
+
+    If the game was downloaded before, the request is conditional on the
+    data having changed. When it hasn't (NFL.com answers 304 Not Modified
+    or sends the same bytes again), the game created from the last download
+    is returned as the cached game, so that it isn't parsed again.
+
+    The request is made with urllib, unless session is a requests.Session.
+    """
+    feed = _feeds.get(eid)
+    if feed is not None and feed.game is None:
+        feed = None
+    headers = {}
+    if feed is not None:
+        if feed.etag:
+            headers['If-None-Match'] = feed.etag
+        if feed.modified:
+            headers['If-Modified-Since'] = feed.modified
+
+    url = _json_base_url % (eid, eid)
+    if session is None:
+        status, info, content = _urlopen(url, headers, timeout)
+    else:
+        resp = session.get(url, headers=headers, timeout=timeout)
+        status, info, content = resp.status_code, resp.headers, resp.content
+
+    if status == 304 and feed is not None:
+        return None, None, feed.game
+    if status != 200 or not content:
+        return None, None, None
+
+    digest = nflgame.cache.checksum(content)
+    etag, modified = info.get('ETag'), info.get('Last-Modified')
+    if feed is not None and feed.digest == digest:
+        feed.etag, feed.modified = etag, modified
+        return None, None, feed.game
+    _feeds[eid] = _Feed(etag, modified, digest)
+    return None, content, None
+
+
+def _urlopen(url, headers, timeout):
+    """
+    Makes a GET request with urllib and returns a tuple of the status code,
+    the response headers and the body. The body is None if the request
+    failed with an HTTP error, and the status code is None too if it timed
+    out or failed to connect or read.
+    """
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, None
+    except (socket.timeout, OSError):
+        return None, {}, None
+
+
 def _tryint(v):
     """
     Tries to convert v to an integer. If it fails, return 0.
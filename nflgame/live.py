@@ -30,6 +30,17 @@ mode.
 With this strategy, if the live module is working properly, you could
 theoretically keep it running for the entire season.
 
+There are two engines that implement this: `run`, which fetches the data
+of each active game one after the other, and `arun`, a coroutine for
+asyncio that fetches the data of all active games concurrently over a pool
+of keep-alive connections. The latter requires the third party library
+requests, which can be downloaded from PyPI:
+http://pypi.python.org/pypi/requests/
+
+Both engines refresh the schedule (see `nflgame.sched.refresh`) when they
+start and whenever they check what the current week is, so that new weeks
+and games are picked up while they run.
+
 (N.B. Half-time is ignored. Games are either being actively played or not.)
 
 Alpha status
@@ -39,6 +50,8 @@ the regular season, but the postseason brings new challenges. Moreover, it
 will probably affect the API at least a little bit.
 """
 import datetime
+import inspect
+import sys
 import time
 import math
 
@@ -190,6 +203,7 @@ def run(callback, active_interval=15, inactive_interval=900, stop=None):
     The stop value is compared against datetime.datetime.now().
     """
     active = False
+    _refresh_schedule()
     last_week_check = _update_week_number()
 
     # Before we start with the main loop, we make a first pass at what we
@@ -213,6 +227,7 @@ def run(callback, active_interval=15, inactive_interval=900, stop=None):
             return
 
         if time.time() - last_week_check > _WEEK_INTERVAL:
+            _refresh_schedule()
             last_week_check = _update_week_number()
 
         games = _active_games(inactive_interval)
@@ -228,6 +243,94 @@ def run(callback, active_interval=15, inactive_interval=900, stop=None):
             time.sleep(inactive_interval)
 
 
+async def arun(callback, active_interval=15, inactive_interval=900,
+               stop=None, timeout=5, connections=16, session=None):
+    """
+    A coroutine that does exactly what `run` does, except that every time
+    the active games are checked, the data of all of them is fetched from
+    NFL.com concurrently.
+
+    callback is called with the same three lists as in `run`. It may be
+    either a plain function or a coroutine function, in which case it is
+    awaited.
+
+    Each request for the data of a game is given timeout seconds to
+    complete. A game whose data couldn't be fetched in time is skipped, as
+    if its data wasn't available yet, and is tried again on the next check.
+
+    At most connections requests are made at the same time, over a pool of
+    as many keep-alive connections to NFL.com. If session is not None, it
+    must be a requests.Session, which is used instead of creating one.
+
+    For example:
+
+        #!python
+        import asyncio
+        import nflgame.live
+
+        def cb(active, completed, diffs):
+            pass
+
+        asyncio.run(nflgame.live.arun(cb))
+    """
+    # asyncio is slow to import and only used here, so it isn't imported
+    # along with nflgame.
+    import asyncio
+    import concurrent.futures
+
+    if session is None:
+        session = _new_session(connections)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=connections)
+    loop = asyncio.get_running_loop()
+    try:
+        active = False
+        # Refreshing the schedule may wait on NFL.com for a while.
+        await loop.run_in_executor(executor, _refresh_schedule)
+        last_week_check = _update_week_number()
+
+        # See run for this first pass at the active games.
+        eids = [info['eid'] for info in _active_games(inactive_interval)]
+        for game in await _afetch_games(eids, session, executor, timeout):
+            if game is not None and game.game_over():
+                _completed.append(game.eid)
+
+        while True:
+            if stop is not None and datetime.datetime.now() > stop:
+                return
+
+            if time.time() - last_week_check > _WEEK_INTERVAL:
+                await loop.run_in_executor(executor, _refresh_schedule)
+                last_week_check = _update_week_number()
+
+            games = _active_games(inactive_interval)
+            if active:
+                active = await _arun_active(callback, games, session,
+                                            executor, timeout)
+                if not active:
+                    continue
+                await asyncio.sleep(active_interval)
+            else:
+                active = not _run_inactive(games)
+                if active:
+                    continue
+                await asyncio.sleep(inactive_interval)
+    finally:
+        executor.shutdown(wait=False)
+        session.close()
+
+
+def _refresh_schedule():
+    """
+    Refreshes the schedule if it's more than a day old. Errors are printed
+    to stderr and otherwise ignored, since the schedule is refreshed again
+    at the next week check.
+    """
+    try:
+        nflgame.sched.refresh()
+    except Exception as e:
+        print('Could not refresh the schedule: %s' % e, file=sys.stderr)
+
+
 def _run_active(callback, games):
     """
     The active mode traverses each of the active games and fetches info for
@@ -240,17 +343,41 @@ def _run_active(callback, games):
     list if it has finished. In the latter case, it is added to a global store
     of completed games and will never be passed to callback again.
     """
-    global _last
-
     # There are no active games, so just quit and return False. Which means
     # we'll transition to inactive mode.
     if len(games) == 0:
         return False
 
-    active, completed = [], []
-    for info in games:
-        game = nflgame.game.Game(info['eid'])
+    callback(*_sort_active([nflgame.game.Game(info['eid']) for info in games]))
+    return True
+
+
+async def _arun_active(callback, games, session, executor, timeout):
+    """
+    The same as _run_active, except that the active games are fetched
+    concurrently and callback may be a coroutine function.
+    """
+    if len(games) == 0:
+        return False
+
+    eids = [info['eid'] for info in games]
+    fetched = await _afetch_games(eids, session, executor, timeout)
+    result = callback(*_sort_active(fetched))
+    if inspect.isawaitable(result):
+        await result
+    return True
 
+
+def _sort_active(games):
+    """
+    Splits the freshly fetched games into active and completed games and
+    diffs them with the last iteration of games. Returns a tuple of the
+    active, completed and diffs lists that are passed to callback.
+    """
+    global _last
+
+    active, completed = [], []
+    for game in games:
         # If no JSON was retrieved, then we're probably just a little early.
         # So just ignore it for now---but we'll keep trying!
         if game is None:
@@ -259,7 +386,7 @@ def _run_active(callback, games):
         # If the game is over, added it to completed and _completed.
         if game.game_over():
             completed.append(game)
-            _completed.append(info['eid'])
+            _completed.append(game.eid)
         else:
             active.append(game)
 
@@ -273,8 +400,68 @@ def _run_active(callback, games):
             diffs.append(game - last_game)
 
     _last = active
-    callback(active, completed, diffs)
-    return True
+    return active, completed, diffs
+
+
+def _new_session(connections):
+    """
+    Returns a requests.Session that keeps up to connections connections to
+    NFL.com alive.
+    """
+    # requests is slow to import and only used by arun, so it isn't
+    # imported along with nflgame.
+    import requests
+    import requests.adapters
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                            pool_maxsize=connections)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+async def _afetch_games(eids, session, executor, timeout):
+    """
+    Fetches the games with identifiers in eids concurrently and returns
+    them in the same order. A game that couldn't be fetched is None.
+    """
+    import asyncio
+    return await asyncio.gather(
+        *[_afetch_game(eid, session, executor, timeout) for eid in eids])
+
+
+async def _afetch_game(eid, session, executor, timeout):
+    """
+    Fetches the game with the given eid, reading it from disk if it's
+    there and from NFL.com otherwise. The blocking I/O is done in executor.
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    if nflgame.game._has_json(eid):
+        fetched = await loop.run_in_executor(
+            executor, nflgame.game._fetch, eid)
+    else:
+        download = loop.run_in_executor(
+            executor, _session_download, session, eid, timeout)
+        try:
+            fetched = await asyncio.wait_for(download, timeout)
+        except asyncio.TimeoutError:
+            return None
+    return nflgame.game.Game(eid, fetched=fetched)
+
+
+def _session_download(session, eid, timeout):
+    """
+    Downloads the JSON data of the game with the given eid with session,
+    unless it hasn't changed since the last time. See
+    `nflgame.game._download`.
+    """
+    import requests
+    try:
+        return nflgame.game._download(eid, session, timeout)
+    except requests.RequestException:
+        return None, None, None
 
 
 def _run_inactive(games):
@@ -0,0 +1,219 @@
+"""
+The matrix module provides StatMatrix, a dense NumPy view of the
+statistics of a sequence of players or plays. It is created with the
+`to_matrix` method of nflgame.seq.GenPlayerStats or nflgame.seq.GenPlays:
+
+    #!python
+    import nflgame
+
+    games = nflgame.games(2013, week=1)
+    m = nflgame.combine_game_stats(games).to_matrix()
+    rushers = m.filter(rushing_att__ge=10).sort('rushing_yds').limit(5)
+    for p, yds in zip(rushers.items, rushers.column('rushing_yds')):
+        print(p, yds)
+
+Every statistical field in nflgame.statmap is a column of the matrix, so
+filtering, sorting, summing and grouping are done on whole columns at once
+instead of calling getattr on every player or play. Statistics that a
+player or play doesn't have are 0.
+
+It requires the third party library NumPy to be installed, which can be
+done with `pip install nflgame-redux[numpy]`.
+"""
+import operator
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+from nflgame import statmap
+
+_OPS = {
+    '__lt': operator.lt,
+    '__le': operator.le,
+    '__ne': operator.ne,
+    '__ge': operator.ge,
+    '__gt': operator.gt,
+    '__in': lambda col, values: np.isin(col, list(values)),
+    '__between': lambda col, bounds: (col >= bounds[0]) & (col <= bounds[1]),
+    '__contains': lambda col, s: np.char.find(col.astype(str), s) >= 0,
+}
+"""
+The suffixes that StatMatrix.filter and nflgame.columnar.StorePlays.filter
+understand, like the ones of nflgame.seq.Gen.filter. Each is applied to an
+entire column at once.
+"""
+
+
+class StatMatrix (object):
+    """
+    StatMatrix is a dense 2-D array of statistics with one row per player
+    or play and one column per statistical field, along with the player
+    (or play) id, team and home columns.
+
+    Its operations return new matrices and never modify this one.
+    """
+    def __init__(self, items, values, fields, ids, teams, home):
+        self.items = items
+        """The players or plays of each row, in order."""
+
+        self.values = values
+        """The 2-D float64 array of statistics."""
+
+        self.fields = fields
+        """The name of the statistical field of each column of values."""
+
+        self.ids = ids
+        """The player id, or play id, of each row."""
+
+        self.teams = teams
+        """The team of each row."""
+
+        self.home = home
+        """Whether each row is for the home team (None if unknown)."""
+
+        self._index = dict((f, i) for i, f in enumerate(fields))
+
+    @classmethod
+    def from_items(cls, items, id_field):
+        """
+        Builds a matrix from a list of players or plays, using the
+        attribute id_field of each as its id.
+        """
+        items = list(items)
+        fields = list(statmap.fields)
+        index = dict((f, i) for i, f in enumerate(fields))
+        for item in items:
+            for f in item._stats:
+                if f not in index:
+                    index[f] = len(fields)
+                    fields.append(f)
+
+        values = np.zeros((len(items), len(fields)), dtype=np.float64)
+        for row, item in enumerate(items):
+            for f, v in item._stats.items():
+                values[row, index[f]] = v
+        ids = np.array([getattr(item, id_field) for item in items],
+                       dtype=object)
+        teams = np.array([item.team for item in items], dtype=object)
+        home = np.array([getattr(item, 'home', None) for item in items],
+                        dtype=object)
+        return cls(items, values, tuple(fields), ids, teams, home)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def column(self, name):
+        """
+        Returns the column with the given name, which is either a
+        statistical field or one of id, team and home. A KeyError is
+        raised for any other name.
+        """
+        if name == 'id':
+            return self.ids
+        if name == 'team':
+            return self.teams
+        if name == 'home':
+            return self.home
+        if name not in self._index:
+            raise KeyError('StatMatrix has no column "%s".' % name)
+        return self.values[:, self._index[name]]
+
+    def take(self, rows):
+        """
+        Returns a matrix of the given rows, which is either an array of
+        row numbers or a boolean mask.
+        """
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return StatMatrix([self.items[i] for i in rows], self.values[rows],
+                          self.fields, self.ids[rows], self.teams[rows],
+                          self.home[rows])
+
+    def filter(self, **kwargs):
+        """
+        Filters the rows of the matrix just like nflgame.seq.Gen.filter,
+        including the __lt, __le, __ne, __ge, __gt, __in, __between and
+        __contains suffixes. If the value of a criterion is a function, it
+        is called once with an entire column and must return a boolean
+        array.
+
+        A ValueError is raised for any other suffix, and a KeyError for a
+        field that isn't a column (see `column`).
+        """
+        mask = np.ones(len(self.items), dtype=bool)
+        for field, value in kwargs.items():
+            op = operator.eq
+            for suffix, f in _OPS.items():
+                if field.endswith(suffix):
+                    field, op = field[:-len(suffix)], f
+                    break
+            else:
+                if '__' in field:
+                    raise ValueError('Unknown filter operator "__%s".'
+                                     % field.rsplit('__', 1)[1])
+            col = self.column(field)
+            if callable(value):
+                mask &= np.asarray(value(col), dtype=bool)
+            else:
+                mask &= np.asarray(op(col, value), dtype=bool)
+        return self.take(mask)
+
+    def sort(self, field, descending=True):
+        """
+        Sorts the rows of the matrix by field, or by a list of fields like
+        nflgame.seq.Gen.sort. The sort is stable.
+        """
+        fields = [field] if isinstance(field, str) else list(field)
+        cols = [_sort_key(self.column(f), descending) for f in fields]
+        # lexsort sorts by the last key first.
+        return self.take(np.lexsort(cols[::-1]))
+
+    def limit(self, n):
+        """Returns a matrix of the first n rows."""
+        return self.take(np.arange(min(n, len(self.items))))
+
+    def sum(self, field=None):
+        """
+        Returns the sum of the given statistical field over every row, or
+        if field is None, an OrderedDict of every field to its sum.
+        """
+        if field is not None:
+            return self.column(field).sum()
+        return OrderedDict(zip(self.fields, self.values.sum(axis=0)))
+
+    def groupby(self, field):
+        """
+        Groups the rows of the matrix by the value of field (e.g., 'team'
+        or 'id'). Returns an OrderedDict of each value, in order of first
+        appearance, to the matrix of its rows.
+        """
+        col = self.column(field)
+        if len(col) == 0:
+            return OrderedDict()
+        keys, first, inverse = np.unique(col.astype(str), return_index=True,
+                                         return_inverse=True)
+        rows = np.argsort(inverse, kind='stable')
+        groups = np.split(rows, np.cumsum(np.bincount(inverse))[:-1])
+        result = OrderedDict()
+        for g in np.argsort(first, kind='stable'):
+            result[col[first[g]]] = self.take(groups[g])
+        return result
+
+
+def _sort_key(col, descending):
+    """
+    Returns a numeric key that sorts col in the given order. Since the sort
+    is stable, rows with equal values keep their original order either way.
+    """
+    if col.dtype == object:
+        _, col = np.unique(col.astype(str), return_inverse=True)
+    elif col.dtype.kind in 'bu':
+        col = col.astype(np.int64)
+    return -col if descending else col
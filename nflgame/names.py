@@ -0,0 +1,241 @@
+"""
+The names module indexes the names of every player in nflgame.players, so
+that nflgame.find can look players up by exact name, by GSIS-style
+abbreviation (e.g., "T.Brady"), by prefix or by approximate name without
+comparing against every player.
+
+The index is built the first time it is needed and then shared by every
+search, until nflgame.players is replaced:
+
+    #!python
+    import nflgame
+
+    nflgame.find('Tom Brady')
+    nflgame.find('T.Brady')
+    nflgame.find('tom br', prefix=True)
+    nflgame.find('Tom Bradey', max_edits=2)
+"""
+import bisect
+import threading
+
+import nflgame
+import nflgame.playertable
+
+_FIELDS = ('full_name', 'gsis_name', 'first_name', 'last_name', 'team')
+"""The fields of each player that the index is built from."""
+
+
+def normalize(name):
+    """
+    Returns name lowercased and with runs of whitespace replaced by a
+    single space, which is the form names are indexed in for prefix and
+    approximate searches.
+    """
+    return ' '.join(name.lower().split())
+
+
+def abbreviation(first_name, last_name):
+    """
+    Returns the GSIS-style abbreviation of a name, e.g., "T.Brady" for
+    Tom Brady, or None if either part of the name is missing.
+    """
+    if not first_name or not last_name:
+        return None
+    return '%s.%s' % (first_name[0], last_name.replace(' ', ''))
+
+
+class NameIndex (object):
+    """
+    NameIndex maps the names of a set of players to their GSIS ids. Players
+    are identified by their position in the index, which follows the order
+    of the mapping it was built from, so results come out in that order.
+    """
+    def __init__(self, players):
+        """
+        Builds an index of players, a mapping of GSIS id to
+        nflgame.player.Player.
+        """
+        self.players = players
+        self.ids = []
+        self.teams = []
+        self.names = []
+        self.exact = {}
+        self.abbrevs = {}
+        self.grams = {}
+        for i, (playerid, full, gsis, first, last, team) in \
+                enumerate(_rows(players)):
+            self.ids.append(playerid)
+            self.teams.append(team.lower())
+            norm = normalize(full)
+            self.names.append(norm)
+            self.exact.setdefault(full.lower(), []).append(i)
+            keys = set([gsis.lower()])
+            abbrev = abbreviation(first, last)
+            if abbrev is not None:
+                keys.add(abbrev.lower())
+            keys.discard('')
+            for key in keys:
+                self.abbrevs.setdefault(key, []).append(i)
+            lengths = self.grams.setdefault(len(norm), {})
+            for gram in _bigrams(norm):
+                lengths.setdefault(gram, []).append(i)
+        self.sorted = sorted((norm, i) for i, norm in enumerate(self.names))
+
+    def search(self, name, team=None, prefix=False, max_edits=0):
+        """
+        Returns the GSIS ids of the players matching name, as described by
+        nflgame.find.
+        """
+        if prefix:
+            found = self._prefix(normalize(name))
+        elif max_edits > 0:
+            found = self._fuzzy(normalize(name), max_edits)
+        else:
+            key = name.lower()
+            found = self.exact.get(key) or self.abbrevs.get(key, [])
+        if team is not None:
+            team = team.lower()
+            found = [i for i in found if self.teams[i] == team]
+        return [self.ids[i] for i in found]
+
+    def _prefix(self, prefix):
+        found = []
+        for norm, i in self.sorted[bisect.bisect_left(self.sorted,
+                                                      (prefix, -1)):]:
+            if not norm.startswith(prefix):
+                break
+            found.append(i)
+        return sorted(found)
+
+    def _fuzzy(self, name, k):
+        """
+        Returns the players whose normalized name is at most k edits away
+        from name, closest first.
+
+        Candidates are found with the q-gram lemma: a single edit changes
+        at most two of the bigrams of a padded name, so a name within k
+        edits is missing at most 2k of the bigrams of name. It must
+        therefore share at least one of the rarest bigrams of name that
+        occur more than 2k times between them, and only the names
+        containing those are compared with name. Only names whose length
+        is within k of name's are considered.
+        """
+        lengths = [self.grams[n] for n in
+                   range(max(0, len(name) - k), len(name) + k + 1)
+                   if n in self.grams]
+        qgrams = _bigrams(name)
+        if sum(qgrams.values()) <= 2 * k:
+            candidates = set(i for postings in lengths
+                             for ids in postings.values() for i in ids)
+        else:
+            def rarity(gram):
+                return sum(len(postings.get(gram, ())) for postings in lengths)
+            candidates, missing = set(), 0
+            for gram in sorted(qgrams, key=rarity):
+                for postings in lengths:
+                    candidates.update(postings.get(gram, ()))
+                missing += qgrams[gram]
+                if missing > 2 * k:
+                    break
+
+        grams = list(qgrams.items())
+        found = []
+        for i in candidates:
+            norm = self.names[i]
+            if _too_different(grams, '\x02%s\x03' % norm, k):
+                continue
+            d = _edits(name, norm, k)
+            if d <= k:
+                found.append((d, i))
+        return [i for _, i in sorted(found)]
+
+
+def _rows(players):
+    """
+    Yields (playerid, full name, gsis name, first name, last name, team)
+    of every player in players, without building the Player objects of a
+    player table.
+    """
+    if isinstance(players, nflgame.playertable.PlayerTable):
+        for row in players.rows(_FIELDS):
+            yield row
+        return
+    for playerid, p in players.items():
+        yield (playerid, p.full_name, p.gsis_name, p.first_name,
+               p.last_name, p.team)
+
+
+def _bigrams(name):
+    """
+    Returns a dict of every distinct bigram of name, padded at both ends,
+    to the number of times it occurs.
+    """
+    padded = '\x02%s\x03' % name
+    grams = {}
+    for j in range(len(padded) - 1):
+        g = padded[j:j + 2]
+        grams[g] = grams.get(g, 0) + 1
+    return grams
+
+
+def _too_different(grams, padded, k):
+    """
+    Returns True if padded is missing more than 2k of the bigrams in grams,
+    from _bigrams, and so can't be within k edits. A bigram of one repeated
+    character always counts as shared, since str.count doesn't count
+    overlapping occurrences of it.
+    """
+    missing = 0
+    for g, qn in grams:
+        if g[0] != g[1]:
+            n = padded.count(g)
+            if n < qn:
+                missing += qn - n
+                if missing > 2 * k:
+                    return True
+    return False
+
+
+def _edits(a, b, k):
+    """
+    Returns the Levenshtein distance between a and b, or k + 1 if it's
+    more than k. Only a band of width 2k + 1 around the diagonal is
+    computed.
+    """
+    if abs(len(a) - len(b)) > k:
+        return k + 1
+    inf = k + 1
+    prev = [j if j <= k else inf for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [inf] * (len(b) + 1)
+        if i <= k:
+            cur[0] = i
+        lo, hi = max(1, i - k), min(len(b), i + k)
+        best = cur[0]
+        for j in range(lo, hi + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            cur[j] = v if v < inf else inf
+            if v < best:
+                best = v
+        if best > k:
+            return inf
+        prev = cur
+    return min(prev[len(b)], inf)
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def index():
+    """
+    Returns the NameIndex of nflgame.players, building it the first time
+    and again whenever nflgame.players has been replaced.
+    """
+    global _index
+    players = nflgame.players
+    with _lock:
+        if _index is None or _index.players is not players:
+            _index = NameIndex(players)
+        return _index
@@ -2,7 +2,6 @@
 
 import json
 import os.path
-from collections import OrderedDict
 
 import nflgame.seq
 import nflgame.statmap
@@ -14,7 +13,16 @@ def _create_players(jsonf=None):
     """
     Creates a dict of Player objects from the players.json file, keyed
     by GSIS ids.
+
+    If a player table built from the same file exists, a
+    nflgame.playertable.PlayerTable is returned instead. It is a read-only
+    mapping that builds each Player the first time it's looked up.
     """
+    import nflgame.playertable
+    table = nflgame.playertable.load(jsonf)
+    if table is not None:
+        return table
+
     if jsonf is None:
         jsonf = _player_json_file
     try:
@@ -96,7 +104,63 @@ class PlayerDefense (Player):
         return '%s Defense' % self.team
 
 
-class PlayerStats (object):
+_UNRESOLVED = object()
+
+
+class _StatVector (object):
+    """
+    _StatVector keeps statistics in the instance dict, as field name to
+    value in the order they were first added, so that reading a statistic
+    is a plain attribute lookup. Everything else about an instance must be
+    in __slots__, so that its dict holds nothing but statistics. It is
+    shared by PlayerStats and nflgame.game.Play.
+    """
+    __slots__ = ('__dict__',)
+
+    @property
+    def _stats(self):
+        """The dict of every statistic, which is the instance dict."""
+        return self.__dict__
+
+    def _items(self):
+        """Returns every (field, value) pair, in order."""
+        return self.__dict__.items()
+
+    def _get(self, field, default=None):
+        """
+        Returns the value of the statistical field, or default if there
+        isn't one.
+        """
+        return self.__dict__.get(field, default)
+
+    def _add_stats(self, stats):
+        mine = self.__dict__
+        for k, v in stats.items():
+            mine[k] = mine.get(k, 0) + v
+
+    def _merge(self, other, overwrite=False):
+        """
+        Adds every statistic of other to this one, or if overwrite is True,
+        replaces this one's value of each with other's.
+        """
+        if overwrite:
+            self.__dict__.update(other.__dict__)
+        else:
+            self._add_stats(other.__dict__)
+
+    def _overwrite_stats(self, stats):
+        self.__dict__.update(stats)
+
+    def _stat_state(self):
+        """Returns the statistics as a list of (field, value) pairs."""
+        return list(self.__dict__.items())
+
+    def _set_stat_state(self, stats):
+        self.__dict__.clear()
+        self.__dict__.update(stats)
+
+
+class PlayerStats (_StatVector):
     """
     Player represents a single player and all of his statistical categories.
     Every player has 'playerid', 'name' and 'home' fields.
@@ -111,11 +175,16 @@ class PlayerStats (object):
     GenPlayerStats.)
 
     You may also inspect whether a player has a certain property by using
-    the special __dict__ attribute. For example::
+    the stats attribute. For example::
 
-        if 'passing_yds' in player.__dict__:
+        if 'passing_yds' in player.stats:
             # Do something with player.passing_yds
+
+    The statistics are the only entries of the instance dict, in the order
+    they were added. Everything else is in __slots__.
     """
+    __slots__ = ('playerid', 'name', 'home', 'team', '_player')
+
     def __init__(self, playerid, name, home, team):
         """
         Create a new Player instance with the player id (from NFL.com's
@@ -126,14 +195,43 @@ class PlayerStats (object):
         self.name = name
         self.home = home
         self.team = team
-        self._stats = OrderedDict()
+        self._player = _UNRESOLVED
+        super(PlayerStats, self).__init__()
 
-        self.player = None
-        if self.playerid in nflgame.players:
-            self.player = nflgame.players[self.playerid]
+    @property
+    def player(self):
+        """
+        The nflgame.player.Player meta data of this player, or None if
+        there isn't any. It is looked up the first time it is used.
+        """
+        if self._player is _UNRESOLVED:
+            self._player = nflgame.players.get(self.playerid, None)
+        return self._player
+
+    @player.setter
+    def player(self, player):
+        self._player = player
+
+    def __getstate__(self):
+        # Player meta is looked up again when unpickling instead of being
+        # copied into every pickled instance.
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if name not in ('__dict__', '_player'):
+                    state[name] = getattr(self, name)
+        state['_stats'] = self._stat_state()
+        return state
+
+    def __setstate__(self, state):
+        stats = state.pop('_stats')
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._set_stat_state(stats)
+        self._player = _UNRESOLVED
 
     def has_cat(self, cat):
-        for f in self._stats:
+        for f, _ in self._items():
             if f.startswith(cat):
                 return True
         return False
@@ -176,7 +274,7 @@ class PlayerStats (object):
         all statistical categories.
         """
         n = 0
-        for f, v in self.__dict__.items():
+        for f, v in self._items():
             if f.endswith('tds'):
                 n += v
         return n
@@ -216,27 +314,17 @@ class PlayerStats (object):
         """
         Returns a dict of all stats for the player.
         """
-        return self._stats
+        return self.__dict__
 
     def formatted_stats(self):
         """
         Returns a roughly-formatted string of all statistics for this player.
         """
         s = []
-        for stat, val in self._stats.items():
+        for stat, val in self._items():
             s.append('%s: %s' % (stat, val))
         return ', '.join(s)
 
-    def _add_stats(self, stats):
-        for k, v in stats.items():
-            self.__dict__[k] = self.__dict__.get(k, 0) + v
-            self._stats[k] = self.__dict__[k]
-
-    def _overwrite_stats(self, stats):
-        for k, v in stats.items():
-            self.__dict__[k] = v
-            self._stats[k] = self.__dict__[k]
-
     def __str__(self):
         """
         Simply returns the player's name, e.g., "T.Brady".
@@ -265,8 +353,8 @@ class PlayerStats (object):
         else:
             home = self.home
         new_player = self.__class__(self.playerid, self.name, home, self.team)
-        new_player._add_stats(self._stats)
-        new_player._add_stats(other._stats)
+        new_player.__dict__.update(self.__dict__)
+        new_player._merge(other)
 
         return new_player
 
@@ -276,19 +364,18 @@ class PlayerStats (object):
 
         new_player = GamePlayerStats(self.playerid,
                                      self.name, self.home, self.team)
-        new_player._add_stats(self._stats)
-        for bk, bv in other._stats.items():
-            if bk not in new_player._stats:  # stat was taken away? ignore.
+        stats = new_player.__dict__
+        stats.update(self.__dict__)
+        for bk, bv in other.__dict__.items():
+            if bk not in stats:  # stat was taken away? ignore.
                 continue
 
-            new_player._stats[bk] -= bv
-            if new_player._stats[bk] == 0:
-                del new_player._stats[bk]
-            else:
-                new_player.__dict__[bk] = new_player._stats[bk]
+            stats[bk] -= bv
+            if stats[bk] == 0:
+                del stats[bk]
 
         anydiffs = False
-        for k, v in new_player._stats.items():
+        for v in stats.values():
             if v > 0:
                 anydiffs = True
                 break
@@ -297,12 +384,13 @@ class PlayerStats (object):
         return new_player
 
     def __getattr__(self, name):
-        # If name has one of the categories as a prefix, then return
-        # a default value of zero
+        # Only called when name isn't a statistic of this player. If name
+        # has one of the categories as a prefix, return a default value of
+        # zero.
         for cat in nflgame.statmap.categories:
             if name.startswith(cat):
                 return 0
-        raise AttributeError
+        raise AttributeError(name)
 
     def passer_rating(self):
         """
@@ -332,6 +420,8 @@ class PlayerStats (object):
 
 
 class GamePlayerStats (PlayerStats):
+    __slots__ = ('games',)
+
     def __init__(self, playerid, name, home, team):
         super(GamePlayerStats, self).__init__(playerid, name, home, team)
         self.games = 1
@@ -343,4 +433,4 @@ class GamePlayerStats (PlayerStats):
 
 
 class PlayPlayerStats (PlayerStats):
-    pass
+    __slots__ = ()
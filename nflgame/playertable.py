@@ -0,0 +1,255 @@
+"""
+The playertable module stores the player meta data in `players.json` as a
+compact binary table. Opening a table costs next to nothing: the file is
+memory-mapped, and a nflgame.player.Player is only built the first time
+its GSIS id is looked up. Processes that open the same table share its
+pages, instead of each parsing the JSON file and holding thousands of
+Player objects.
+
+nflgame.players is read from the table next to `players.json` whenever it
+exists and was built from the current contents of `players.json`. The
+table is written by `nflgame-update-players` every time it updates the
+players, and can be rebuilt from `players.json` alone with:
+
+    #!python
+    import nflgame.playertable
+
+    nflgame.playertable.write()
+
+The layout of a table is a fixed size header, followed by a fixed size
+record for each player, sorted by GSIS id, and then a table of every
+distinct string. The header records the CRC-32 of the JSON data the table
+was built from, so a table is never used with a `players.json` that has
+changed since.
+"""
+import json
+import mmap
+import os
+import os.path as path
+import struct
+import tempfile
+import zlib
+from collections.abc import Mapping
+
+import nflgame.player
+
+_MAGIC = b'NFLGPLY1'
+
+_header = struct.Struct('<8sIIQI')
+"""
+Magic bytes, the CRC-32 of the JSON data, the number of players, and the
+offset and number of entries of the string table.
+"""
+
+_STRINGS = ('gsis_name', 'full_name', 'first_name', 'last_name', 'team',
+            'position', 'profile_url', 'birthdate', 'college', 'status')
+"""The fields of a player that are stored in the string table."""
+
+_INTS = ('profile_id', 'number', 'height', 'weight', 'years_pro')
+"""The fields of a player that are stored as integers."""
+
+_record = struct.Struct('<10s%dI%di' % (len(_STRINGS), len(_INTS)))
+"""
+A player: GSIS id, the string table index of each field in _STRINGS and
+the value of each field in _INTS.
+"""
+
+_NO_STRING = 0xFFFFFFFF
+"""The string table index of a field a player doesn't have."""
+
+_NO_INT = -2 ** 31
+"""The value of an integer field a player doesn't have."""
+
+_end = struct.Struct('<I')
+"""An entry of the string table: the end offset of a string."""
+
+
+def table_path(jsonf=None):
+    """
+    Returns the path of the table built from the JSON file jsonf, which
+    defaults to the `players.json` that comes with nflgame.
+    """
+    if jsonf is None:
+        jsonf = nflgame.player._player_json_file
+    return path.splitext(jsonf)[0] + '.tbl'
+
+
+class PlayerTable (Mapping):
+    """
+    PlayerTable is a read-only mapping of GSIS id to
+    nflgame.player.Player, backed by a memory-mapped table file. Each
+    Player is built the first time it is looked up.
+    """
+    def __init__(self, fpath):
+        """
+        Opens the table at fpath. Its header is checked, but nothing else is
+        read until players are looked up.
+        """
+        self.fpath = fpath
+        with open(fpath, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.crc, self._count, self._strings, nstrings = \
+            _header.unpack_from(self._mmap)
+        assert magic == _MAGIC, '"%s" is not an nflgame player table.' % fpath
+        self._blob = self._strings + nstrings * _end.size
+        self._players = {}
+
+    def _id(self, i):
+        off = _header.size + i * _record.size
+        return self._mmap[off:off + 10]
+
+    def _find(self, playerid):
+        """
+        Returns the record number of the player with the given GSIS id, or
+        None if there isn't one.
+        """
+        if not isinstance(playerid, str) or len(playerid) != 10:
+            return None
+        key = playerid.encode('ascii', 'replace')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._id(lo) == key:
+            return lo
+        return None
+
+    def _string(self, i):
+        start = 0 if i == 0 else _end.unpack_from(
+            self._mmap, self._strings + (i - 1) * _end.size)[0]
+        end = _end.unpack_from(self._mmap, self._strings + i * _end.size)[0]
+        return self._mmap[self._blob + start:self._blob + end].decode('utf-8')
+
+    def _player(self, i):
+        """Builds the Player of record number i."""
+        fields = _record.unpack_from(self._mmap,
+                                     _header.size + i * _record.size)
+        data = {'gsis_id': fields[0].decode('ascii')}
+        for name, s in zip(_STRINGS, fields[1:]):
+            if s != _NO_STRING:
+                data[name] = self._string(s)
+        for name, v in zip(_INTS, fields[1 + len(_STRINGS):]):
+            if v != _NO_INT:
+                data[name] = v
+        return nflgame.player.Player(data)
+
+    def rows(self, fields):
+        """
+        Yields the GSIS id and the given string fields of every player, in
+        order of GSIS id, without building any Player. Fields a player
+        doesn't have are the empty string.
+        """
+        cols = [1 + _STRINGS.index(f) for f in fields]
+        strings = {}
+        for i in range(self._count):
+            rec = _record.unpack_from(self._mmap,
+                                      _header.size + i * _record.size)
+            row = [rec[0].decode('ascii')]
+            for c in cols:
+                s = rec[c]
+                if s == _NO_STRING:
+                    row.append('')
+                    continue
+                v = strings.get(s)
+                if v is None:
+                    v = strings[s] = self._string(s)
+                row.append(v)
+            yield tuple(row)
+
+    def __getitem__(self, playerid):
+        p = self._players.get(playerid)
+        if p is None:
+            i = self._find(playerid)
+            if i is None:
+                raise KeyError(playerid)
+            p = self._players[playerid] = self._player(i)
+        return p
+
+    def __contains__(self, playerid):
+        return playerid in self._players or self._find(playerid) is not None
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._id(i).decode('ascii')
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._mmap.close()
+
+
+def load(jsonf=None):
+    """
+    Returns a PlayerTable of the table built from the JSON file jsonf, or
+    None if there is no table or it was built from other JSON data.
+    """
+    fpath = table_path(jsonf)
+    if jsonf is None:
+        jsonf = nflgame.player._player_json_file
+    try:
+        with open(jsonf, 'rb') as fp:
+            crc = zlib.crc32(fp.read())
+        table = PlayerTable(fpath)
+    except (IOError, OSError, ValueError, struct.error):
+        return None
+    if table.crc != crc:
+        table.close()
+        return None
+    return table
+
+
+def write(jsonf=None, fpath=None):
+    """
+    Builds a table of the players in the JSON file jsonf and writes it to
+    fpath. jsonf defaults to the `players.json` that comes with nflgame,
+    and fpath to `table_path(jsonf)`. Returns the number of players.
+    """
+    if jsonf is None:
+        jsonf = nflgame.player._player_json_file
+    if fpath is None:
+        fpath = table_path(jsonf)
+    with open(jsonf, 'rb') as fp:
+        raw = fp.read()
+    data = json.loads(raw.decode('utf-8'))
+
+    strings, index = [], {}
+
+    def intern(s):
+        i = index.get(s)
+        if i is None:
+            i = index[s] = len(strings)
+            strings.append(s.encode('utf-8'))
+        return i
+
+    records = []
+    for playerid in sorted(data):
+        info = data[playerid]
+        fields = [playerid.encode('ascii')]
+        for name in _STRINGS:
+            v = info.get(name)
+            fields.append(_NO_STRING if v is None else intern(str(v)))
+        for name in _INTS:
+            v = info.get(name)
+            fields.append(_NO_INT if v is None else int(v))
+        records.append(_record.pack(*fields))
+
+    offset = _header.size + len(records) * _record.size
+    ends, end = [], 0
+    for s in strings:
+        end += len(s)
+        ends.append(_end.pack(end))
+
+    fd, tmp = tempfile.mkstemp(dir=path.dirname(path.abspath(fpath)),
+                               suffix='.tmp')
+    with os.fdopen(fd, 'wb') as fp:
+        fp.write(_header.pack(_MAGIC, zlib.crc32(raw), len(records),
+                              offset, len(strings)))
+        fp.write(b''.join(records))
+        fp.write(b''.join(ends))
+        fp.write(b''.join(strings))
+    os.replace(tmp, fpath)
+    return len(records)
@@ -2,11 +2,25 @@ from collections import OrderedDict
 import datetime
 import json
 import os.path
+import sys
+import threading
 
 __pdoc__ = {}
 
 _sched_json_file = os.path.join(os.path.dirname(__file__), 'schedule.json')
 
+_lock = threading.Lock()
+"""Guards loading and swapping games and last_updated."""
+
+_refresh_lock = threading.Lock()
+"""Makes sure only one refresh runs at a time."""
+
+_version = 0
+"""
+Incremented every time the schedule changes (see `_changed`), so that its
+index is rebuilt even when the schedule was edited in place.
+"""
+
 
 def calc_desired_weeks(year, phase):
     desired_weeks = []
@@ -55,8 +69,9 @@ def _create_schedule(jsonf=None):
     started. Keys in the dictionary are GSIS ids and values are
     dictionaries with the following keys: week, month, year, home,
     away, wday, gamekey, season_type, time.
+
+    The file is only read. Use `refresh` to update it from NFL.com.
     """
-    day = 60 * 60 * 24
     if jsonf is None:
         jsonf = _sched_json_file
     try:
@@ -68,34 +83,219 @@ def _create_schedule(jsonf=None):
     for gsis_id, info in data.get('games', []):
         sched[gsis_id] = info
     last_updated = datetime.datetime.utcfromtimestamp(data.get('time', 0))
+    return sched, last_updated
+
+
+def _update_schedule(sched):
+    """
+    Updates sched in place with the current week and any weeks of the
+    current season that are missing from it, fetched from NFL.com.
+    """
+    import nflgame.live
+    import nflgame.update_sched
+    year, week = nflgame.live.current_year_and_week()
+    phase = nflgame.live._cur_season_phase
+    current_week = (year, phase, week)
+
+    missing_weeks = check_missing_weeks(sched, year, phase)
+    weeks_to_update = order_weeks_to_update(missing_weeks, current_week)
+
+    for week_to_update in weeks_to_update:
+        print(('Updating {}').format(week_to_update))
+        year, phase, week = week_to_update
+        week_was_updated = nflgame.update_sched.update_week(sched, year, phase, week)
+        if not week_was_updated:
+            print(("Week {}{} of {} was either empty, or it couldn't be fetched from NFL.com. Aborting.")\
+                .format(phase , week, year))
+            break
+
+
+def refresh(force=False):
+    """
+    Updates the schedule from NFL.com with the current week and any weeks
+    of the current season that are missing from it. The updated schedule
+    replaces `nflgame.sched.games` in a single step, so code using the
+    schedule sees either the old one or the new one. It is also written
+    back to schedule.json if that file is writable.
+
+    Unless force is True, the schedule is only updated if it's more than a
+    day old. Returns True if it was updated.
+
+    This may take several seconds and raises whatever error NFL.com's
+    responses cause. Importing nflgame never does it; call it explicitly
+    or use `start_refresher`.
+    """
+    with _refresh_lock:
+        current, last_updated = _load()
+        age = datetime.datetime.utcnow() - last_updated
+        if not force and age.total_seconds() < 60 * 60 * 24:
+            return False
+
+        import nflgame.update_sched
+        sched = OrderedDict(current)
+        _update_schedule(sched)
+        if os.access(_sched_json_file, os.W_OK):
+            nflgame.update_sched.write_schedule(_sched_json_file, sched)
+        with _lock:
+            globals().update(games=sched,
+                             last_updated=datetime.datetime.utcnow())
+        _changed()
+        return True
+
+
+def start_refresher(interval=60 * 60):
+    """
+    Starts a daemon thread that calls `refresh` right away and then every
+    interval seconds, so a long running process keeps an up to date
+    schedule without ever waiting on NFL.com. Errors are printed to
+    stderr and the thread keeps going.
+
+    Returns a threading.Event that stops the thread when it is set.
+    """
+    stop = threading.Event()
 
-    if (datetime.datetime.utcnow() - last_updated).total_seconds() >= day:
-        # Only try to update if we can write to the schedule file.
-        if os.access(jsonf, os.W_OK):
+    def loop():
+        while not stop.is_set():
+            try:
+                refresh()
+            except Exception as e:
+                print('Could not refresh the schedule: %s' % e,
+                      file=sys.stderr)
+            stop.wait(interval)
+
+    t = threading.Thread(target=loop, name='nflgame-sched-refresher')
+    t.daemon = True
+    t.start()
+    return stop
+
+
+def _changed():
+    """
+    Records that the schedule has changed, so that searches stop using the
+    index of it as it was. `refresh` and nflgame.update_sched.write_schedule
+    call it, and so must anything else that edits `games` in place.
+    """
+    global _version
+    with _lock:
+        _version += 1
+
+
+def _load():
+    """
+    Returns the schedule and the time it was last updated, reading it from
+    disk the first time.
+    """
+    with _lock:
+        if 'games' not in globals():
+            sched, updated = _create_schedule()
+            globals().update(games=sched, last_updated=updated)
+        return games, last_updated
+
+
+class _Index (object):
+    """
+    _Index is an index of a schedule by (year, season type, week), by
+    (year, season type), by season type alone and by home and away team.
+    Each maps to the positions of matching games in the schedule, so a
+    search is a few dict lookups and set intersections, and its results
+    can be put back in schedule order.
+    """
+    def __init__(self, sched, version):
+        self.sched = sched
+        self.version = version
+        self.size = len(sched)
+        self.infos = list(sched.values())
+        self.by_week = {}
+        self.by_year = {}
+        self.by_kind = {}
+        self.by_home = {}
+        self.by_away = {}
+        for i, info in enumerate(self.infos):
+            kind = info['season_type']
+            key = (info['year'], kind, info['week'])
+            self.by_week.setdefault(key, []).append(i)
+            self.by_year.setdefault(key[:2], []).append(i)
+            self.by_kind.setdefault(kind, []).append(i)
+            self.by_home.setdefault(info['home'], set()).add(i)
+            self.by_away.setdefault(info['away'], set()).add(i)
+        self._times = {}
+
+    def is_current(self, sched, version):
+        """
+        Whether this is an index of sched as it is right now, given the
+        current version of the schedule.
+        """
+        return (sched is self.sched and version == self.version
+                and len(sched) == self.size)
+
+    def search(self, year, week, home, away, kind):
+        """
+        Returns the positions, in schedule order, of the games matching
+        the criteria of nflgame._search_schedule (except for started).
+        """
+        years = year if isinstance(year, list) else [year]
+        weeks = week if isinstance(week, list) else [week]
+        if year is not None and week is not None:
+            found = set()
+            for y in years:
+                for w in weeks:
+                    found.update(self.by_week.get((y, kind, w), ()))
+        elif year is not None:
+            found = set()
+            for y in years:
+                found.update(self.by_year.get((y, kind), ()))
+        else:
+            found = set(self.by_kind.get(kind, ()))
+            if week is not None:
+                found = set(i for i in found if self.infos[i]['week'] in weeks)
+
+        if home is not None and away is not None and home == away:
+            found &= (self.by_home.get(home, set())
+                      | self.by_away.get(home, set()))
+        else:
+            if home is not None:
+                found &= self.by_home.get(home, set())
+            if away is not None:
+                found &= self.by_away.get(away, set())
+        return sorted(found)
+
+    def start_time(self, i):
+        """
+        Returns the start time of the game at position i as a UTC
+        datetime. Each one is computed once.
+        """
+        t = self._times.get(i)
+        if t is None:
             import nflgame.live
-            import nflgame.update_sched
-            year, week = nflgame.live.current_year_and_week()
-            phase = nflgame.live._cur_season_phase
-            current_week = (year, phase, week)
-
-            missing_weeks = check_missing_weeks(sched, year, phase)
-            weeks_to_update = order_weeks_to_update(missing_weeks, current_week)
-
-            for week_to_update in weeks_to_update:
-                print(('Updating {}').format(week_to_update))
-                year, phase, week = week_to_update
-                week_was_updated = nflgame.update_sched.update_week(sched, year, phase, week)
-                if not week_was_updated:
-                    print(("Week {}{} of {} was either empty, or it couldn't be fetched from NFL.com. Aborting.")\
-                        .format(phase , week, year))
-                    break
-
-            nflgame.update_sched.write_schedule(jsonf, sched)
-            last_updated = datetime.datetime.utcnow()
+            t = self._times[i] = nflgame.live._game_datetime(self.infos[i])
+        return t
 
-    return sched, last_updated
 
-games, last_updated = _create_schedule()
+_index = None
+
+
+def _get_index():
+    """
+    Returns an index of the current schedule, building it the first time
+    and again whenever the schedule has been replaced or changed.
+    """
+    global _index
+    version = _version
+    sched = _load()[0]
+    idx = _index
+    if idx is None or not idx.is_current(sched, version):
+        idx = _index = _Index(sched, version)
+    return idx
+
+
+def __getattr__(name):
+    # The schedule is loaded the first time either games or last_updated is
+    # used, instead of every time nflgame is imported.
+    if name in ('games', 'last_updated'):
+        _load()
+        return globals()[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
 
 __pdoc__['nflgame.sched.games'] = """
 An ordered dict of schedule data, where games are ordered by the date
@@ -1,6 +1,7 @@
-import functools
+import heapq
 import itertools
 import operator
+import types
 from collections import OrderedDict
 
 from nflgame import statmap
@@ -11,6 +12,9 @@ _BUILTIN_PREDS = {
     '__ne': operator.ne,
     '__ge': operator.ge,
     '__gt': operator.gt,
+    '__in': lambda v, values: v in values,
+    '__between': lambda v, bounds: bounds[0] <= v <= bounds[1],
+    '__contains': operator.contains,
 }
 """
 A dictionary of suffixes to predicates that can be used in Gen.filter.
@@ -23,10 +27,58 @@ Is equivalent to::
 
     players.filter(receiving_rec__gt=0)
 
+Each predicate is called with the value of the field and the value given
+to filter. So `team__in=['NE', 'NYJ']` matches items whose team is either
+NE or NYJ, `rushing_yds__between=(10, 20)` matches items with 10 to 20
+rushing yards (inclusive) and `desc__contains='TOUCHDOWN'` matches items
+whose description contains TOUCHDOWN.
+
 (Django users should feel right at home.)
 """
 
 
+def _compile_filter(kwargs):
+    """
+    Compiles the criteria given to Gen.filter into a single predicate on
+    items. The criteria are parsed once here, rather than for every item.
+    """
+    preds = [_compile_pred(field, value) for field, value in kwargs.items()]
+    if len(preds) == 1:
+        return preds[0]
+
+    def pred(item):
+        for p in preds:
+            if not p(item):
+                return False
+        return True
+    return pred
+
+
+def _compile_pred(field, value):
+    """
+    Compiles a single criterion of Gen.filter into a predicate on items.
+    Items without the field, or with a value of None for it, never match.
+    """
+    for suffix, op in _BUILTIN_PREDS.items():
+        if field.endswith(suffix):
+            field = field[:-len(suffix)]
+
+            def pred(item):
+                v = getattr(item, field, None)
+                return v is not None and op(v, value)
+            return pred
+
+    if isinstance(value, types.FunctionType):
+        def pred(item):
+            v = getattr(item, field, None)
+            return v is not None and value(v)
+    else:
+        def pred(item):
+            v = getattr(item, field, None)
+            return v is not None and v == value
+    return pred
+
+
 class Gen (object):
     """
     Players implements a sequence type and provides a convenient API for
@@ -72,35 +124,24 @@ class Gen (object):
 
             players.filter(receiving_rec__gt=0)
 
-        Other suffixes includes gt, le, lt, ne, ge, etc.
+        Other suffixes includes gt, le, lt, ne, ge, in, between and contains.
+        See _BUILTIN_PREDS for what each of them does.
 
         (Django users should feel right at home.)
         """
-        preds = []
-        for k, v in kwargs.items():
-            def pred(field, value, item):
-                for suffix, p in _BUILTIN_PREDS.items():
-                    if field.endswith(suffix):
-                        f = field[:field.index(suffix)]
-                        if not hasattr(item, f) or getattr(item, f) is None:
-                            return False
-                        return p(getattr(item, f), value)
-                if not hasattr(item, field) or getattr(item, field) is None:
-                    return False
-                if isinstance(value, type(lambda x: x)):
-                    return value(getattr(item, field))
-                return getattr(item, field) == value
-            preds.append(functools.partial(pred, k, v))
-
-        gen = filter(lambda item: all([f(item) for f in preds]),
-                                self)
-        return self.__class__(gen)
+        return self._derive(filter(_compile_filter(kwargs), self))
 
     def limit(self, n):
         """
         Limit the sequence to N items.
+
+        If the sequence was just sorted, only the top N items are kept
+        while sorting (with a heap), which is much faster than sorting
+        everything when N is small.
         """
-        return self.__class__(itertools.islice(self, n))
+        if isinstance(self.__iter, _Sorted):
+            return self._derive(self.__iter.limited(n))
+        return self._derive(itertools.islice(self, n))
 
     def sort(self, field, descending=True):
         """
@@ -108,13 +149,27 @@ class Gen (object):
         a property on an item in the sequence. If descending is false, items
         will be sorted in order from least to greatest.
 
-        Note that if field does not exist in any item being sorted, a
-        KeyError will be raised.
+        field may also be a list of fields, in which case items are sorted
+        by the first field, then by the second field when the first is
+        equal, and so on. Or it may be a function that computes the value
+        to sort an item by, like `lambda p: p.rushing_yds + p.receiving_yds`.
+
+        Items that don't have a field are sorted as if its value were 0.
+        The sort is stable and is done lazily, the first time the sorted
+        sequence is used.
         """
-        def attrget(item):
-            return getattr(item, field, 0)
+        if callable(field):
+            key = field
+        elif isinstance(field, (list, tuple)):
+            fields = tuple(field)
 
-        return self.__class__(sorted(self, reverse=descending, key=attrget))
+            def key(item):
+                return tuple(getattr(item, f, 0) for f in fields)
+        else:
+            def key(item):
+                return getattr(item, field, 0)
+
+        return self._derive(_Sorted(self, key, descending))
 
     def __str__(self):
         """Returns a list of items in the sequence."""
@@ -132,6 +187,57 @@ class Gen (object):
         """Satisfy the built in reversed."""
         return reversed(self.__iter)
 
+    def _derive(self, iterable):
+        """
+        Returns a new sequence of the same kind as this one over iterable.
+        This is what filter, sort, limit, etc. return.
+        """
+        return self.__class__(iterable)
+
+
+class _Sorted (object):
+    """
+    _Sorted is the iterable behind a sorted sequence. Sorting is deferred
+    until it's iterated over, so that a limit following the sort can be
+    folded into it: the top N items are then found with a heap in
+    O(n log N) time and O(N) memory. The result is kept, so it can be
+    iterated over more than once.
+    """
+    def __init__(self, iterable, key, descending, limit=None):
+        self.iterable = iterable
+        self.key = key
+        self.descending = descending
+        self.limit = limit
+        self.__items = None
+
+    def limited(self, n):
+        """Returns this sorted iterable limited to its first n items."""
+        if self.__items is not None:
+            return self.__items[:n]
+        if self.limit is not None:
+            n = min(n, self.limit)
+        return _Sorted(self.iterable, self.key, self.descending, n)
+
+    def _items(self):
+        if self.__items is None:
+            if self.limit is None:
+                self.__items = sorted(self.iterable, key=self.key,
+                                      reverse=self.descending)
+            elif self.descending:
+                self.__items = heapq.nlargest(self.limit, self.iterable,
+                                              key=self.key)
+            else:
+                self.__items = heapq.nsmallest(self.limit, self.iterable,
+                                               key=self.key)
+            self.iterable = None
+        return self.__items
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __reversed__(self):
+        return reversed(self._items())
+
 
 class GenDrives (Gen):
     """
@@ -180,6 +286,22 @@ class GenPlays (Gen):
     GenPlays implements a sequence type and provides a convenient API
     for searching plays.
     """
+    def to_matrix(self):
+        """
+        Returns a nflgame.matrix.StatMatrix of the statistics of every play
+        in the sequence, with one row per play. Requires NumPy.
+        """
+        # NumPy is slow to import, so it's only imported when needed.
+        from nflgame import matrix
+        return matrix.StatMatrix.from_items(self, 'playid')
+
+    def to_numpy(self):
+        """
+        Returns a 2-D NumPy array of the statistics of every play in the
+        sequence. Its columns are the fields of `to_matrix()`.
+        """
+        return self.to_matrix().values
+
     def players(self):
         """
         Returns the combined player stats for every play in the sequence.
@@ -199,6 +321,22 @@ class GenPlayerStats (Gen):
     GenPlayerStats implements a sequence type and provides a convenient API for
     searching sets of player statistics.
     """
+    def to_matrix(self):
+        """
+        Returns a nflgame.matrix.StatMatrix of the statistics of every
+        player in the sequence, with one row per player. Requires NumPy.
+        """
+        # NumPy is slow to import, so it's only imported when needed.
+        from nflgame import matrix
+        return matrix.StatMatrix.from_items(self, 'playerid')
+
+    def to_numpy(self):
+        """
+        Returns a 2-D NumPy array of the statistics of every player in the
+        sequence. Its columns are the fields of `to_matrix()`.
+        """
+        return self.to_matrix().values
+
     def name(self, name):
         """
         Returns a single player whose name equals `name`. If no such player
@@ -221,11 +359,23 @@ class GenPlayerStats (Gen):
         If no such player with the given identifier is found, None is
         returned.
         """
+        if isinstance(self._Gen__iter, OrderedDict):
+            return self._Gen__iter.get(playerid, None)
         for p in self:
             if p.playerid == playerid:
                 return p
         return None
 
+    def indexed(self):
+        """
+        Returns an IndexedPlayerStats sequence of the players in this
+        sequence, which can be searched by player id and name in constant
+        time.
+        """
+        if isinstance(self._Gen__iter, OrderedDict):
+            return IndexedPlayerStats(self._Gen__iter)
+        return IndexedPlayerStats(self)
+
     def touchdowns(self):
         """
         touchdowns is a convenience method for returning a Players
@@ -233,15 +383,14 @@ class GenPlayerStats (Gen):
         """
         def gen():
             for p in self:
-                for f in p.__dict__:
-                    if f.endswith('tds') and p.__dict__[f] > 0:
+                for f, v in p._items():
+                    if f.endswith('tds') and v > 0:
                         yield p
                         break
-        return self.__class__(gen())
+        return self._derive(gen())
 
     def __filter_category(self, cat):
-        return self.__class__(filter(lambda p: p.has_cat(cat),
-                                                self))
+        return self._derive(filter(lambda p: p.has_cat(cat), self))
 
     def passing(self):
         """Returns players that have a "passing" statistical category."""
@@ -321,11 +470,9 @@ class GenPlayerStats (Gen):
             if p.player is not None:
                 d['pos'] = p.player.position
 
+            stats = p.stats
             for field in fields:
-                if field in p.__dict__:
-                    d[field] = p.__dict__[field]
-                else:
-                    d[field] = ""
+                d[field] = stats.get(field, "")
             rows.append(d)
 
         fieldNames = ["name", "id", "home", "team", "pos"] + fields
@@ -344,3 +491,134 @@ class GenPlayerStats (Gen):
             else:
                 players[p.playerid] += p
         return GenPlayerStats(players)
+
+
+class IndexedPlayerStats (GenPlayerStats):
+    """
+    IndexedPlayerStats is a GenPlayerStats sequence that is materialized
+    when it's created and indexed by player id and name. Therefore,
+    `playerid`, `name` and `in` (with either a player or a player id) take
+    constant time, and the sequence can be iterated over any number of
+    times.
+
+    Sequences derived from it with filter, sort, limit, etc. are plain
+    GenPlayerStats sequences, so that they stay lazy. Use `indexed` to
+    index them again.
+    """
+    def __init__(self, iterable):
+        """
+        Creates a new indexed sequence from an iterable of players. If
+        iterable is an OrderedDict of player id to player (like the ones
+        that back the player sequences of games), it is used as is.
+        """
+        if isinstance(iterable, OrderedDict):
+            players = iterable
+        else:
+            players = OrderedDict()
+            for p in iterable or []:
+                if p.playerid not in players:
+                    players[p.playerid] = p
+        super(IndexedPlayerStats, self).__init__(players)
+
+        self.__by_id = players
+        self.__by_name = {}
+        for p in players.values():
+            if p.name not in self.__by_name:
+                self.__by_name[p.name] = p
+
+    def name(self, name):
+        return self.__by_name.get(name, None)
+
+    def playerid(self, playerid):
+        return self.__by_id.get(playerid, None)
+
+    def indexed(self):
+        return self
+
+    def _derive(self, iterable):
+        return GenPlayerStats(iterable)
+
+    def __contains__(self, player):
+        playerid = getattr(player, 'playerid', player)
+        return playerid in self.__by_id
+
+    def __len__(self):
+        return len(self.__by_id)
+
+
+class PlayerStatsAccumulator (object):
+    """
+    PlayerStatsAccumulator combines any number of sequences of player
+    statistics into one, by summing the statistics of repeat players in
+    place. It is what nflgame.combine_game_stats and friends use, and it
+    can be used directly to combine the players of games as they are
+    loaded, without keeping the games around::
+
+        acc = nflgame.seq.PlayerStatsAccumulator()
+        for g in nflgame.games_gen(2013):
+            acc.add(g.players)
+        players = acc.players()
+
+    The result is the same as adding the sequences together with `+`,
+    except that the cost is proportional to the total number of
+    statistics added.
+    """
+    def __init__(self, players=None):
+        """
+        Creates a new accumulator, optionally starting with the players in
+        the players sequence.
+        """
+        self._players = OrderedDict()
+        self._shared = False
+        if players is not None:
+            self.add(players)
+
+    def add(self, players):
+        """
+        Adds every player in the players sequence. The players themselves
+        are never modified.
+        """
+        if self._shared:
+            # The players have been handed out by players(), so they are
+            # copied before they are changed.
+            self._players = OrderedDict(
+                (pid, _copy_player(p)) for pid, p in self._players.items())
+            self._shared = False
+        acc = self._players
+        for p in players:
+            mine = acc.get(p.playerid)
+            if mine is None:
+                acc[p.playerid] = _copy_player(p)
+                continue
+            if mine.home != p.home:
+                mine.home = None
+            games = getattr(p, 'games', None)
+            if games is not None:
+                mine.games += games
+            mine._merge(p)
+        return self
+
+    def players(self):
+        """
+        Returns an IndexedPlayerStats sequence of the players accumulated
+        so far. Adding more players afterwards doesn't change it, or the
+        players in it.
+        """
+        self._shared = True
+        return IndexedPlayerStats(self._players)
+
+    def __len__(self):
+        return len(self._players)
+
+
+def _copy_player(p):
+    """
+    Returns a new player of the same kind as p with a copy of its
+    statistics.
+    """
+    mine = p.__class__(p.playerid, p.name, p.home, p.team)
+    games = getattr(p, 'games', None)
+    if games is not None:
+        mine.games = games
+    mine._merge(p)
+    return mine
@@ -922,3 +922,56 @@ idmap = {
                 'ending in a touchback.',
     },
 }
+
+
+def _all_fields():
+    fields = set()
+    for info in idmap.values():
+        fields.update(info['fields'])
+        if info['yds']:
+            fields.add(info['yds'])
+    return tuple(sorted(fields))
+
+fields = _all_fields()
+"""
+fields is a sorted tuple of every statistical field that can be produced
+from a category in idmap. The position of a field in this tuple is stable
+for a given idmap, which makes it suitable for column or array layouts.
+"""
+
+
+def _compile_decoders():
+    decs = {}
+    for category_id, info in idmap.items():
+        value = info.get('value', 1)
+        decs[category_id] = (info['yds'] or None,
+                             tuple((f, value) for f in info['fields']))
+    return decs
+
+decoders = _compile_decoders()
+"""
+decoders maps each statistical category identifier in idmap to a compiled
+form of it for `decode`: a tuple of its yds field (or None) and a tuple of
+(field, value) for each of its fields.
+"""
+
+
+def decode(decoder, yards, stats):
+    """
+    Adds the statistics of a single stat event to stats, a dict of field
+    to value, without building the dict that `values` returns. decoder is
+    an entry of `decoders`.
+
+    The result is the same as adding `values(category_id, yards)` to
+    stats.
+    """
+    yds, consts = decoder
+    if yds is not None:
+        if type(yards) is not int:
+            try:
+                yards = int(yards)
+            except (ValueError, TypeError):
+                yards = 0
+        stats[yds] = stats.get(yds, 0) + yards
+    for f, v in consts:
+        stats[f] = stats.get(f, 0) + v
@@ -32,7 +32,8 @@
 # We overwrite the initial dictionary of player meta data for each player in
 # the roster data, including adding new entries for new players. We then save
 # the updated mapping from GSIS identifier to player meta data to disk as JSON.
-# (The JSON dump is sorted by key so that diffs are meaningful.)
+# (The JSON dump is sorted by key so that diffs are meaningful.) The binary
+# player table that nflgame.players is read from is then rebuilt from it.
 #
 # This approach requires a few thousand HEAD requests to NFL.com on the first
 # run. But after that, most runs will only require 32 requests for the roster
@@ -64,6 +65,7 @@ except ImportError:
 import nflgame
 import nflgame.live
 import nflgame.player
+import nflgame.playertable
 
 urls = {
     'roster': 'http://www.nfl.com/teams/roster',
@@ -304,10 +306,18 @@ def run():
        help='Force the update to use nflgame players from a specific year.')
     aa('--week', default=None, type=int,
        help='Force the update to use nflgame players from a specific week.')
+    aa('--table-only', action='store_true',
+       help='When set, only the binary player table is rebuilt from the '
+            'JSON player database, without contacting NFL.com.')
     args = parser.parse_args()
 
     if args.json_update_file is None:
         args.json_update_file = nflgame.player._player_json_file
+    if args.table_only:
+        n = nflgame.playertable.write(args.json_update_file)
+        eprint('Wrote %d players to %s'
+               % (n, nflgame.playertable.table_path(args.json_update_file)))
+        return
     teams = [team[0] for team in nflgame.teams if team[0] != 'STL']
     pool = multiprocessing.pool.ThreadPool(args.simultaneous_reqs)
 
@@ -477,6 +487,7 @@ def run():
     with open(args.json_update_file, 'w+') as fp:
         json.dump(metas, fp, indent=4, sort_keys=True,
                   separators=(',', ': '))
+    nflgame.playertable.write(args.json_update_file)
 
     if len(errors) > 0:
         eprint('\n')
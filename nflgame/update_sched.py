@@ -4,6 +4,7 @@ import time
 import json
 import os
 import sys
+import tempfile
 import urllib.request, urllib.error, urllib.parse
 from collections import OrderedDict
 import xml.dom.minidom as xml
@@ -145,9 +146,19 @@ def write_schedule(fpath, sched):
     alist = []
     for gsis_id in sorted(sched):
         alist.append([gsis_id, sched[gsis_id]])
-    json.dump({'time': time.time(), 'games': alist},
-              open(fpath, 'w+'), indent=1, sort_keys=True,
-              separators=(',', ': '))
+    # The schedule is written to a temporary file that then replaces fpath,
+    # so processes reading it never see a partially written schedule.
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(fpath)),
+                               suffix='.tmp')
+    with os.fdopen(fd, 'w') as fp:
+        json.dump({'time': time.time(), 'games': alist},
+                  fp, indent=1, sort_keys=True, separators=(',', ': '))
+    try:
+        os.chmod(tmp, os.stat(fpath).st_mode & 0o777)
+    except OSError:
+        pass
+    os.replace(tmp, fpath)
+    nflgame.sched._changed()
 
 
 def eprint(*args, **kwargs):
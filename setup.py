@@ -51,13 +51,16 @@ setup(
     ],
     platforms='ANY',
     packages=['nflgame', 'nfldatabase'],
-    package_data={'nflgame': ['players.json', 'schedule.json',
-                              'gamecenter-json/*.json.gz'],
+    package_data={'nflgame': ['players.json', 'players.tbl', 'schedule.json',
+                              'gamecenter-json/*.json.gz',
+                              'gamecenter-json.nga'],
                   'nfldatabase': ['nfl.db']},
     data_files=[('share/doc/nflgame', ['README.md', 'CHANGELOG', 'UNLICENSE',
                                        'longdesc.rst']),
                 ('share/doc/nflgame/doc', glob('doc/nflgame/*.html'))],
     scripts=['scripts/nflgame-update-players','scripts/nflgame-update-schedule',
-             'scripts/nfldatabase-update-db'],
-    install_requires=install_requires
+             'scripts/nfldatabase-update-db', 'scripts/nflgame-build-columnar',
+             'scripts/nflgame-archive'],
+    install_requires=install_requires,
+    extras_require={'numpy': ['numpy']}
 )
@@ -0,0 +1,37 @@
+import gzip
+import json
+
+import pytest
+
+import nflgame.game
+
+
+@pytest.fixture(scope='session')
+def store(tmp_path_factory):
+    """A columnar store of the first week of the 2013 regular season."""
+    pytest.importorskip('numpy')
+    import nflgame.columnar
+
+    dirpath = str(tmp_path_factory.mktemp('store'))
+    assert nflgame.columnar.build(dirpath, years=[2013], kinds=['REG'],
+                                  weeks=[1]) == 16
+    return nflgame.columnar.PlayStore(dirpath)
+
+
+@pytest.fixture
+def snapshots():
+    """
+    Returns a function of an eid that returns the JSON data of that game
+    without its last drive and the last play before it, along with the
+    JSON data of the whole game.
+    """
+    def make(eid):
+        full = gzip.open(nflgame.game._jsonf % eid).read()
+        data = json.loads(full)
+        drives = data[eid]['drives']
+        nums = sorted(int(k) for k in drives if k != 'crntdrv')
+        del drives[str(nums[-1])]
+        plays = drives[str(nums[-2])]['plays']
+        del plays[max(plays, key=int)]
+        return json.dumps(data).encode('utf-8'), full
+    return make
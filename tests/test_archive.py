@@ -0,0 +1,51 @@
+import gzip
+import os.path
+import shutil
+
+import nflgame
+import nflgame.archive
+import nflgame.game
+
+EIDS = ['2013090500', '2013090800', '2013090801']
+
+
+def _loose(eid):
+    return nflgame.game._jsonf % eid
+
+
+def test_import_is_incremental(tmp_path):
+    json_dir = tmp_path / 'json'
+    json_dir.mkdir()
+    fpath = str(tmp_path / 'games.nga')
+    for eid in EIDS[:2]:
+        shutil.copy(_loose(eid), str(json_dir))
+
+    assert nflgame.archive.import_loose(fpath, str(json_dir)) == 2
+    assert nflgame.archive.import_loose(fpath, str(json_dir)) == 0
+
+    shutil.copy(_loose(EIDS[2]), str(json_dir))
+    assert nflgame.archive.import_loose(fpath, str(json_dir)) == 1
+
+    archive = nflgame.archive.Archive(fpath)
+    assert archive.eids() == EIDS
+    for eid in EIDS:
+        assert archive.read(eid) == gzip.open(_loose(eid)).read()
+    assert archive.read('2000010100') is None
+    archive.close()
+
+
+def test_game_reads_from_archive(tmp_path, monkeypatch):
+    fpath = str(tmp_path / 'games.nga')
+    nflgame.archive.import_loose(fpath, eids=EIDS[:1])
+
+    archive = nflgame.archive.Archive(fpath)
+    monkeypatch.setattr(nflgame.game, '_archive', archive)
+    monkeypatch.setattr(nflgame.game, '_jsonf',
+                        os.path.join(str(tmp_path), '%s.json.gz'))
+    assert nflgame.game._has_json(EIDS[0])
+    assert not nflgame.game._has_json(EIDS[1])
+
+    g = nflgame.game.Game(EIDS[0])
+    assert (g.home, g.score_home, g.away, g.score_away) == ('DEN', 49,
+                                                            'BAL', 27)
+    assert not os.path.exists(nflgame.game._jsonf % EIDS[0])
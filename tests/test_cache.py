@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+import nflgame
+import nflgame.cache
+import nflgame.game
+
+
+def _players(players):
+    return [(type(p), p.playerid, p.name, p.home, p.team, list(p._items()))
+            for p in players]
+
+
+def _state(game):
+    """Returns everything about a parsed game that should survive the cache."""
+    header = dict((k, v) for k, v in vars(game).items()
+                  if k not in ('data', 'rawData', 'drives', 'players',
+                               '_Game__drives', '_Game__players', 'time',
+                               'stats_home', 'stats_away', '_digest'))
+    header['time'] = vars(game.time)
+    header['stats'] = [t._replace(pos_time=vars(t.pos_time))
+                       for t in (game.stats_home, game.stats_away)]
+    drives = []
+    for d in game.drives:
+        dstate = dict((k, v) for k, v in vars(d).items()
+                      if k not in ('game', 'plays', '_Drive__plays'))
+        for k in ('pos_time', 'field_start', 'field_end', 'time_start',
+                  'time_end'):
+            dstate[k] = dstate[k] and vars(dstate[k])
+        plays = []
+        for p in d.plays:
+            pstate = dict((k, getattr(p, k)) for k in p.__slots__
+                          if k not in ('drive', '_data', '_events',
+                                       '_players', 'time', 'yardline'))
+            pstate['time'] = p.time and vars(p.time)
+            pstate['yardline'] = p.yardline and vars(p.yardline)
+            plays.append((pstate, list(p._items()), _players(p.players)))
+        drives.append((dstate, plays))
+    return header, drives, _players(game.players)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    nflgame.cache.enable(str(tmp_path))
+    yield tmp_path
+    nflgame.cache.disable()
+
+
+def test_warm_game_is_not_parsed(cache, monkeypatch):
+    cold = nflgame.game.Game('2013090500')
+    assert os.listdir(str(cache)) == ['2013090500.game.z']
+
+    def fail(*args, **kwargs):
+        raise AssertionError('game should come from the cache')
+    monkeypatch.setattr(nflgame.game, '_json_drives', fail)
+    monkeypatch.setattr(nflgame.game, '_json_game_player_stats', fail)
+
+    warm = nflgame.game.Game('2013090500')
+    assert warm is not cold
+    assert _state(warm) == _state(cold)
+    assert [str(p) for p in warm.drives.plays()] \
+        == [str(p) for p in cold.drives.plays()]
+    assert warm.data['home']['abbr'] == 'DEN'
+    play = list(warm.drives.plays())[10]
+    assert play.data == list(cold.drives.plays())[10].data
+    assert play.events == list(cold.drives.plays())[10].events
+
+
+def test_stale_entry_is_ignored(cache):
+    game = nflgame.game.Game('2013090500')
+    nflgame.cache.store('2013090500', nflgame.cache.checksum(b'old'), game)
+    assert nflgame.cache.load('2013090500',
+                              nflgame.cache.checksum(b'new')) is None
+
+
+def test_least_recently_used_is_evicted(cache, monkeypatch):
+    nflgame.game.Game('2013090500')
+    os.utime(str(cache / '2013090500.game.z'), (0, 0))
+    size = os.path.getsize(str(cache / '2013090500.game.z'))
+    monkeypatch.setattr(nflgame.cache, 'max_bytes', size + size // 2)
+
+    nflgame.game.Game('2013090800')
+    assert os.listdir(str(cache)) == ['2013090800.game.z']
+
+
+def test_storing_only_scans_once(cache, monkeypatch):
+    scans = []
+    entries = nflgame.cache._entries
+
+    def count():
+        scans.append(1)
+        return entries()
+    monkeypatch.setattr(nflgame.cache, '_entries', count)
+    for eid in ('2013090500', '2013090800', '2013090801'):
+        nflgame.game.Game(eid)
+    assert len(os.listdir(str(cache))) == 3
+    assert len(scans) == 1
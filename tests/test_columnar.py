@@ -0,0 +1,89 @@
+import pytest
+
+import nflgame
+import nflgame.seq
+
+PLAY_FIELDS = ('passing_yds', 'rushing_yds', 'receiving_yds',
+               'defense_sk', 'first_down')
+
+
+def _games():
+    return nflgame.games(2013, week=1)
+
+
+def _key(p):
+    return (p.playid, p.desc)
+
+
+def test_plays_match_combine_plays(store):
+    want = list(nflgame.combine_plays(_games()))
+    got = list(store.plays(2013, week=1))
+    assert len(got) == len(want) == len(store)
+    assert [(p.playid, p.desc) for p in got] == [_key(p) for p in want]
+    for g, w in zip(got, want):
+        assert (g.team, g.down, g.yards_togo) == (w.team, w.down,
+                                                  w.yards_togo)
+        assert str(g) == str(w)
+        assert g.stats == dict(w._stats)
+        for f in PLAY_FIELDS:
+            assert getattr(g, f) == getattr(w, f)
+
+    assert len(store.plays(2013, week=1, home='NE', away='NE')) == \
+        len(list(nflgame.combine_plays(
+            nflgame.games(2013, week=1, home='NE', away='NE'))))
+    assert len(store.plays(2013, week=2)) == 0
+
+
+def test_filter_sort_limit_match_genplays(store):
+    want = nflgame.seq.GenPlays(list(nflgame.combine_plays(_games())))
+    got = store.plays(2013, week=1)
+
+    for kwargs in ({'team': 'NE'}, {'passing_yds__ge': 20},
+                   {'down': 3, 'rushing_yds__gt': 0},
+                   {'passing_yds': lambda v: v > 30}):
+        assert [_key(p) for p in got.filter(**kwargs)] == \
+            [_key(p) for p in want.filter(**kwargs)]
+
+    for field in ('rushing_yds', 'team', 'desc', 'home', 'down'):
+        for desc in (True, False):
+            assert [_key(p) for p in got.sort(field, desc).limit(10)] \
+                == [_key(p) for p in want.sort(field, desc).limit(10)]
+    assert got.sum('passing_yds') == sum(p.passing_yds for p in want)
+
+
+def test_players_match_combine_play_stats(store):
+    want = list(nflgame.combine_play_stats(_games()))
+    got = list(store.players(2013, week=1))
+    assert [p.playerid for p in got] == [p.playerid for p in want]
+    for g, w in zip(got, want):
+        assert (g.name, g.team, g.home) == (w.name, w.team, w.home)
+        assert dict(g.stats) == dict(w.stats)
+
+    rushers = store.plays(2013, week=1).filter(team='NE').players()
+    want = nflgame.combine_play_stats(nflgame.games(2013, week=1,
+                                                    home='NE', away='NE'))
+    assert sorted(p.playerid for p in rushers.rushing()) == \
+        sorted(p.playerid for p in want.rushing() if p.team == 'NE')
+
+
+def test_filter_operators(store):
+    want = nflgame.seq.GenPlays(list(nflgame.combine_plays(_games())))
+    got = store.plays(2013, week=1)
+    for kwargs in ({'passing_yds__lt': 0}, {'passing_yds__le': 5},
+                   {'down__ne': 1}, {'rushing_yds__ge': 10},
+                   {'yards_togo__gt': 10}, {'team__in': ['NE', 'SEA']},
+                   {'down__in': (3, 4)},
+                   {'passing_yds__between': (20, 40)},
+                   {'desc__contains': 'TOUCHDOWN'}):
+        found = [_key(p) for p in got.filter(**kwargs)]
+        assert found == [_key(p) for p in want.filter(**kwargs)]
+        assert len(found) > 0, kwargs
+
+
+def test_unknown_fields_are_key_errors(store):
+    plays = store.plays(2013, week=1)
+    for field in ('name', 'desc_start'):
+        with pytest.raises(KeyError):
+            plays.filter(**{field: 'x'})
+        with pytest.raises(KeyError):
+            plays.sort(field)
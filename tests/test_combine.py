@@ -0,0 +1,51 @@
+from functools import reduce
+
+import nflgame
+import nflgame.player
+import nflgame.seq
+
+
+def _flat(players):
+    return [(p.playerid, p.name, p.home, p.team, getattr(p, 'games', None),
+             list(p._stats.items())) for p in players]
+
+
+def test_combine_matches_adding_sequences():
+    games = nflgame.games(2013, week=[1, 2])
+    for combine, seq in ((nflgame.combine_game_stats, lambda g: g.players),
+                         (nflgame.combine_play_stats,
+                          lambda g: g.drives.players()),
+                         (nflgame.combine_max_stats,
+                          lambda g: g.max_player_stats())):
+        want = reduce(lambda a, b: a + b, [seq(g) for g in games])
+        assert _flat(combine(games)) == _flat(want)
+        assert _flat(combine(iter(games))) == _flat(want)
+
+
+def test_accumulator_leaves_players_alone():
+    g = nflgame.games(2013, week=1)[0]
+    before = _flat(g.max_player_stats())
+    acc = nflgame.seq.PlayerStatsAccumulator(g.max_player_stats())
+    acc.add(g.max_player_stats())
+    assert _flat(g.max_player_stats()) == before
+    assert len(acc) == len(before)
+    p = acc.players().playerid(before[0][0])
+    assert p.games == 2
+    assert p._stats == dict((k, 2 * v) for k, v in before[0][5])
+
+
+def test_accumulated_players_dont_change_after_more_adds():
+    a = nflgame.player.PlayerStats('1', 'A', True, 'NE')
+    a._add_stats({'passing_yds': 10})
+    b = nflgame.player.PlayerStats('2', 'B', False, 'NYJ')
+    acc = nflgame.seq.PlayerStatsAccumulator([a])
+    snap = acc.players()
+    acc.add([a, b])
+    assert snap.playerid('1').passing_yds == 10
+    assert snap.playerid('2') is None and snap.name('B') is None
+    assert len(snap) == 1
+
+    players = acc.players()
+    assert players.playerid('1').passing_yds == 20
+    assert players.name('B') is players.playerid('2')
+    assert a.passing_yds == 10
@@ -0,0 +1,101 @@
+import email.message
+import gzip
+import io
+import json
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+import nflgame.game
+
+EID = '2019122915'
+
+
+def _playing():
+    """Returns a copy of a game on disk as the JSON of a game being played."""
+    data = json.loads(gzip.open(nflgame.game._jsonf % '2013090500').read())
+    game = data.pop('2013090500')
+    game['qtr'] = '3'
+    data[EID] = game
+    return json.dumps(data).encode('utf-8')
+
+
+def _headers(**kwargs):
+    msg = email.message.Message()
+    for k, v in kwargs.items():
+        msg[k.replace('_', '-')] = v
+    return msg
+
+
+class _Response(io.BytesIO):
+    def __init__(self, content, headers):
+        super(_Response, self).__init__(content)
+        self.status, self.headers = 200, headers
+
+
+class _Server(object):
+    """Answers urllib requests like NFL.com, honoring If-None-Match."""
+    def __init__(self, content, etag):
+        self.content, self.etag = content, etag
+        self.requests = []
+
+    def __call__(self, req, timeout=None):
+        self.requests.append(dict(req.header_items()))
+        if self.etag and req.get_header('If-none-match') == self.etag:
+            raise urllib.error.HTTPError(req.full_url, 304, 'Not Modified',
+                                         _headers(ETag=self.etag), None)
+        return _Response(self.content, _headers(ETag=self.etag,
+                                                Last_Modified='then'))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    nflgame.game._feeds.clear()
+    s = _Server(_playing(), '"v1"')
+    monkeypatch.setattr(urllib.request, 'urlopen', s)
+    yield s
+    nflgame.game._feeds.clear()
+
+
+def test_not_modified_gives_back_the_same_game(server):
+    digest, raw, cached = nflgame.game._download(EID)
+    assert raw == server.content and cached is None
+    assert 'If-none-match' not in server.requests[0]
+    game = nflgame.game.Game(EID, fetched=(digest, raw, cached))
+    assert game.playing()
+
+    assert nflgame.game._download(EID) == (None, None, game)
+    assert server.requests[1]['If-none-match'] == '"v1"'
+    assert server.requests[1]['If-modified-since'] == 'then'
+
+
+def test_unchanged_content_gives_back_the_same_game(server):
+    server.etag = None
+    game = nflgame.game.Game(EID, fetched=nflgame.game._download(EID))
+    assert nflgame.game._download(EID) == (None, None, game)
+    assert 'If-none-match' not in server.requests[1]
+
+    server.content = server.content.replace(b'"qtr": "3"', b'"qtr": "4"')
+    _, raw, cached = nflgame.game._download(EID)
+    assert raw == server.content and cached is None
+
+
+def test_errors_give_nothing(server, monkeypatch):
+    def fail(req, timeout=None):
+        raise urllib.error.HTTPError(req.full_url, 404, 'Not Found',
+                                     _headers(), None)
+    monkeypatch.setattr(urllib.request, 'urlopen', fail)
+    assert nflgame.game._download(EID) == (None, None, None)
+
+
+def test_timeouts_while_reading_give_nothing(server, monkeypatch):
+    class Slow(_Response):
+        def read(self, *args):
+            raise socket.timeout('timed out')
+
+    monkeypatch.setattr(urllib.request, 'urlopen',
+                        lambda req, timeout=None: Slow(b'', _headers()))
+    assert nflgame.game._download(EID) == (None, None, None)
+    assert nflgame.game.Game(EID) is None
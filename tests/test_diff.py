@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+import nflgame.game
+
+
+def _baseline_diff(before, after):
+    """The original list-membership diff of nflgame.game.diff."""
+    before_plays = list(before.drives.plays())
+    plays = [p for p in after.drives.plays() if p not in before_plays]
+
+    players = OrderedDict()
+    before_players = list(before.max_player_stats())
+    for aplayer in after.max_player_stats():
+        has_before = False
+        for bplayer in before_players:
+            if aplayer.playerid == bplayer.playerid:
+                has_before = True
+                pdiff = aplayer - bplayer
+                if pdiff is not None:
+                    players[aplayer.playerid] = pdiff
+        if not has_before:
+            players[aplayer.playerid] = aplayer
+    return plays, players
+
+
+def test_diff_finds_new_plays_and_stats(snapshots):
+    old_raw, _ = snapshots('2013090500')
+    before = nflgame.game.Game('2013090500', fetched=(None, old_raw, None))
+    after = nflgame.game.Game('2013090500')
+
+    d = after - before
+    assert [p.playid for p in d.plays] == \
+        ['4938', '4967', '4988', '5005', '5026', '5043', '5067', '5088']
+
+    plays, players = _baseline_diff(before, after)
+    assert d.plays == plays
+    assert [p.playerid for p in d.players] == list(players)
+    for p in d.players:
+        assert dict(p._stats) == dict(players[p.playerid]._stats)
+    assert len(players) > 0
+
+    same = after - after
+    assert same.plays == [] and len(list(same.players)) == 0
@@ -0,0 +1,44 @@
+import nflgame
+import nflgame.seq
+
+
+class _Item(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def _names(seq):
+    return [item.name for item in seq]
+
+
+ITEMS = [_Item(name='a', team='NE', yds=5, desc='Run'),
+         _Item(name='b', team='NYJ', yds=15, desc='Pass, TOUCHDOWN'),
+         _Item(name='c', team='BUF', yds=None, desc='Kneel'),
+         _Item(name='d', team='NE')]
+
+
+def _filter(**kwargs):
+    return _names(nflgame.seq.Gen(ITEMS).filter(**kwargs))
+
+
+def test_filter_operators():
+    assert _filter(team='NE') == ['a', 'd']
+    assert _filter(yds__gt=5) == ['b']
+    assert _filter(yds__le=15, team='NE') == ['a']
+    assert _filter(yds=lambda v: v % 5 == 0) == ['a', 'b']
+    assert _filter(team__in=('NYJ', 'BUF')) == ['b', 'c']
+    assert _filter(yds__between=(5, 10)) == ['a']
+    assert _filter(desc__contains='TOUCHDOWN') == ['b']
+
+
+def test_filter_skips_missing_fields():
+    assert _filter(yds__ne=100) == ['a', 'b']
+    assert _filter(desc__in=('Kneel',)) == ['c']
+    assert _filter(nope=None) == []
+
+
+def test_filter_on_plays():
+    plays = nflgame.combine_plays(nflgame.games(2013, week=1))
+    found = list(plays.filter(team='DEN', passing_tds__ge=1))
+    assert len(found) == 7
+    assert all('TOUCHDOWN' in p.desc for p in found)
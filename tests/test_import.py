@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import nflgame
+import nflgame.sched
+
+IMPORT_BUDGET = 1.0
+"""
+The most time in seconds that `import nflgame` may take. It usually takes
+a small fraction of that, so only real regressions trip it.
+"""
+
+_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+import nflgame
+elapsed = time.perf_counter() - start
+assert 'players' not in vars(nflgame)
+assert 'games' not in vars(nflgame.sched)
+for mod in ('numpy', 'asyncio', 'multiprocessing', 'requests'):
+    assert mod not in sys.modules, mod
+print(elapsed)
+'''
+
+
+def test_import_is_lazy_and_within_budget():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    out = subprocess.check_output([sys.executable, '-W', 'ignore', '-c',
+                                   _SCRIPT], env=env)
+    assert float(out) < IMPORT_BUDGET
+
+
+def test_lazy_attributes_load_once():
+    assert nflgame.players is nflgame.players
+    assert '00-0019596' in nflgame.players
+    assert nflgame.sched.games is nflgame.sched.games
+    assert '2013090500' in nflgame.sched.games
+    assert nflgame.sched.last_updated is not None
+    try:
+        nflgame.not_an_attribute
+        assert False
+    except AttributeError:
+        pass
@@ -0,0 +1,32 @@
+import nflgame
+import nflgame.seq
+
+
+def test_indexed_players_are_found_by_id_and_name():
+    game = nflgame.games(2013, week=1)[0]
+    players = game.max_player_stats().indexed()
+    everyone = list(game.max_player_stats())
+    assert list(players) == everyone and list(players) == everyone
+    assert len(players) == len(everyone)
+
+    for p in everyone:
+        assert players.playerid(p.playerid) is p
+        assert p in players and p.playerid in players
+        assert players.name(p.name) is game.max_player_stats().name(p.name)
+    assert players.playerid('00-0000000') is None
+    assert players.name('X.Nobody') is None
+    assert '00-0000000' not in players
+
+    qbs = players.passing().sort('passing_yds').limit(2)
+    assert not isinstance(qbs, nflgame.seq.IndexedPlayerStats)
+    qbs = qbs.indexed()
+    assert [p.name for p in qbs] == ['P.Manning', 'J.Flacco']
+    assert qbs.name('J.Flacco') is players.name('J.Flacco')
+
+
+def test_generated_players_can_be_indexed():
+    game = nflgame.games(2013, week=1)[0]
+    gen = game.players.filter(home=True)
+    players = gen.indexed()
+    assert all(p.home for p in players)
+    assert len(players) == len([p for p in game.players if p.home])
@@ -0,0 +1,59 @@
+import gzip
+import json
+
+import nflgame
+import nflgame.game
+
+
+def _full(eid):
+    return json.loads(gzip.open(nflgame.game._jsonf % eid).read())[eid]
+
+
+def test_header_is_decoded_without_drives():
+    g = nflgame.game.Game('2013090500')
+    assert (g.home, g.away, g.winner) == ('DEN', 'BAL', 'DEN')
+    assert g.stats_home.total_yds == 510
+    assert dict.get(g.data, 'drives') is None
+
+    full = _full('2013090500')
+    assert g.data['drives'] == full['drives']
+    assert dict(g.data.items()) == full
+    assert len(list(g.drives.plays())) == 216
+
+
+def test_drives_are_decoded_on_first_use():
+    g = nflgame.game.Game('2013090500')
+    assert 'drives' in g.data
+    assert dict.get(g.data, 'drives') is not None
+
+
+def test_pretty_printed_json_is_decoded_lazily():
+    g = nflgame.game.Game('2009082750')
+    assert dict.get(g.data, 'drives') is None
+    assert g.data == _full('2009082750')
+
+
+def test_unexpected_layout_falls_back_to_full_decode():
+    raw = json.dumps({'2013090500': {
+        'scrsummary': {}, 'drives': {'1': {}}, 'qtr': 'Final',
+    }})
+    data = nflgame.game._decode_json(raw)['2013090500']
+    assert dict.get(data, 'drives') == {'1': {}}
+
+
+def test_key_between_drives_and_scrsummary_is_kept():
+    raw = '{"2013090500": {"home":{},"drives":{"1":{}},"weather":"sunny",' \
+          '"scrsummary":{},"qtr":"Final"}}'
+    full = json.loads(raw)['2013090500']
+
+    data = nflgame.game._decode_json(raw)['2013090500']
+    assert 'weather' in data and data['weather'] == 'sunny'
+    assert dict(data) == full
+
+    data = nflgame.game._decode_json(raw)['2013090500']
+    assert data['drives'] == {'1': {}}
+    assert sorted(data.keys()) == sorted(full)
+
+    data = nflgame.game._decode_json(raw)['2013090500']
+    assert data['qtr'] == 'Final' and dict.get(data, 'drives') is None
+    assert data.get('weather') == 'sunny'
@@ -0,0 +1,27 @@
+import gzip
+
+import nflgame
+import nflgame.game
+
+
+def test_lean_game_releases_json_data(tmp_path):
+    g = nflgame.game.Game('2013090500', lean=True)
+    normal = nflgame.game.Game('2013090500')
+    plays = list(g.drives.plays())
+    assert len(plays) == 216
+    assert 'rawData' not in g.__dict__ and 'data' not in g.__dict__
+    assert all(p._data is None for p in plays)
+    assert str(g) == str(normal)
+    assert [str(p) for p in plays] == [str(p) for p in normal.drives.plays()]
+    qb = next(iter(g.players.passing().sort('passing_yds').limit(1)))
+    assert qb.name == 'P.Manning'
+
+    assert plays[3].data == list(normal.drives.plays())[3].data
+    events = plays[3].events
+    assert events == list(normal.drives.plays())[3].events
+    assert plays[3].events is events
+    assert 'rawData' not in g.__dict__ and 'data' not in g.__dict__
+    fpath = str(tmp_path / 'game.json.gz')
+    g.save(fpath)
+    with gzip.open(fpath) as fp:
+        assert fp.read() == normal.rawData
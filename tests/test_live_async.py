@@ -0,0 +1,85 @@
+import asyncio
+import concurrent.futures
+import gzip
+import json
+import time
+
+import pytest
+
+import nflgame
+import nflgame.game
+import nflgame.live
+
+
+class _Response(object):
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class _Session(object):
+    """Serves a copy of a game on disk as a game that is being played."""
+    def __init__(self, delay=0, etag=None):
+        self.delay = delay
+        self.etag = etag
+        data = json.loads(gzip.open(nflgame.game._jsonf % '2013090500').read())
+        game = data.pop('2013090500')
+        game['qtr'] = '3'
+        data['2019122915'] = game
+        self.content = json.dumps(data).encode('utf-8')
+
+    def get(self, url, headers=None, timeout=None):
+        time.sleep(self.delay)
+        if '2019122915' not in url:
+            return _Response(404, b'')
+        if self.etag and (headers or {}).get('If-None-Match') == self.etag:
+            return _Response(304, b'')
+        return _Response(200, self.content, {'ETag': self.etag})
+
+
+def _fetch(eids, session, timeout=5):
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    try:
+        return asyncio.run(nflgame.live._afetch_games(
+            eids, session, executor, timeout))
+    finally:
+        executor.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def _forget_feeds():
+    nflgame.game._feeds.clear()
+    yield
+    nflgame.game._feeds.clear()
+
+
+def test_games_are_fetched_concurrently():
+    games = _fetch(['2019122915', '2013090500', '2019122914'],
+                   _Session(delay=0.2))
+    assert [g and g.eid for g in games] == ['2019122915', '2013090500', None]
+    assert games[0].playing() and games[1].game_over()
+
+    start = time.time()
+    _fetch(['2019122915'] * 4, _Session(delay=0.2))
+    assert time.time() - start < 0.6
+
+
+def test_slow_games_time_out():
+    assert _fetch(['2019122915'], _Session(delay=0.5), timeout=0.1) == [None]
+
+
+def test_unchanged_feeds_give_back_the_same_game():
+    first, = _fetch(['2019122915'], _Session(etag='"v1"'))
+    second, = _fetch(['2019122915'], _Session(etag='"v1"'))
+    assert second is first
+    d = first - second
+    assert d.plays == [] and len(list(d.players)) == 0
+
+    # Same bytes without any validators.
+    third, = _fetch(['2019122915'], _Session())
+    assert third is first
+
+    nflgame.game._feeds['2019122915'].digest = b'stale'
+    fourth, = _fetch(['2019122915'], _Session())
+    assert fourth is not first and fourth.eid == first.eid
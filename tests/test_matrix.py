@@ -0,0 +1,75 @@
+import pytest
+
+import nflgame
+import nflgame.seq
+
+np = pytest.importorskip('numpy')
+
+
+def _players():
+    return nflgame.combine_game_stats(nflgame.games(2013, week=1))
+
+
+def test_matrix_matches_gen():
+    players = _players()
+    m = players.to_matrix()
+    assert len(m) == len(list(players))
+    assert players.to_numpy().shape == m.values.shape
+
+    want = list(players.filter(rushing_att__ge=10, team='NE'))
+    got = m.filter(rushing_att__ge=10, team='NE')
+    assert list(got) == want
+    assert list(got.column('rushing_att')) == [p.rushing_att for p in want]
+
+    want = list(players.filter(passing_yds__between=(200, 300)))
+    assert list(m.filter(passing_yds__between=(200, 300))) == want
+    want = list(players.filter(team__in=('NE', 'BUF')))
+    assert list(m.filter(team__in=('NE', 'BUF'))) == want
+
+    for desc in (True, False):
+        want = list(players.sort('receiving_yds', desc).limit(10))
+        got = m.sort('receiving_yds', desc).limit(10)
+        assert list(got) == want
+    want = list(players.sort(['team', 'rushing_yds'], False))
+    assert list(m.sort(['team', 'rushing_yds'], False)) == want
+
+
+def test_matrix_sum_and_groupby():
+    players = _players()
+    m = players.to_matrix()
+    assert m.sum('passing_yds') == sum(p.passing_yds for p in players)
+    assert m.sum()['rushing_tds'] == sum(p.rushing_tds for p in players)
+
+    groups = m.groupby('team')
+    teams = []
+    for p in players:
+        if p.team not in teams:
+            teams.append(p.team)
+    assert list(groups) == teams
+    for team, rows in groups.items():
+        assert list(rows) == list(players.filter(team=team))
+
+
+def test_play_matrix():
+    plays = nflgame.seq.GenPlays(
+        list(nflgame.combine_plays(nflgame.games(2013, week=1))))
+    m = plays.to_matrix()
+    assert list(m.filter(passing_yds__gt=40)) == \
+        list(plays.filter(passing_yds__gt=40))
+    assert list(m.column('id')) == [p.playid for p in plays]
+
+
+def test_unknown_columns_and_operators_fail():
+    m = _players().to_matrix()
+    with pytest.raises(KeyError):
+        m.column('name')
+    with pytest.raises(KeyError):
+        m.filter(name='Tom Brady')
+    with pytest.raises(KeyError):
+        m.sort('nope')
+    with pytest.raises(ValueError):
+        m.filter(passing_yds__approx=100)
+    assert m.column('passing_yds').shape == (len(m),)
+
+    got = m.filter(team__contains='N')
+    assert list(got) == [p for p in m if 'N' in p.team]
@@ -0,0 +1,31 @@
+import nflgame
+
+
+def _reference(game):
+    """The straightforward definition of max_player_stats."""
+    game_players = list(game.players)
+    result = []
+    for pplay in game.drives.plays().players():
+        stats = dict(pplay._stats)
+        for pgame in game_players:
+            if pgame.playerid == pplay.playerid:
+                for stat, val in pgame._stats.items():
+                    stats[stat] = max(val, stats.get(stat, val))
+                break
+        result.append((pplay.playerid, pplay.name, pplay.team, stats))
+    return result
+
+
+def test_max_player_stats_matches_reference():
+    for g in nflgame.games(2013, week=1):
+        got = [(p.playerid, p.name, p.team, p._stats)
+               for p in g.max_player_stats()]
+        assert got == _reference(g)
+        assert [list(p._stats) for p in g.max_player_stats()] == \
+            [list(s) for _, _, _, s in _reference(g)]
+
+
+def test_max_player_stats_are_cached_per_game():
+    g = nflgame.games(2013, week=1)[0]
+    first = list(g.max_player_stats())
+    assert all(a is b for a, b in zip(first, g.max_player_stats()))
@@ -0,0 +1,91 @@
+import shutil
+
+import nflgame
+import nflgame.names
+import nflgame.player
+import nflgame.playertable
+
+
+def old_find(name, team=None):
+    hits = []
+    for player in nflgame.players.values():
+        if player.name.lower() == name.lower():
+            if team is None or team.lower() == player.team.lower():
+                hits.append(player)
+    return hits
+
+
+def old_standard_team(team):
+    team = team.lower().replace('.', '')
+    for variants in nflgame.teams:
+        for variant in variants:
+            if team == variant.lower():
+                return variants[0]
+    return None
+
+
+def test_find_matches_linear_scan():
+    for name, team in [('Tom Brady', None), ('tom brady', 'NE'),
+                       ('Tom Brady', 'NYJ'), ('Adrian Peterson', None),
+                       ('Nobody At All', None)]:
+        assert nflgame.find(name, team) == old_find(name, team)
+    assert nflgame.names.index() is nflgame.names.index()
+
+
+def test_find_abbreviation():
+    hits = nflgame.find('T.Brady')
+    assert '00-0019596' in [p.playerid for p in hits]
+    assert all(p.team == 'NE' for p in nflgame.find('t.brady', team='ne'))
+
+
+def test_find_prefix():
+    hits = nflgame.find('tom br', prefix=True)
+    assert '00-0019596' in [p.playerid for p in hits]
+    assert all(p.name.lower().startswith('tom br') for p in hits)
+    assert nflgame.find('zzzzzz', prefix=True) == []
+
+
+def test_find_fuzzy():
+    assert nflgame.find('Tom Bradey') == []
+    hits = nflgame.find('Tom Bradey', max_edits=1)
+    assert hits[0].playerid == '00-0019596'
+    assert nflgame.find('Tom Brady', max_edits=1)[0].playerid == '00-0019596'
+    for p in nflgame.find('Tom Bardy', max_edits=2):
+        assert nflgame.names._edits('tom bardy', p.name.lower(), 2) <= 2
+
+
+def test_fuzzy_finds_everything_in_range():
+    names = [nflgame.names.normalize(p.name)
+             for p in nflgame.players.values()]
+    index = nflgame.names.index()
+    for q, k in [('tom bradey', 1), ('aj green', 2), ('joe', 1), ('x', 2)]:
+        expected = set(i for i, n in enumerate(names)
+                       if nflgame.names._edits(q, n, k) <= k)
+        assert set(index._fuzzy(q, k)) == expected
+
+
+def test_edits():
+    for a, b, d in [('', '', 0), ('abc', 'abc', 0), ('abc', 'abd', 1),
+                    ('abc', 'ab', 1), ('kitten', 'sitting', 3),
+                    ('brady', 'bardy', 2), ('a', 'xyz', 3)]:
+        assert nflgame.names._edits(a, b, 3) == d
+        assert nflgame.names._edits(b, a, 1) == min(d, 2)
+
+
+def test_index_of_player_table(tmp_path):
+    jsonf = str(tmp_path / 'players.json')
+    shutil.copy(nflgame.player._player_json_file, jsonf)
+    nflgame.playertable.write(jsonf)
+    table = nflgame.playertable.load(jsonf)
+    index = nflgame.names.NameIndex(table)
+    assert index.search('Tom Brady') == ['00-0019596']
+    assert index.search('t.brady', 'NE') == ['00-0019596']
+
+
+def test_standard_team():
+    for variants in nflgame.teams:
+        for variant in variants:
+            for v in (variant, variant.upper(), variant.lower()):
+                assert nflgame.standard_team(v) == old_standard_team(v)
+    assert nflgame.standard_team('Rams') == 'LA'
+    assert nflgame.standard_team('nope') is None
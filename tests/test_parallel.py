@@ -0,0 +1,30 @@
+import nflgame
+
+
+def test_parallel_games_match_sequential_games():
+    seq = nflgame.games(2013, week=1)
+    par = nflgame.games(2013, week=1, workers=2)
+    assert [g.eid for g in par] == [g.eid for g in seq]
+    assert not par[0].lean
+    assert [str(p) for g in par for p in g.drives.plays()] == \
+        [str(p) for g in seq for p in g.drives.plays()]
+    play = list(par[0].drives.plays())[5]
+    assert play.data == list(seq[0].drives.plays())[5].data
+
+    def stats(games):
+        return [(p.playerid, p.stats) for p in nflgame.combine_max_stats(games)]
+    assert stats(par) == stats(seq)
+
+
+def test_prefetched_games_match_sequential_games():
+    seq = nflgame.games(2013, week=[1, 2])
+    pre = nflgame.games(2013, week=[1, 2], prefetch=3)
+    assert [g.eid for g in pre] == [g.eid for g in seq]
+    assert [str(p) for g in pre for p in g.drives.plays()] == \
+        [str(p) for g in seq for p in g.drives.plays()]
+
+
+def test_prefetching_stops_when_abandoned():
+    gen = nflgame.games_gen(2013, prefetch=2)
+    assert next(gen).eid == '2013090500'
+    gen.close()
@@ -0,0 +1,32 @@
+import pickle
+
+import nflgame
+import nflgame.game
+import nflgame.statmap
+
+
+def test_play_stats_and_players():
+    g = nflgame.game.Game('2013090500')
+    plays = list(g.drives.plays())
+    # The instance dict of a play holds its statistics and nothing else.
+    for p in plays:
+        assert vars(p) is p._stats
+        assert set(vars(p)) <= set(nflgame.statmap.fields)
+
+    p = next(p for p in plays if p.passing_yds > 0)
+    assert p.passing_att == 1 and p.rushing_yds == 0 and p.anything == 0
+    assert p._stats['passing_yds'] == p.passing_yds
+    passer = next(q for q in p.players if q.passing_yds > 0)
+    assert p.has_player(passer.playerid)
+    assert passer.passing_yds == p.passing_yds
+
+    assert sum(e.get('passing_yds', 0) for e in p.events) == p.passing_yds
+    assert p.data is g.data['drives'][p.drive._key]['plays'][p.playid]
+
+
+def test_play_pickles_by_field_name():
+    g = nflgame.game.Game('2013090500')
+    plays = list(g.drives.plays())
+    for p, q in zip(plays, pickle.loads(pickle.dumps(plays))):
+        assert q == p and q._stats == p._stats
+        assert [x.stats for x in q.players] == [x.stats for x in p.players]
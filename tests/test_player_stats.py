@@ -0,0 +1,65 @@
+import pickle
+
+import nflgame
+import nflgame.player
+
+
+def _player(cls=nflgame.player.GamePlayerStats, **stats):
+    p = cls('00-0019596', 'T.Brady', True, 'NE')
+    p._add_stats(stats)
+    return p
+
+
+def test_compact_stats_behave_like_attributes():
+    p = _player(passing_yds=100, passing_tds=1, rushing_tds=1)
+    assert vars(p) is p.stats
+    assert p.passing_yds == 100
+    assert p.receiving_yds == 0
+    assert p.tds == 2
+    assert list(p.stats.items()) == [('passing_yds', 100), ('passing_tds', 1),
+                                     ('rushing_tds', 1)]
+    assert p.stats is p.stats
+    assert p.has_cat('rushing') and not p.has_cat('kicking')
+    try:
+        p.not_a_stat
+        assert False
+    except AttributeError:
+        pass
+
+    p._add_stats({'passing_yds': 50, 'kicking_tot': 2})
+    assert p.passing_yds == 150 and p.kicking_tot == 2
+
+
+def test_add_and_sub():
+    a = _player(passing_yds=100, passing_tds=1)
+    b = _player(passing_yds=20, rushing_yds=5)
+    s = a + b
+    assert s.stats == {'passing_yds': 120, 'passing_tds': 1, 'rushing_yds': 5}
+    assert s.games == 2
+    assert a.stats == {'passing_yds': 100, 'passing_tds': 1}
+
+    d = s - a
+    assert d.stats == {'passing_yds': 20, 'rushing_yds': 5}
+    assert (a - a) is None
+
+    # Only stats that other has are subtracted, so a zero stat that only
+    # the first player has is kept.
+    z = _player(passing_yds=120, defense_sk=0)
+    assert (z - a).stats == {'passing_yds': 20, 'defense_sk': 0}
+    assert (a - z).stats == {'passing_yds': -20, 'passing_tds': 1}
+
+
+def test_player_meta_is_lazy_and_not_pickled():
+    p = _player(nflgame.player.PlayPlayerStats, rushing_att=1)
+    assert p._player is nflgame.player._UNRESOLVED
+    assert p.player is nflgame.players.get(p.playerid)
+
+    q = pickle.loads(pickle.dumps(p))
+    assert type(q) is nflgame.player.PlayPlayerStats
+    assert q._player is nflgame.player._UNRESOLVED
+    assert (q.playerid, q.name, q.home, q.team) == \
+        (p.playerid, p.name, p.home, p.team)
+    assert q.stats == p.stats
+
+    g = pickle.loads(pickle.dumps(_player(passing_att=3)))
+    assert g.games == 1 and g.passing_att == 3
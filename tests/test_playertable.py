@@ -0,0 +1,39 @@
+import json
+import shutil
+
+import nflgame.player
+import nflgame.playertable
+
+
+def test_table_matches_json(tmp_path):
+    jsonf = str(tmp_path / 'players.json')
+    shutil.copy(nflgame.player._player_json_file, jsonf)
+    assert nflgame.playertable.load(jsonf) is None
+
+    n = nflgame.playertable.write(jsonf)
+    table = nflgame.player._create_players(jsonf)
+    assert isinstance(table, nflgame.playertable.PlayerTable)
+    with open(jsonf) as fp:
+        data = json.load(fp)
+    assert n == len(table) == len(data)
+    assert list(table) == sorted(data)
+    for playerid, info in data.items():
+        assert vars(table[playerid]) == vars(nflgame.player.Player(info))
+    assert table['00-0019596'] is table['00-0019596']
+    assert '00-0019596' in table and 'nope' not in table
+    assert table.get('00-0000000') is None
+
+
+def test_stale_table_is_ignored(tmp_path):
+    jsonf = str(tmp_path / 'players.json')
+    with open(jsonf, 'w') as fp:
+        json.dump({'00-0000001': {'gsis_id': '00-0000001',
+                                  'full_name': 'A B', 'height': 70}}, fp)
+    nflgame.playertable.write(jsonf)
+    p = nflgame.playertable.load(jsonf)['00-0000001']
+    assert (p.full_name, p.height, p.weight, p.number) == ('A B', 70, '', 0)
+
+    with open(jsonf, 'w') as fp:
+        json.dump({}, fp)
+    assert nflgame.playertable.load(jsonf) is None
+    assert nflgame.player._create_players(jsonf) == {}
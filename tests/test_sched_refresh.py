@@ -0,0 +1,118 @@
+import datetime
+import json
+import time
+from collections import OrderedDict
+
+import pytest
+
+import nflgame.live
+import nflgame.sched
+import nflgame.update_sched
+
+
+@pytest.fixture
+def sched(tmp_path, monkeypatch):
+    """
+    Points nflgame.sched at a small, stale schedule file and replaces
+    fetching a week from NFL.com with adding a fake game.
+    """
+    fpath = str(tmp_path / 'sched.json')
+    with open(fpath, 'w') as fp:
+        json.dump({'time': 0, 'games': [['2013090500', {
+            'year': 2013, 'season_type': 'REG', 'week': 1}]]}, fp)
+    monkeypatch.setattr(nflgame.sched, '_sched_json_file', fpath)
+    games, updated = nflgame.sched._create_schedule(fpath)
+    monkeypatch.setattr(nflgame.sched, 'games', games)
+    monkeypatch.setattr(nflgame.sched, 'last_updated', updated)
+
+    calls = []
+
+    def update_week(s, year, phase, week):
+        calls.append((year, phase, week))
+        s['2019122915'] = {'year': year, 'season_type': phase, 'week': week}
+        return True
+    monkeypatch.setattr(nflgame.update_sched, 'update_week', update_week)
+    monkeypatch.setattr(nflgame.live, 'current_year_and_week',
+                        lambda: (2019, 17))
+    monkeypatch.setattr(nflgame.live, '_cur_season_phase', 'REG')
+    return fpath, calls
+
+
+def test_loading_never_updates(sched):
+    fpath, calls = sched
+    games, updated = nflgame.sched._create_schedule(fpath)
+    assert list(games) == ['2013090500']
+    assert updated == datetime.datetime.utcfromtimestamp(0)
+    assert calls == []
+
+
+def test_refresh_swaps_schedule(sched):
+    fpath, calls = sched
+    before = nflgame.sched.games
+    assert nflgame.sched.refresh()
+    assert calls[0] == (2019, 'REG', 17)
+    assert list(before) == ['2013090500']
+    assert '2019122915' in nflgame.sched.games
+    assert nflgame.sched.games is not before
+    assert '2019122915' in nflgame.sched._create_schedule(fpath)[0]
+
+    # It's fresh now, so nothing happens unless forced.
+    del calls[:]
+    assert not nflgame.sched.refresh()
+    assert calls == []
+    assert nflgame.sched.refresh(force=True)
+    assert calls
+
+
+def test_refresher_thread(sched):
+    stop = nflgame.sched.start_refresher(interval=60)
+    try:
+        deadline = time.time() + 10
+        while '2019122915' not in nflgame.sched.games:
+            assert time.time() < deadline
+            time.sleep(0.01)
+    finally:
+        stop.set()
+    assert isinstance(nflgame.sched.games, OrderedDict)
+
+
+class _Stop(Exception):
+    pass
+
+
+def test_live_run_refreshes_the_schedule(sched, monkeypatch):
+    fpath, calls = sched
+    refreshes = []
+    refresh = nflgame.sched.refresh
+
+    def counting_refresh(force=False):
+        refreshes.append(force)
+        return refresh(force)
+
+    def sleep(seconds):
+        raise _Stop()
+    monkeypatch.setattr(nflgame.sched, 'refresh', counting_refresh)
+    monkeypatch.setattr(nflgame.live, '_active_games', lambda interval: [])
+    monkeypatch.setattr(nflgame.live, '_WEEK_INTERVAL', -1)
+    monkeypatch.setattr(nflgame.live.time, 'sleep', sleep)
+
+    with pytest.raises(_Stop):
+        nflgame.live.run(lambda *args: None)
+    # Once when starting and once at the first week check.
+    assert len(refreshes) == 2
+    assert '2019122915' in nflgame.sched.games
+
+
+def test_live_run_survives_refresh_errors(sched, monkeypatch, capsys):
+    def fail(force=False):
+        raise IOError('NFL.com is down')
+
+    def sleep(seconds):
+        raise _Stop()
+    monkeypatch.setattr(nflgame.sched, 'refresh', fail)
+    monkeypatch.setattr(nflgame.live, '_active_games', lambda interval: [])
+    monkeypatch.setattr(nflgame.live.time, 'sleep', sleep)
+
+    with pytest.raises(_Stop):
+        nflgame.live.run(lambda *args: None)
+    assert 'NFL.com is down' in capsys.readouterr().err
@@ -0,0 +1,90 @@
+import datetime
+
+import nflgame
+import nflgame.live
+import nflgame.sched
+import nflgame.update_sched
+
+
+def _linear(year, week=None, home=None, away=None, kind='REG',
+            started=False):
+    """The straightforward definition of nflgame._search_schedule."""
+    infos = []
+    for info in nflgame.sched.games.values():
+        y, t, w = info['year'], info['season_type'], info['week']
+        h, a = info['home'], info['away']
+        if year is not None:
+            if isinstance(year, list) and y not in year:
+                continue
+            if not isinstance(year, list) and y != year:
+                continue
+        if week is not None:
+            if isinstance(week, list) and w not in week:
+                continue
+            if not isinstance(week, list) and w != week:
+                continue
+        if home is not None and away is not None and home == away:
+            if h != home and a != home:
+                continue
+        else:
+            if home is not None and h != home:
+                continue
+            if away is not None and a != away:
+                continue
+        if t != kind:
+            continue
+        if started:
+            gametime = nflgame.live._game_datetime(info)
+            now = nflgame.live._now()
+            if gametime > now and (gametime - now).total_seconds() > 300:
+                continue
+        infos.append(info)
+    return infos
+
+
+def test_index_matches_linear_search():
+    queries = [
+        (2013, 1), (2013, [1, 2, 17]), ([2012, 2013], None),
+        (None, 3), (None, None), (2013, None, 'NE'), (2013, None, None, 'NE'),
+        (2013, None, 'NE', 'NE'), (2013, [1, 2], 'NE', 'BUF'),
+        (2013, 1, 'NOPE'), (1999, 1), (2013, 4, None, None, 'POST'),
+        (2013, 2, None, None, 'PRE'), (2013, 1, None, None, None),
+    ]
+    for q in queries:
+        assert nflgame._search_schedule(*q) == _linear(*q), q
+
+
+def test_index_started_and_rebuild(monkeypatch):
+    now = datetime.datetime(2013, 9, 8, 17, 3, tzinfo=datetime.timezone.utc)
+    monkeypatch.setattr(nflgame.live, '_now', lambda: now)
+    got = nflgame._search_schedule(2013, 1, started=True)
+    assert got == _linear(2013, 1, started=True)
+    assert 0 < len(got) < len(_linear(2013, 1))
+
+    idx = nflgame.sched._get_index()
+    assert nflgame.sched._get_index() is idx
+    sched = type(nflgame.sched.games)(nflgame.sched.games)
+    sched.popitem()
+    monkeypatch.setattr(nflgame.sched, 'games', sched)
+    assert nflgame.sched._get_index() is not idx
+    assert nflgame._search_schedule(None, None) == _linear(None, None)
+
+
+def test_index_is_rebuilt_after_changes_in_place(monkeypatch, tmp_path):
+    sched = type(nflgame.sched.games)(
+        (eid, dict(info)) for eid, info in nflgame.sched.games.items())
+    monkeypatch.setattr(nflgame.sched, 'games', sched)
+    idx = nflgame.sched._get_index()
+    week1 = _linear(2013, 1)
+    eid = week1[0]['eid']
+
+    # Same schedule object and size, but a game moved to another week.
+    sched[eid]['week'] = 2
+    assert nflgame.sched._get_index() is idx
+    nflgame.sched._changed()
+    idx = nflgame.sched._get_index()
+    assert nflgame._search_schedule(2013, 1) == _linear(2013, 1) == week1[1:]
+    assert eid in [info['eid'] for info in nflgame._search_schedule(2013, 2)]
+
+    nflgame.update_sched.write_schedule(str(tmp_path / 'sched.json'), sched)
+    assert nflgame.sched._get_index() is not idx
@@ -0,0 +1,45 @@
+import nflgame
+import nflgame.seq
+
+
+def _plays():
+    return list(nflgame.combine_plays(nflgame.games(2013, week=1)))
+
+
+def test_sort_then_limit_is_top_k():
+    plays = _plays()
+    for desc in (True, False):
+        for field in ('passing_yds', 'rushing_yds', ('down', 'yards_togo')):
+            full = list(nflgame.seq.GenPlays(plays).sort(field, desc))
+            for k in (0, 1, 5, len(plays) + 1):
+                top = nflgame.seq.GenPlays(plays).sort(field, desc).limit(k)
+                assert list(top) == full[:k]
+                assert list(top) == full[:k]  # More than once.
+                assert list(top.limit(3)) == full[:min(k, 3)]
+
+
+def test_sort_by_many_fields_and_computed_keys():
+    plays = nflgame.seq.GenPlays(_plays())
+    by_fields = plays.sort(['down', 'yards_togo'], descending=False)
+    keys = [(p.down, p.yards_togo) for p in by_fields]
+    assert keys == sorted(keys)
+
+    def yds(p):
+        return p.passing_yds + p.rushing_yds
+    total = plays.sort(yds).limit(3)
+    assert [yds(p) for p in total] == sorted(map(yds, plays), reverse=True)[:3]
+    assert list(reversed(plays.sort('passing_yds').limit(2)))[-1] \
+        .passing_yds == 78
+
+
+def test_sort_is_lazy_over_generators():
+    seen = []
+
+    def gen():
+        for p in _plays():
+            seen.append(p)
+            yield p
+    top = nflgame.seq.GenPlays(gen()).sort('passing_yds').limit(1)
+    assert seen == []
+    assert next(iter(top)).passing_yds == 78
+    assert len(seen) > 100
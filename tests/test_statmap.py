@@ -0,0 +1,16 @@
+import nflgame.player
+import nflgame.statmap
+
+
+def test_decoders_match_values():
+    for sid in nflgame.statmap.idmap:
+        for yards in (12, '-3', None, 'x'):
+            want = nflgame.player._StatVector()
+            want._add_stats(nflgame.statmap.values(sid, yards))
+            want._add_stats(nflgame.statmap.values(sid, 7))
+
+            got = nflgame.player._StatVector()
+            for y in (yards, 7):
+                nflgame.statmap.decode(nflgame.statmap.decoders[sid], y,
+                                       got._stats)
+            assert got._stats == want._stats
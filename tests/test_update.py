@@ -0,0 +1,27 @@
+import nflgame
+import nflgame.game
+
+
+def test_update_reuses_unchanged_drives_and_plays(snapshots):
+    old_raw, new_raw = snapshots('2013090500')
+    g = nflgame.game.Game('2013090500', fetched=(None, old_raw, None))
+    old_drives = list(g.drives)
+    old_plays = list(g.drives.plays())
+    before = list(g.max_player_stats())
+
+    g.update(new_raw)
+    fresh = nflgame.game.Game('2013090500')
+    drives = list(g.drives)
+    assert len(drives) == len(old_drives) + 1
+    assert all(a is b for a, b in zip(drives[:-2], old_drives[:-1]))
+    assert drives[-2] is not old_drives[-1]
+
+    plays = list(g.drives.plays())
+    assert all(a is b for a, b in zip(plays, old_plays))
+    assert all(p.drive is d for d in drives for p in d.plays)
+    assert [str(p) for p in plays] == \
+        [str(p) for p in fresh.drives.plays()]
+
+    after = [(p.playerid, p.stats) for p in g.max_player_stats()]
+    assert after == [(p.playerid, p.stats) for p in fresh.max_player_stats()]
+    assert after != [(p.playerid, p.stats) for p in before]